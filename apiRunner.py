@@ -0,0 +1,136 @@
+import argparse
+import atexit
+import importlib
+import os
+import sys
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# 被测接口地址，测试用例从这里读取，可以用环境变量指向别的服务
+EVENT_API_ENV = 'EVENT_API_URL'
+EVENT_API_URL = 'http://127.0.0.1:8000/api/get_event_list/'
+
+# 设置了磁带路径时，Session 通过 httpCassette 录制/回放，不需要后端服务
+CASSETTE_ENV = 'API_CASSETTE'
+CASSETTE_MODE_ENV = 'API_CASSETTE_MODE'
+
+_session = None
+_session_lock = threading.Lock()
+cassette = None
+
+
+def event_api_url():
+    return os.environ.get(EVENT_API_ENV, EVENT_API_URL)
+
+
+def get_session(pool_size=32):
+    '''所有用例共用的 Session，连接池复用 TCP 连接，不再每个请求新建一次连接'''
+    global _session, cassette
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            if os.environ.get(CASSETTE_ENV):
+                from httpCassette import use_cassette
+                cassette = use_cassette(session, os.environ[CASSETTE_ENV], os.environ.get(CASSETTE_MODE_ENV, 'auto'),
+                                        pool_connections=4, pool_maxsize=pool_size)
+                atexit.register(cassette.save)
+            else:
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+            _session = session
+    return _session
+
+
+def iter_tests(suite):
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from iter_tests(test)
+        else:
+            yield test
+
+
+def load_tests(module_names, pattern=None):
+    '''从模块里收集 unittest 用例，展开成单个测试方法的列表'''
+    loader = unittest.defaultTestLoader
+    tests = []
+    for name in module_names:
+        for test in iter_tests(loader.loadTestsFromModule(importlib.import_module(name))):
+            if pattern is None or pattern in test.id():
+                tests.append(test)
+    return tests
+
+
+def run_one(test):
+    '''单独运行一个测试方法，返回 (用例 id, 结果, 耗时毫秒, 错误信息)'''
+    result = unittest.TestResult()
+    t0 = time.perf_counter()
+    test.run(result)
+    elapsed = (time.perf_counter() - t0) * 1000
+    if result.errors:
+        return test.id(), 'ERROR', elapsed, result.errors[0][1]
+    if result.failures:
+        return test.id(), 'FAIL', elapsed, result.failures[0][1]
+    if result.skipped:
+        return test.id(), 'SKIP', elapsed, result.skipped[0][1]
+    return test.id(), 'ok', elapsed, ''
+
+
+def run_concurrent(tests, workers=8):
+    '''在线程池里并发运行用例，结果按用例原来的顺序返回'''
+    get_session(max(workers, 1))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run_one, tests))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='并发运行接口回归用例')
+    parser.add_argument('modules', nargs='*', default=['test'], help='包含用例的模块')
+    parser.add_argument('-k', '--filter', help='只运行 id 包含这个字符串的用例')
+    parser.add_argument('-j', '--workers', type=int, default=8)
+    parser.add_argument('--stub', action='store_true', help='启动本地 get_event_list 桩服务并对它测试')
+    parser.add_argument('-v', '--verbose', action='store_true', help='打印失败用例的完整信息')
+    parser.add_argument('--cassette', help='录制/回放的磁带文件（.json.gz）')
+    parser.add_argument('--cassette-mode', choices=('auto', 'record', 'replay'), default='auto')
+    args = parser.parse_args(argv)
+
+    if args.cassette:
+        os.environ[CASSETTE_ENV] = args.cassette
+        os.environ[CASSETTE_MODE_ENV] = args.cassette_mode
+
+    server = None
+    if args.stub:
+        from eventStub import start_stub
+        server, url = start_stub()
+        os.environ[EVENT_API_ENV] = url
+    try:
+        tests = load_tests(args.modules, args.filter)
+        t0 = time.perf_counter()
+        results = run_concurrent(tests, args.workers)
+        wall = (time.perf_counter() - t0) * 1000
+    finally:
+        if cassette is not None:
+            cassette.save()
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+    failed = 0
+    for test_id, status, elapsed, message in results:
+        print('{:<6} {:>9.2f}ms  {}'.format(status, elapsed, test_id))
+        if status in ('FAIL', 'ERROR'):
+            failed += 1
+            if args.verbose:
+                print(message)
+    print('{} tests, {} failed, wall {:.1f}ms, sum of test time {:.1f}ms'.format(
+        len(results), failed, wall, sum(r[2] for r in results)))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,111 @@
+import argparse
+import importlib
+import json
+import platform
+import statistics
+import time
+
+# 已注册的基准：名字 -> (函数, 分组, 默认规模列表)
+BENCHMARKS = {}
+
+
+def benchmark(name=None, group=None, sizes=(None,)):
+    '''注册一个基准函数
+
+    被注册的函数接收规模 size，做完准备工作后返回一个无参的可调用对象，只有它会被计时，
+    所以造数据、分配数组这些开销不会算进结果。
+    '''
+    def register(func):
+        BENCHMARKS[name or func.__name__] = (func, group or func.__module__, tuple(sizes))
+        return func
+    return register
+
+
+def quartiles(samples):
+    ordered = sorted(samples)
+    if len(ordered) < 2:
+        return ordered[0], ordered[0], ordered[0]
+    q1, median, q3 = statistics.quantiles(ordered, n=4, method='inclusive')
+    return q1, median, q3
+
+
+def measure(call, warmup=1, repeat=7, min_time=0.02):
+    '''先热身，再自动选择每个样本的调用次数，使单个样本不短于 min_time，返回每次调用的耗时（秒）列表'''
+    for i in range(warmup):
+        call()
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for i in range(number):
+            call()
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    samples = [elapsed / number]
+    for i in range(repeat - 1):
+        t0 = time.perf_counter()
+        for j in range(number):
+            call()
+        samples.append((time.perf_counter() - t0) / number)
+    return samples, number
+
+
+def run_benchmarks(pattern=None, sizes=None, warmup=1, repeat=7, min_time=0.02, report=print):
+    '''运行名字包含 pattern 的基准，sizes 覆盖每个基准自己的默认规模，返回结果列表'''
+    results = []
+    for name, (func, group, default_sizes) in BENCHMARKS.items():
+        if pattern and pattern not in name:
+            continue
+        for size in (sizes if sizes and default_sizes != (None,) else default_sizes):
+            call = func(size) if size is not None else func()
+            samples, number = measure(call, warmup, repeat, min_time)
+            q1, median, q3 = quartiles(samples)
+            result = {'name': name, 'group': group, 'size': size, 'number': number,
+                      'min': min(samples), 'median': median, 'iqr': q3 - q1, 'samples': samples}
+            results.append(result)
+            if report:
+                report('{:<28} {:>10} {:>12.3f}us {:>12.3f}us  iqr {:>9.3f}us'.format(
+                    name, '-' if size is None else size, result['min'] * 1e6, median * 1e6, result['iqr'] * 1e6))
+    return results
+
+
+def environment():
+    env = {'python': platform.python_version(), 'machine': platform.machine(), 'processor': platform.processor(),
+           'system': platform.system()}
+    try:
+        import numpy
+        env['numpy'] = numpy.__version__
+    except ImportError:
+        pass
+    return env
+
+
+def save_results(results, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'environment': environment(), 'time': time.time(), 'results': results}, f, indent=1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='运行已注册的微基准')
+    parser.add_argument('modules', nargs='*', default=['benchReciprocal'], help='注册基准的模块')
+    parser.add_argument('-k', '--filter', help='只运行名字包含这个字符串的基准')
+    parser.add_argument('--sizes', type=lambda s: [int(float(x)) for x in s.split(',')], help='规模列表，如 1e3,1e6')
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--min-time', type=float, default=0.02)
+    parser.add_argument('-o', '--output', help='把结果保存为 JSON')
+    args = parser.parse_args(argv)
+
+    for module in args.modules:
+        importlib.import_module(module)
+    results = run_benchmarks(args.filter, args.sizes, args.warmup, args.repeat, args.min_time)
+    if args.output:
+        save_results(results, args.output)
+    return results
+
+
+if __name__ == '__main__':
+    # 以脚本运行时本文件是 __main__，而基准模块注册到的是 import 进来的 benchHarness，所以要用它的 main
+    import benchHarness
+    benchHarness.main()
@@ -0,0 +1,61 @@
+import os
+
+import numpy as np
+
+from benchHarness import benchmark
+from parallelEval import reciprocal
+
+# qt101_testPyQt.py 里 1.0/values 的几种写法
+SIZES = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+
+
+def make_values(size):
+    rng = np.random.RandomState(0)
+    return rng.randint(1, 100, size=size)
+
+
+@benchmark('reciprocal_python_loop', sizes=SIZES)
+def reciprocal_python_loop(size):
+    values = make_values(size).tolist()
+    return lambda: [1.0 / v for v in values]
+
+
+@benchmark('reciprocal_ufunc', sizes=SIZES)
+def reciprocal_ufunc(size):
+    values = make_values(size)
+    return lambda: 1.0 / values
+
+
+@benchmark('reciprocal_ufunc_out', sizes=SIZES)
+def reciprocal_ufunc_out(size):
+    # 预先分配输出数组，每次调用不再申请 size 个 float64 的内存
+    values = make_values(size)
+    out = np.empty(size, dtype=np.float64)
+    return lambda: np.divide(1.0, values, out=out)
+
+
+@benchmark('reciprocal_ufunc_float_in', sizes=SIZES)
+def reciprocal_ufunc_float_in(size):
+    # 输入先转成 float64，省掉每次 int -> float 的类型转换
+    values = make_values(size).astype(np.float64)
+    out = np.empty(size, dtype=np.float64)
+    return lambda: np.divide(1.0, values, out=out)
+
+
+def _register_threaded(workers):
+    @benchmark('reciprocal_threads_{}'.format(workers), sizes=(10 ** 6, 10 ** 7))
+    def reciprocal_threads(size):
+        # 切块多线程求值，比较不同线程数下的扩展性
+        values = make_values(size).astype(np.float64)
+        out = np.empty(size, dtype=np.float64)
+        return lambda: reciprocal(values, out=out, workers=workers)
+
+
+for _workers in sorted({1, 2, 4, 8, os.cpu_count() or 1}):
+    _register_threaded(_workers)
+
+
+if __name__ == '__main__':
+    import sys
+    from benchHarness import main
+    main(['benchReciprocal'] + sys.argv[1:])
@@ -0,0 +1,154 @@
+import argparse
+import hashlib
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+
+STORE_PATH = 'bench_results.jsonl'
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def git_commit():
+    '''本仓库（不是当前目录）的提交号，工作区有改动时加上 -dirty'''
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=HERE, capture_output=True, text=True,
+                                check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=HERE,
+                               capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+    return commit + ('-dirty' if dirty else '')
+
+
+def machine_fingerprint():
+    '''同一台机器、同样的 CPU 配置得到同样的指纹，只有指纹相同的结果才能互相比较'''
+    info = [platform.node(), platform.system(), platform.machine(), platform.processor(), os.cpu_count()]
+    try:
+        with open('/proc/cpuinfo') as f:
+            info.append(next((line for line in f if line.startswith('model name')), '').strip())
+    except OSError:
+        pass
+    return hashlib.sha1(json.dumps(info).encode('utf-8')).hexdigest()[:12]
+
+
+def run_key():
+    from benchHarness import environment
+    env = environment()
+    return {'commit': git_commit(), 'machine': machine_fingerprint(), 'python': env['python'],
+            'numpy': env.get('numpy')}
+
+
+def append_run(results, path=STORE_PATH, key=None):
+    '''把一次运行的结果追加到结果库（每行一个 JSON）'''
+    record = dict(key or run_key(), time=time.time(), results=results)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record) + '\n')
+    return record
+
+
+def load_runs(path=STORE_PATH):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def find_run(runs, commit=None, machine=None, exclude=None):
+    '''找最近一次匹配的运行，commit 可以是前缀'''
+    for run in reversed(runs):
+        if run is exclude:
+            continue
+        if machine and run['machine'] != machine:
+            continue
+        if commit and not run['commit'].startswith(commit):
+            continue
+        return run
+    return None
+
+
+def _median(values):
+    ordered = sorted(values)
+    n = len(ordered)
+    return ordered[n // 2] if n % 2 else (ordered[n // 2 - 1] + ordered[n // 2]) / 2
+
+
+def bootstrap_ratio(base, head, n=2000, confidence=0.95, seed=0):
+    '''对两组计时样本重抽样，返回 head/base 中位数之比的置信区间 (下限, 点估计, 上限)'''
+    rnd = random.Random(seed)
+    ratios = []
+    for i in range(n):
+        b = _median(rnd.choices(base, k=len(base)))
+        h = _median(rnd.choices(head, k=len(head)))
+        ratios.append(h / b)
+    ratios.sort()
+    tail = (1 - confidence) / 2
+    return ratios[int(n * tail)], _median(head) / _median(base), ratios[min(n - 1, int(n * (1 - tail)))]
+
+
+def compare_runs(base, head, threshold=0.05, confidence=0.95):
+    '''逐个 (基准, 规模) 比较，置信区间下限都超过 1 + threshold 才算显著变慢'''
+    base_results = {(r['name'], r['size']): r for r in base['results']}
+    rows = []
+    for result in head['results']:
+        key = (result['name'], result['size'])
+        if key not in base_results:
+            continue
+        low, ratio, high = bootstrap_ratio(base_results[key]['samples'], result['samples'], confidence=confidence)
+        if low > 1 + threshold:
+            verdict = 'REGRESSION'
+        elif high < 1 - threshold:
+            verdict = 'faster'
+        else:
+            verdict = 'same'
+        rows.append({'name': key[0], 'size': key[1], 'ratio': ratio, 'low': low, 'high': high, 'verdict': verdict})
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='基准结果库：记录运行，比较两次运行并检测性能回退')
+    parser.add_argument('--store', default=STORE_PATH)
+    sub = parser.add_subparsers(dest='command', required=True)
+    record = sub.add_parser('record', help='运行基准并追加到结果库')
+    record.add_argument('modules', nargs='*', default=['benchReciprocal'])
+    record.add_argument('-k', '--filter')
+    record.add_argument('--repeat', type=int, default=15)
+    compare = sub.add_parser('compare', help='比较两次运行，有显著回退时退出码为 1')
+    compare.add_argument('--base', help='基准运行的提交号（前缀），默认是上一次运行')
+    compare.add_argument('--head', help='被比较运行的提交号（前缀），默认是最近一次运行')
+    compare.add_argument('--threshold', type=float, default=0.05, help='允许的变慢比例')
+    compare.add_argument('--confidence', type=float, default=0.95)
+    args = parser.parse_args(argv)
+
+    if args.command == 'record':
+        import importlib
+        import benchHarness
+        for module in args.modules:
+            importlib.import_module(module)
+        results = benchHarness.run_benchmarks(args.filter, repeat=args.repeat)
+        run = append_run(results, args.store)
+        print('recorded {} results for {} on {}'.format(len(results), run['commit'][:12], run['machine']))
+        return 0
+
+    runs = load_runs(args.store)
+    machine = machine_fingerprint()
+    head = find_run(runs, args.head, machine)
+    base = find_run(runs, args.base, machine, exclude=head) if head else None
+    if head is None or base is None:
+        print('need two runs from this machine in ' + args.store)
+        return 2
+    print('base {} ({})  head {} ({})'.format(base['commit'][:12], base['python'], head['commit'][:12], head['python']))
+    regressions = 0
+    for row in compare_runs(base, head, args.threshold, args.confidence):
+        regressions += row['verdict'] == 'REGRESSION'
+        print('{:<28} {:>10} {:>7.3f}x  [{:.3f}, {:.3f}]  {}'.format(
+            row['name'], '-' if row['size'] is None else row['size'], row['ratio'], row['low'], row['high'],
+            row['verdict']))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,300 @@
+import argparse
+import ast
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+QUESTION_FILE = os.path.join(HERE, 'questionTest.py')
+HUAWEI_FILE = os.path.join(HERE, 'HUAWEIquestionFile', 'HUAWEIanswer.py')
+CORPUS_PATH = 'cases.jsonl'
+
+# 文档字符串里结束一个样例的小标题
+SECTION_WORDS = ('说明', '备注', '示例', '输入描述', '输出描述', '补充说明', '提示', '描述', '数据范围')
+# 从网页复制题面时带进来的按钮文字
+NOISE_LINES = ('复制',)
+# 题面字符串的引号
+QUOTES = ("'''", '"""')
+# 不能按原样比较输出的样例（抄错了、缺输入、答案不唯一）：样例 id -> 原因，run 时跳过
+SKIPPED_EXAMPLES = {
+    'hw17#5': '按题意最长的是 d12345 或 12345a，长度 6，样例写的是 5',
+    'hw45#2': '题面图片里的样例是 furthest、输出 front furthest，这里抄成了 Furthest 和 fron',
+    'hw48#1': '连续车位长度是 2、3、1，各停一辆，共 3 辆，样例写的是 2（HUAWEIanswer.py 里的代码也输出 3）',
+    'hw66#1': '题面图片里的输入是 20*19*20*，这里漏了最后的 *',
+    'hw76#1': '有 2 辆车却只给了 1 个速度，题面图片里的样例也是这样，缺的那行没法补',
+    'hw80-s3#2': '任意一个结果为 24 的算式都对，样例只是其中一种，test_solutions.py 里按算式的值检查',
+    'hw82#1': '题面图片里的输出是 40（8 张一日票），这里写成了 2',
+}
+
+
+def label(text, word):
+    '''"输入：xxx" / "输入:xxx" / "输入" 返回冒号后面的内容，不是这个标题时返回 None'''
+    for sep in ('：', ':', ''):
+        if text.startswith(word + sep) and (sep or text == word):
+            return text[len(word + sep):].strip()
+    return None
+
+
+def split_columns(inp, out):
+    '''"输入：2615371  4615371\\n     4 4\\n输出：131 131" 这种一列一个样例的写法拆成多个样例
+
+    只在样例写在 "输入：" 同一行、输入有多行、且每行和输出的项数都相同时才拆。
+    '''
+    columns = inp[0].split()
+    k = len(columns)
+    outs = out[0].split() if len(out) == 1 else []
+    rest = [line.split() for line in inp[1:]]
+    if k < 2 or not rest or len(outs) != k or any(len(row) != k for row in rest):
+        return [(inp, out)]
+    return [([columns[i]] + [row[i] for row in rest], [outs[i]]) for i in range(k)]
+
+
+def parse_examples(lines):
+    '''从一段文本行里找出 (输入行列表, 输出行列表)
+
+    "输入" 之后到 "输出" 之前的行是标准输入（中间的空行忽略），"输出" 之后到空行或下一个小标题为止是标准输出。
+    输出写在 "输出：" 同一行时，后续的输出行要有缩进，遇到顶格的行就结束。
+    '''
+    cases = []
+    inp = out = None
+    mode = None
+    inline = inline_out = False
+
+    def close():
+        # "输入: 有一个正偶数 n ..." 这种是输入格式的描述，不是样例
+        if inp and out and not any('。' in line for line in inp + out):
+            cases.extend(split_columns(inp, out) if inline else [(inp, out)])
+
+    for raw in lines:
+        text = raw.strip()
+        if text in NOISE_LINES:
+            continue
+        first_in = label(text, '输入')
+        first_out = label(text, '输出')
+        if first_in is not None:
+            close()
+            inp, out, mode = [first_in] if first_in else [], None, 'in'
+            inline = bool(first_in)
+        elif first_out is not None and mode == 'in':
+            out, mode = [first_out] if first_out else [], 'out'
+            inline_out = bool(first_out)
+        elif mode and (not text and mode == 'out' or text.startswith(SECTION_WORDS)
+                       or mode == 'out' and inline_out and not raw[:1].isspace()):
+            # "输出：122" 写在同一行时，后面的输出行和它对齐缩进；顶格的行是解释文字
+            close()
+            inp = out = mode = None
+        elif mode == 'in' and text:
+            inp.append(text)
+        elif mode == 'out':
+            out.append(text)
+    close()
+    return cases
+
+
+def string_literals(source):
+    '''模块级字符串字面量：{起始行号: (结束行号, 字符串内容)}，行号从 1 开始
+
+    题面是从网页复制的文本，不按 Python 转义解释（样例里的 \\\\ 要保持两个反斜杠），所以取源码原文去掉引号。
+    '''
+    literals = {}
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+            raw = ast.get_source_segment(source, node.value).lstrip('rRuU')
+            quote = raw[:3] if raw[:3] in QUOTES else raw[0]
+            literals[node.lineno] = (node.end_lineno, raw[len(quote):-len(quote)])
+    return literals
+
+
+def question_cases(path=QUESTION_FILE):
+    '''questionTest.py：第 N 个模块级字符串是题目 qN，样例写在题面里'''
+    with open(path, encoding='utf-8') as f:
+        literals = string_literals(f.read())
+    for n, (lineno, (end, text)) in enumerate(literals.items(), 1):
+        for inp, out in parse_examples(text.splitlines()):
+            yield 'q{}'.format(n), lineno, inp, out
+
+
+def huawei_sections(path=HUAWEI_FILE):
+    '''HUAWEIanswer.py 按 "# N" 题号切段，返回 [(题号, 起始行号, 去掉 "# " 的行列表)]
+
+    题号行前面是空行，且题号不小于上一个题号（样例里单独一行的数字会被跳过）。
+    同一个题号再次出现时：上一段已经有代码，说明是另一道题，记为 hwN-2；否则只是同一题的更多样例。
+    文件末尾没有题号、题面写在三引号字符串里的题目各自成段，记为 hwN-s1、hwN-s2...（N 是前面最近的题号），
+    段内是字符串的内容，不含引号。
+    '''
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    rows = source.splitlines()
+    literals = string_literals(source)
+    sections = []
+    number = 0
+    unnumbered = 0  # 当前题号之后没有题号的题目个数
+    has_code = False
+    mode = None  # 正在读的样例部分：'in'、'out' 或不在样例里
+    skip_to = 0  # 已经整段读过的字符串字面量的结束行号
+    for i, row in enumerate(rows):
+        if i + 1 <= skip_to:
+            continue
+        if i + 1 in literals:
+            skip_to, text = literals[i + 1]
+            unnumbered += 1
+            sections.append(('hw{}-s{}'.format(number, unnumbered), i + 1, text.splitlines()))
+            has_code, mode = False, None
+            continue
+        m = re.fullmatch(r'# (\d+)\s*', row)
+        if m and (i == 0 or not rows[i - 1].strip()) and number <= int(m.group(1)) <= number + 5:
+            n = int(m.group(1))
+            if n != number or has_code:
+                pid = 'hw{}'.format(n)
+                if sections and any(s[0] == pid for s in sections):
+                    pid += '-2'
+                sections.append((pid, i + 1, []))
+                if n != number:
+                    unnumbered = 0
+                number, has_code = n, False
+            mode = None
+            continue
+        if not sections:
+            continue
+        text = row[2:] if row.startswith('# ') else row.lstrip('#')
+        sections[-1][2].append(text)
+        stripped = text.strip()
+        if stripped.startswith('输入'):
+            mode = 'in'
+        elif stripped.startswith('输出') and mode:
+            mode = 'out'
+        elif not stripped:
+            if mode == 'out':
+                mode = None
+        elif not mode:
+            has_code = True
+    return sections
+
+
+def huawei_cases(path=HUAWEI_FILE):
+    for pid, lineno, lines in huawei_sections(path):
+        for inp, out in parse_examples(lines):
+            yield pid, lineno, inp, out
+
+
+def corpus_cases():
+    '''两个文件里的所有样例，每个是 {id, problem_id, source, stdin, expected}'''
+    seen = {}
+    for source, cases in ((QUESTION_FILE, question_cases()), (HUAWEI_FILE, huawei_cases())):
+        for pid, lineno, inp, out in cases:
+            # 样例不能带上题面字符串的引号，出现说明切段出错了
+            if any(quote in line for line in inp + out for quote in QUOTES):
+                raise ValueError('{}:{} {}: example contains a string delimiter'.format(source, lineno, pid))
+            seen[pid] = seen.get(pid, 0) + 1
+            yield {'id': '{}#{}'.format(pid, seen[pid]), 'problem_id': pid,
+                   'source': '{}:{}'.format(os.path.relpath(source, HERE), lineno),
+                   'stdin': '\n'.join(inp) + '\n', 'expected': '\n'.join(out) + '\n'}
+
+
+def extract(path=CORPUS_PATH):
+    '''把样例写成 JSONL，每行一个样例，返回样例数'''
+    count = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        for case in corpus_cases():
+            f.write(json.dumps(case, ensure_ascii=False) + '\n')
+            count += 1
+    return count
+
+
+def corpus_stale(path=CORPUS_PATH):
+    '''语料不存在，或者题面文件、提取代码比它新时返回 True'''
+    if not os.path.exists(path):
+        return True
+    mtime = os.path.getmtime(path)
+    return any(os.path.getmtime(source) > mtime for source in (QUESTION_FILE, HUAWEI_FILE, os.path.abspath(__file__)))
+
+
+def load_corpus(path=CORPUS_PATH):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def normalize(text):
+    '''比较输出时忽略行尾空白和末尾空行'''
+    return '\n'.join(line.rstrip() for line in text.strip().splitlines())
+
+
+def run_case(case, repeat=1):
+    '''在工作进程里跑一个样例，返回 (样例 id, 结果, 最短耗时秒, 实际输出)'''
+    from solutions import get
+    solution = get(case['problem_id'])
+    best = None
+    actual = ''
+    try:
+        for i in range(repeat):
+            t0 = time.perf_counter()
+            actual = solution.run(case['stdin'])
+            elapsed = time.perf_counter() - t0
+            best = elapsed if best is None else min(best, elapsed)
+    except Exception as e:
+        return case['id'], 'ERROR', best or 0.0, '{}: {}'.format(type(e).__name__, e)
+    status = 'ok' if normalize(actual) == normalize(case['expected']) else 'FAIL'
+    return case['id'], status, best, actual
+
+
+def run_corpus(cases, processes=None, repeat=1):
+    '''用进程池检查所有已注册题目的样例，没有题解的样例跳过，结果按样例顺序返回'''
+    from solutions import SOLUTIONS
+    todo = [case for case in cases if case['problem_id'] in SOLUTIONS]
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        chunksize = max(1, len(todo) // ((processes or os.cpu_count() or 1) * 4))
+        results = list(executor.map(run_case, todo, [repeat] * len(todo), chunksize=chunksize))
+    return results, len(cases) - len(todo)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='从题面提取样例，并用进程池检查 solutions 中的题解')
+    sub = parser.add_subparsers(dest='command', required=True)
+    p = sub.add_parser('extract', help='提取样例到 JSONL')
+    p.add_argument('--corpus', default=CORPUS_PATH)
+    p = sub.add_parser('run', help='检查题解并统计每个样例的耗时')
+    p.add_argument('--corpus', default=CORPUS_PATH)
+    p.add_argument('-k', '--filter', help='只运行题号以此开头的样例，比如 hw 或 q3')
+    p.add_argument('-j', '--processes', type=int, default=None)
+    p.add_argument('--repeat', type=int, default=1, help='每个样例运行的次数，耗时取最短的一次')
+    p.add_argument('-v', '--verbose', action='store_true', help='打印失败样例的输入和输出')
+    args = parser.parse_args(argv)
+
+    if args.command == 'extract':
+        print('{} cases written to {}'.format(extract(args.corpus), args.corpus))
+        return 0
+
+    if corpus_stale(args.corpus):
+        # 改了题面或提取规则后旧语料就过期了，重新提取
+        extract(args.corpus)
+    cases = [case for case in load_corpus(args.corpus)
+             if not args.filter or case['problem_id'].startswith(args.filter)]
+    skipped_examples = [case for case in cases if case['id'] in SKIPPED_EXAMPLES]
+    cases = [case for case in cases if case['id'] not in SKIPPED_EXAMPLES]
+    by_id = {case['id']: case for case in cases}
+    t0 = time.perf_counter()
+    results, skipped = run_corpus(cases, args.processes, args.repeat)
+    wall = time.perf_counter() - t0
+
+    failed = 0
+    for case_id, status, elapsed, actual in results:
+        print('{:<6} {:>10.1f}us  {}'.format(status, elapsed * 1e6, case_id))
+        if status != 'ok':
+            failed += 1
+            if args.verbose:
+                case = by_id[case_id]
+                print('  source:   {}\n  stdin:    {!r}\n  expected: {!r}\n  actual:   {!r}'.format(
+                    case['source'], case['stdin'], case['expected'], actual))
+    for case in skipped_examples:
+        print('{:<6} {:>12}  {}  {}'.format('SKIP', '', case['id'], SKIPPED_EXAMPLES[case['id']]))
+    print('{} cases, {} failed, {} without a solution, {} examples skipped, wall {:.2f}s, '
+          'sum of case time {:.1f}ms'.format(len(results), failed, skipped, len(skipped_examples), wall,
+                                            sum(r[2] for r in results) * 1000))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,163 @@
+# t_modelrule_model_classify 的列位置，与 pgsqlTEST.py 中的用法一致
+ID_COL = 0  # 节点 id
+DEL_COL = 10  # 删除标志，0 表示有效
+PARENT_COL = 12  # 父节点 id
+
+ROOT_ID = 'rootid'
+
+
+class ClassifyTree:
+    '''由分类表的行构建的树：子节点索引和叶子节点'''
+
+    def __init__(self, rows, root=ROOT_ID):
+        self.root = root
+        self.nodes = {}  # 节点 id -> 行
+        self.children = {}  # 父节点 id -> 子节点 id 列表
+        self._index = None
+        for row in rows:
+            if row[DEL_COL] == 0:
+                self.nodes[row[ID_COL]] = row
+                self.children.setdefault(row[PARENT_COL], []).append(row[ID_COL])
+        self._leaves = self.find_leaves()
+        self.leaf_set = set(self._leaves)
+
+    def walk(self):
+        '''从根节点逐层向下遍历一次，每个节点最多访问一次
+
+        返回 (叶子列表, 可达节点集合, 重复到达的 (父, 子) 列表)。没有子节点的就是叶子，
+        顺序与 pgsqlTEST.py 原来的 find_next 相同；重复到达说明数据里有重复 id 或经过根的环，
+        这种情况下原来的 while 循环不会结束，这里直接跳过并记录下来。
+        '''
+        leaves = []
+        seen = {self.root}
+        repeated = []
+        level = [self.root]
+        while level:
+            next_level = []
+            for parent_id in level:
+                child_ids = self.children.get(parent_id)
+                if not child_ids:
+                    leaves.append(parent_id)
+                    continue
+                for child_id in child_ids:
+                    if child_id in seen:
+                        repeated.append((parent_id, child_id))
+                    else:
+                        seen.add(child_id)
+                        next_level.append(child_id)
+            level = next_level
+        return leaves, seen, repeated
+
+    def find_leaves(self):
+        return self.walk()[0]
+
+    def diagnose(self):
+        '''检查数据问题：环、孤儿节点和从根不可达的子树
+
+        孤儿是父节点既不是根也不是有效节点的节点（父节点不存在或已软删除），
+        它们就是不可达子树的顶点；环沿父节点链查找，每个节点只处理一次，整体 O(N)。
+        '''
+        leaves, seen, repeated = self.walk()
+        nodes = self.nodes
+        orphans = [x for x, row in nodes.items() if row[PARENT_COL] != self.root and row[PARENT_COL] not in nodes]
+        cycles = []
+        state = {}  # 1 表示在当前路径上，2 表示已处理
+        for start in nodes:
+            if start in seen or start in state:
+                continue
+            path = []
+            x = start
+            while x in nodes and x not in seen and x not in state:
+                state[x] = 1
+                path.append(x)
+                x = nodes[x][PARENT_COL]
+            if state.get(x) == 1:
+                cycles.append(path[path.index(x):])
+            for y in path:
+                state[y] = 2
+        unreachable = [x for x in nodes if x not in seen]
+        return {
+            'nodes': len(nodes),
+            'reachable': len(seen) - 1,
+            'leaves': len(leaves),
+            'orphans': orphans,
+            'cycles': cycles,
+            'repeated': repeated,
+            'unreachable': unreachable,
+        }
+
+    @property
+    def leaves(self):
+        '''按层序排列的叶子列表，增量更新后第一次访问时重新生成'''
+        if self._leaves is None:
+            self._leaves = self.find_leaves()
+        return self._leaves
+
+    def changed(self):
+        '''子节点索引被修改后调用，让依赖它的派生结构失效'''
+        self._leaves = None
+        self._index = None
+
+    def __len__(self):
+        return len(self.nodes)
+
+    @property
+    def index(self):
+        '''欧拉序区间索引，第一次用到时构建，之后复用'''
+        if self._index is None:
+            self._index = TreeIndex(self)
+        return self._index
+
+
+class TreeIndex:
+    '''一次 DFS 给每个节点编入/出序号
+
+    tin[x] 是 x 在先序数组 order 中的位置，tout[x] 是其子树结束位置（不含），
+    所以 y 的子树就是 order[tin[y]:tout[y]] 这段连续切片，
+    "x 是否在 y 下面" 只需比较两个整数。
+    '''
+
+    def __init__(self, tree):
+        self.order = []
+        self.tin = {}
+        self.tout = {}
+        self.depths = {}
+        children = tree.children
+        # 用显式栈代替递归，深树不会超出递归深度
+        stack = [(tree.root, 0, False)]
+        while stack:
+            node_id, depth, leaving = stack.pop()
+            if leaving:
+                self.tout[node_id] = len(self.order)
+                continue
+            if node_id in self.tin:
+                # 重复 id 或环，已经编过号的节点不再进入
+                continue
+            self.tin[node_id] = len(self.order)
+            self.depths[node_id] = depth
+            self.order.append(node_id)
+            stack.append((node_id, depth, True))
+            for child_id in reversed(children.get(node_id, ())):
+                stack.append((child_id, depth + 1, False))
+
+    def is_under(self, x, y):
+        '''x 是否是 y 的后代（x == y 也算）'''
+        tin = self.tin
+        if x not in tin or y not in tin:
+            return False
+        return tin[y] <= tin[x] < self.tout[y]
+
+    def descendants(self, y, include_self=False):
+        '''y 的所有后代，先序排列'''
+        start = self.tin[y]
+        return self.order[start if include_self else start + 1:self.tout[y]]
+
+    def depth(self, x):
+        '''x 的深度，根节点为 0'''
+        return self.depths[x]
+
+    def subtree_size(self, y):
+        return self.tout[y] - self.tin[y]
+
+    def __contains__(self, x):
+        return x in self.tin
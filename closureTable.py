@@ -0,0 +1,84 @@
+import sys
+import time
+
+from leafCopy import copy_swap, tenant_records
+
+CLOSURE_TABLE = 't_modelrule_classify_closure'
+CLOSURE_COLUMNS = (('ftenant_id', 'varchar(64) not null'), ('fancestor_id', 'varchar(64) not null'),
+                   ('fdescendant_id', 'varchar(64) not null'), ('fdepth', 'integer not null'))
+# 按祖先查后代、按后代查祖先两个方向都要走索引
+CLOSURE_INDEXES = (('ftenant_id', 'fancestor_id', 'fdescendant_id'), ('ftenant_id', 'fdescendant_id'))
+
+
+def closure_records(tenant_id, tree):
+    '''一次先序遍历生成闭包表行 (租户, 祖先, 后代, 距离)，包括每个节点到自身的距离 0 行
+
+    先序数组里节点的深度已知，维护一个祖先栈：访问深度为 d 的节点时把栈截到 d，
+    栈里的每个节点就是它的全部祖先，不需要为每个节点再向上走一遍。
+    '''
+    index = tree.index
+    stack = []
+    for node_id in index.order:
+        depth = index.depth(node_id)
+        del stack[depth:]
+        stack.append(node_id)
+        for i, ancestor_id in enumerate(stack):
+            yield tenant_id, ancestor_id, node_id, depth - i
+
+
+def write_closure(tenant_trees, table=CLOSURE_TABLE, full=False):
+    '''生成租户的闭包表并用 COPY 批量装入，tenant_trees 是 {租户 id: ClassifyTree} 或 (租户 id, 树) 的迭代器
+
+    默认只替换给出的这些租户的行；full=True 时整表替换，tenant_trees 必须包含所有租户。
+    '''
+    tenants = []
+    records = tenant_records(tenant_trees, closure_records, tenants)
+    return copy_swap(records, table, CLOSURE_COLUMNS, CLOSURE_INDEXES, None if full else tenants)
+
+
+# 增量维护，都在调用方的事务里执行（传入游标），只改受影响的子树
+def insert_node(cur, tenant_id, node_id, parent_id, table=CLOSURE_TABLE):
+    '''新增一个节点：自身一行，加上父节点的每个祖先到它的一行'''
+    cur.execute("insert into " + table + " (ftenant_id, fancestor_id, fdescendant_id, fdepth)"
+                " select %s, fancestor_id, %s, fdepth + 1 from " + table +
+                " where ftenant_id = %s and fdescendant_id = %s"
+                " union all select %s, %s, %s, 0",
+                (tenant_id, node_id, tenant_id, parent_id, tenant_id, node_id, node_id))
+
+
+def delete_subtree(cur, tenant_id, node_id, table=CLOSURE_TABLE):
+    '''删除（软删除）一个节点：它的整棵子树都不再可达，删掉所有以子树节点为后代的行'''
+    cur.execute("delete from " + table + " where ftenant_id = %s and fdescendant_id in"
+                " (select fdescendant_id from " + table + " where ftenant_id = %s and fancestor_id = %s)",
+                (tenant_id, tenant_id, node_id))
+
+
+def move_subtree(cur, tenant_id, node_id, new_parent_id, table=CLOSURE_TABLE):
+    '''把以 node_id 为根的子树挂到 new_parent_id 下
+
+    先断开子树与旧祖先之间的行（子树内部的行保留），
+    再把新父节点的每个祖先与子树的每个节点两两相连。
+    '''
+    cur.execute("delete from " + table + " c using " + table + " sub"
+                " where sub.ftenant_id = %s and sub.fancestor_id = %s"
+                " and c.ftenant_id = %s and c.fdescendant_id = sub.fdescendant_id"
+                " and c.fancestor_id not in"
+                " (select fdescendant_id from " + table + " where ftenant_id = %s and fancestor_id = %s)",
+                (tenant_id, node_id, tenant_id, tenant_id, node_id))
+    cur.execute("insert into " + table + " (ftenant_id, fancestor_id, fdescendant_id, fdepth)"
+                " select %s, sup.fancestor_id, sub.fdescendant_id, sup.fdepth + sub.fdepth + 1"
+                " from " + table + " sup cross join " + table + " sub"
+                " where sup.ftenant_id = %s and sup.fdescendant_id = %s"
+                " and sub.ftenant_id = %s and sub.fancestor_id = %s",
+                (tenant_id, tenant_id, new_parent_id, tenant_id, node_id))
+
+
+if __name__ == '__main__':
+    # 生成并装入指定租户的闭包表，其他租户的行保持不变：python closureTable.py 租户id [租户id ...]
+    from classifyTree import ClassifyTree
+    from pgsqlPool import fetch_classify, close_pool
+    tenants = sys.argv[1:] or ['39ca61dfcfac43dca8d5cdb0f1cfddf1']
+    t0 = time.perf_counter()
+    n = write_closure((tenant_id, ClassifyTree(fetch_classify(tenant_id)[0])) for tenant_id in tenants)
+    print('{} closure rows written in {:.3f}s'.format(n, time.perf_counter() - t0))
+    close_pool()
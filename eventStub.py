@@ -0,0 +1,63 @@
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+# 发布会数据，与 test.py 中的断言一致
+EVENTS = {
+    '1': {'name': '小米11发布会', 'limit': 2000, 'status': True, 'address': '深圳体育中心',
+          'start_time': '2021-01-01 20:00:00'},
+}
+
+
+def get_event_list(eid):
+    '''get_event_list 接口的约定：eid 为空返回 10021，查不到返回 10022，查到返回 200'''
+    if not eid:
+        return {'status': 10021, 'message': 'parameter error'}
+    event = EVENTS.get(eid)
+    if event is None:
+        return {'status': 10022, 'message': 'query result is empty'}
+    return {'status': 200, 'message': 'success', 'data': event}
+
+
+class EventHandler(BaseHTTPRequestHandler):
+    '''本地桩服务，实现 /api/get_event_list/，不需要启动 Django'''
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path.rstrip('/') == '/api/get_event_list':
+            eid = parse_qs(url.query, keep_blank_values=True).get('eid', [''])[0].strip()
+            status, res = 200, get_event_list(eid)
+        else:
+            status, res = 404, {'status': 404, 'message': 'not found'}
+        body = json.dumps(res, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub(port=0, host='127.0.0.1'):
+    '''在后台线程启动桩服务，port 为 0 时随机选端口，返回 (server, 接口地址)'''
+    server = ThreadingHTTPServer((host, port), EventHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='event-stub', daemon=True).start()
+    return server, 'http://{}:{}/api/get_event_list/'.format(host, server.server_port)
+
+
+if __name__ == '__main__':
+    # python eventStub.py [端口]，默认 8000，与 Django 开发服务器相同
+    server = ThreadingHTTPServer(('127.0.0.1', int(sys.argv[1]) if len(sys.argv) > 1 else 8000), EventHandler)
+    print('get_event_list stub on http://127.0.0.1:{}/api/get_event_list/'.format(server.server_port))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
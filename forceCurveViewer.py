@@ -0,0 +1,364 @@
+import argparse
+import csv
+import json
+import os
+import queue
+import sys
+import threading
+import time
+
+import numpy as np
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class MinMaxPyramid:
+    '''力值曲线的 min/max 金字塔
+
+    第 0 层是原始数据，之后每层把相邻两个点合成一个 (min, max)，第 l 层有 n >> l 个点。
+    画 width 个像素时选一层，使可见范围在这一层只剩 O(width) 个点，再按像素取 min/max，
+    所以重绘的代价与总样本数无关。各层存在按容量翻倍预分配的缓冲区里，
+    追加 k 个点只写每层新增的末尾，均摊 O(k)，实时模式下界面线程不会因为总长度变大而变慢。
+    '''
+
+    def __init__(self):
+        self._n = 0
+        self._t = np.empty(0)
+        self._lo = [np.empty(0)]  # 第 0 层的 min 和 max 是同一个数组
+        self._hi = [np.empty(0)]
+
+    @staticmethod
+    def _grow(buf, size):
+        if size <= len(buf):
+            return buf
+        new = np.empty(max(size, 2 * len(buf), 1024))
+        new[:len(buf)] = buf
+        return new
+
+    def append(self, t, y):
+        t = np.asarray(t, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        old, n = self._n, self._n + len(t)
+        self._t = self._grow(self._t, n)
+        self._t[old:n] = t
+        self._lo[0] = self._hi[0] = self._grow(self._lo[0], n)
+        self._lo[0][old:n] = y
+        level = 0
+        while n >> (level + 1):
+            # 第 level+1 层的第 j 点由第 level 层的 2j、2j+1 合成；已有的点覆盖的样本不变，只算新增的
+            start, stop = old >> (level + 1), n >> (level + 1)
+            if level + 1 == len(self._lo):
+                self._lo.append(np.empty(0))
+                self._hi.append(np.empty(0))
+            lo, hi = self._lo[level], self._hi[level]
+            self._lo[level + 1] = self._grow(self._lo[level + 1], stop)
+            self._hi[level + 1] = self._grow(self._hi[level + 1], stop)
+            np.minimum(lo[2 * start:2 * stop:2], lo[2 * start + 1:2 * stop:2], out=self._lo[level + 1][start:stop])
+            np.maximum(hi[2 * start:2 * stop:2], hi[2 * start + 1:2 * stop:2], out=self._hi[level + 1][start:stop])
+            level += 1
+        self._n = n
+
+    @property
+    def t(self):
+        return self._t[:self._n]
+
+    @property
+    def levels(self):
+        return self._n.bit_length()
+
+    def level(self, level):
+        '''第 level 层的 (min, max) 视图'''
+        size = self._n >> level
+        return self._lo[level][:size], self._hi[level][:size]
+
+    def __len__(self):
+        return self._n
+
+    def decimate(self, t0, t1, width):
+        '''返回可见区间 [t0, t1] 里每个像素列的 (x, min, max)，共不超过 width 列'''
+        t = self.t
+        i0 = max(int(np.searchsorted(t, t0, 'left')) - 1, 0)
+        i1 = min(int(np.searchsorted(t, t1, 'right')) + 1, len(t))
+        if i1 - i0 <= 0 or width <= 0:
+            return np.empty(0), np.empty(0), np.empty(0)
+        level = 0
+        while level + 1 < self.levels and (i1 - i0) >> (level + 1) >= 2 * width:
+            level += 1
+        lo, hi = self.level(level)
+        lo = lo[i0 >> level:(i1 >> level) + 1]
+        hi = hi[i0 >> level:(i1 >> level) + 1]
+        x = t[(i0 >> level) << level:((i1 >> level) + 1) << level:1 << level][:len(lo)]
+        lo = lo[:len(x)]
+        hi = hi[:len(x)]
+        if len(x) <= width:
+            return x, lo, hi
+        edges = np.linspace(0, len(x), width + 1).astype(np.int64)[:-1]
+        return x[edges], np.minimum.reduceat(lo, edges), np.maximum.reduceat(hi, edges)
+
+
+def load_archive(path):
+    '''读取存档的力值曲线，返回 (时间, 力值)
+
+    支持 JSON（"time" / "data" 两个列表，或实验机上传时用的 "timeList" / "forceList"）、
+    两列 CSV（时间,力值）和 .npy/.npz。
+    '''
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.json':
+        with open(path, encoding='utf-8') as f:
+            payload = json.load(f)
+        t = payload['time'] if 'time' in payload else payload['timeList']
+        y = payload['data'] if 'data' in payload else payload['forceList']
+        return np.asarray(t, dtype=np.float64), np.asarray(y, dtype=np.float64)
+    if ext == '.npz':
+        archive = np.load(path)
+        return archive['time'], archive['data']
+    if ext == '.npy':
+        array = np.load(path, mmap_mode='r')
+        return np.asarray(array[:, 0], dtype=np.float64), np.asarray(array[:, 1], dtype=np.float64)
+    with open(path, newline='') as f:
+        rows = [row for row in csv.reader(f) if row and row[0].replace('.', '', 1).lstrip('-').isdigit()]
+    array = np.asarray(rows, dtype=np.float64)
+    return array[:, 0], array[:, 1]
+
+
+class LoaderThread(QtCore.QThread):
+    '''在后台线程读存档，读完后通过信号把数据交给界面线程'''
+
+    loaded = QtCore.pyqtSignal(object, object)
+    failed = QtCore.pyqtSignal(str)
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path
+
+    def run(self):
+        try:
+            t, y = load_archive(self.path)
+        except Exception as e:
+            self.failed.emit('{}: {}'.format(self.path, e))
+            return
+        self.loaded.emit(t, y)
+
+
+class StreamThread(QtCore.QThread):
+    '''实时数据：逐行读取 "时间,力值"（文件或标准输入），攒够一批或每隔 interval 秒发一次
+
+    阻塞的读取放在一个守护线程里，经队列交给本线程；没有新数据时本线程也会按 interval 醒来
+    检查 requestInterruption()，关窗口时不会卡在标准输入上。
+    '''
+
+    chunk = QtCore.pyqtSignal(object, object)
+
+    def __init__(self, stream, interval=0.05, parent=None):
+        super().__init__(parent)
+        self.stream = stream
+        self.interval = interval
+
+    def read_lines(self, lines):
+        for line in self.stream:
+            lines.put(line)
+        lines.put(None)
+
+    def run(self):
+        lines = queue.Queue()
+        threading.Thread(target=self.read_lines, args=(lines,), daemon=True).start()
+        ts, ys = [], []
+        last = time.monotonic()
+        while not self.isInterruptionRequested():
+            try:
+                line = lines.get(timeout=self.interval)
+            except queue.Empty:
+                line = ''
+            if line is None:
+                break
+            parts = line.replace(',', ' ').split()
+            try:
+                t, y = float(parts[0]), float(parts[1])
+            except (IndexError, ValueError):
+                t = None
+            if t is not None:
+                ts.append(t)
+                ys.append(y)
+            now = time.monotonic()
+            if ts and (now - last >= self.interval or len(ts) >= 100000):
+                self.chunk.emit(np.asarray(ts), np.asarray(ys))
+                ts, ys = [], []
+                last = now
+        if ts:
+            self.chunk.emit(np.asarray(ts), np.asarray(ys))
+
+
+class CurveWidget(QtWidgets.QWidget):
+    '''力值-时间曲线，滚轮缩放、拖动平移，每列像素画一条 min-max 竖线'''
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.curve = MinMaxPyramid()
+        self.view = None  # (t0, t1)，None 表示显示全部
+        self.follow = True  # 实时模式下自动跟随最新数据
+        self.frame_times = []
+        self._drag = None
+        self.setMinimumSize(320, 200)
+
+    def set_data(self, t, y):
+        self.curve = MinMaxPyramid()
+        self.curve.append(t, y)
+        self.view = None
+        self.update()
+
+    def append_data(self, t, y):
+        self.curve.append(t, y)
+        if self.follow and self.view is not None:
+            span = self.view[1] - self.view[0]
+            self.view = (self.curve.t[-1] - span, self.curve.t[-1])
+        self.update()
+
+    def visible_range(self):
+        if self.view is not None:
+            return self.view
+        if not len(self.curve):
+            return 0.0, 1.0
+        return float(self.curve.t[0]), float(self.curve.t[-1])
+
+    def paintEvent(self, event):
+        start = time.perf_counter()
+        painter = QtGui.QPainter(self)
+        painter.fillRect(self.rect(), QtCore.Qt.white)
+        width, height = self.width(), self.height()
+        t0, t1 = self.visible_range()
+        x, lo, hi = self.curve.decimate(t0, t1, width)
+        if len(x):
+            y_min, y_max = float(lo.min()), float(hi.max())
+            if y_max == y_min:
+                y_max = y_min + 1.0
+            scale_x = (width - 1) / ((t1 - t0) or 1.0)
+            scale_y = (height - 1) / (y_max - y_min)
+            px = (x - t0) * scale_x
+            py_lo = (height - 1) - (lo - y_min) * scale_y
+            py_hi = (height - 1) - (hi - y_min) * scale_y
+            # 每列先从 max 画到 min，再连到下一列的 max，得到与原始曲线相同的包络
+            polygon = QtGui.QPolygonF([QtCore.QPointF(a, b) for a, b, c in zip(px.tolist(), py_hi.tolist(), py_lo.tolist())
+                                       for b in (b, c)])
+            painter.setPen(QtGui.QPen(QtGui.QColor(30, 90, 200), 1))
+            painter.drawPolyline(polygon)
+            painter.setPen(QtCore.Qt.black)
+            painter.drawText(6, 14, 'force {:.3f} .. {:.3f}   t {:.3f} .. {:.3f}s   {} samples'.format(
+                y_min, y_max, t0, t1, len(self.curve)))
+        painter.end()
+        self.frame_times.append(time.perf_counter() - start)
+
+    def wheelEvent(self, event):
+        t0, t1 = self.visible_range()
+        factor = 0.8 if event.angleDelta().y() > 0 else 1.25
+        center = t0 + (t1 - t0) * event.pos().x() / max(self.width(), 1)
+        self.view = (center - (center - t0) * factor, center + (t1 - center) * factor)
+        self.follow = False
+        self.update()
+
+    def mousePressEvent(self, event):
+        self._drag = (event.pos().x(), self.visible_range())
+
+    def mouseMoveEvent(self, event):
+        if self._drag is None:
+            return
+        x, (t0, t1) = self._drag
+        shift = (x - event.pos().x()) * (t1 - t0) / max(self.width(), 1)
+        self.view = (t0 + shift, t1 + shift)
+        self.follow = False
+        self.update()
+
+    def mouseReleaseEvent(self, event):
+        self._drag = None
+
+    def mouseDoubleClickEvent(self, event):
+        self.view = None
+        self.follow = True
+        self.update()
+
+
+class ViewerWindow(QtWidgets.QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle('force curve viewer')
+        self.resize(1024, 768)
+        self.curve = CurveWidget(self)
+        self.setCentralWidget(self.curve)
+        self.threads = []
+
+    def open_archive(self, path):
+        thread = LoaderThread(path, self)
+        thread.loaded.connect(self.curve.set_data)
+        thread.failed.connect(lambda message: self.statusBar().showMessage(message))
+        self.threads.append(thread)
+        thread.start()
+
+    def open_stream(self, stream, window=10.0):
+        self.curve.view = (0.0, window)
+        thread = StreamThread(stream, parent=self)
+        thread.chunk.connect(self.curve.append_data)
+        self.threads.append(thread)
+        thread.start()
+
+    def closeEvent(self, event):
+        for thread in self.threads:
+            thread.requestInterruption()
+            thread.wait(1000)
+        super().closeEvent(event)
+
+
+def synthetic_curve(n, seed=0):
+    '''拉伸试验形状的合成曲线：上升、屈服平台、断裂，再加噪声'''
+    rng = np.random.RandomState(seed)
+    t = np.linspace(0, 60, n)
+    y = 600 * (1 - np.exp(-t / 8)) - 80 * np.clip(t - 50, 0, None) + rng.normal(0, 3, n)
+    return t, y
+
+
+def bench(samples, width=1280, height=720, frames=50):
+    '''无界面基准：在 offscreen 平台上渲染全图和不同缩放级别，返回每级的帧时间（毫秒）'''
+    # 没有显示器的机器上默认的 xcb 插件会直接中止进程，必须在创建 QApplication 之前选好平台
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv[:1])
+    widget = CurveWidget()
+    widget.resize(width, height)
+    t, y = synthetic_curve(samples)
+    start = time.perf_counter()
+    widget.set_data(t, y)
+    build = time.perf_counter() - start
+    result = {'samples': samples, 'build_ms': build * 1000}
+    for zoom in (1, 10, 1000):
+        span = (t[-1] - t[0]) / zoom
+        widget.view = (t[0] + span / 3, t[0] + span / 3 + span)
+        widget.frame_times = []
+        for i in range(frames):
+            widget.grab()
+        ordered = sorted(widget.frame_times)
+        result['zoom_{}x'.format(zoom)] = {'median_ms': ordered[len(ordered) // 2] * 1000,
+                                          'max_ms': ordered[-1] * 1000}
+    app.processEvents()
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='力值-时间曲线查看器')
+    parser.add_argument('archive', nargs='?', help='曲线存档（.json/.csv/.npy/.npz），"-" 表示从标准输入实时读取')
+    parser.add_argument('--bench', type=lambda s: int(float(s)), metavar='SAMPLES',
+                        help='不显示窗口，在 offscreen 平台上测量指定样本数下的帧时间')
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        print(json.dumps(bench(args.bench)))
+        return 0
+    app = QtWidgets.QApplication(sys.argv[:1])
+    window = ViewerWindow()
+    if args.archive == '-':
+        window.open_stream(sys.stdin)
+    elif args.archive:
+        window.open_archive(args.archive)
+    else:
+        window.curve.set_data(*synthetic_curve(2000000))
+    window.show()
+    return app.exec_()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,121 @@
+import base64
+import gzip
+import json
+import os
+import threading
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+# 回放时保留的响应头，其余的（日期、服务器等）不写进磁带
+KEEP_HEADERS = ('content-type', 'content-encoding', 'location')
+
+
+def request_key(method, url, body=None):
+    '''请求的索引键：方法 + 路径 + 排好序的参数 + 请求体
+
+    不含主机和端口，对着桩服务（随机端口）录的磁带也能在测试真实服务的地址时回放。
+    '''
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    return '{} {}?{} {}'.format(method.upper(), parts.path, query, base64.b64encode(body).decode() if body else '')
+
+
+class Cassette:
+    '''录制的请求/响应对，磁盘上是 gzip 压缩的 JSON，内存里按 request_key 建索引
+
+    mode: 'replay' 只回放，找不到就报错；'record' 总是请求真实服务并录下来；
+    'auto' 有录音就回放，没有才请求并录下来（第一次运行录制，之后都离线）。
+    '''
+
+    def __init__(self, path, mode='auto'):
+        if mode not in ('auto', 'record', 'replay'):
+            raise ValueError('unknown cassette mode: ' + mode)
+        self.path = path
+        self.mode = mode
+        self.index = {}
+        self.dirty = False
+        self._lock = threading.Lock()
+        if mode != 'record' and os.path.exists(path):
+            self.load()
+
+    def load(self):
+        with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+            for item in json.load(f):
+                self.index[item['key']] = item
+
+    def save(self):
+        if not self.dirty:
+            return
+        tmp = self.path + '.tmp'
+        with self._lock:
+            items = sorted(self.index.values(), key=lambda item: item['key'])
+            with gzip.open(tmp, 'wt', encoding='utf-8') as f:
+                json.dump(items, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp, self.path)
+            self.dirty = False
+
+    def get(self, key):
+        return self.index.get(key)
+
+    def put(self, key, response):
+        item = {'key': key, 'status': response.status_code, 'reason': response.reason,
+                'headers': {k: v for k, v in response.headers.items() if k.lower() in KEEP_HEADERS},
+                'body': base64.b64encode(response.content).decode()}
+        with self._lock:
+            self.index[key] = item
+            self.dirty = True
+        return item
+
+    def __len__(self):
+        return len(self.index)
+
+
+class CassetteMiss(requests.exceptions.ConnectionError):
+    '''回放模式下请求没有录音'''
+
+
+class CassetteAdapter(HTTPAdapter):
+    '''挂在 Session 上的传输层：按磁带回放，必要时走真实网络并录制'''
+
+    def __init__(self, cassette, **kwargs):
+        super().__init__(**kwargs)
+        self.cassette = cassette
+
+    def send(self, request, **kwargs):
+        key = request_key(request.method, request.url, request.body)
+        cassette = self.cassette
+        if cassette.mode != 'record':
+            item = cassette.get(key)
+            if item is not None:
+                return self.build_replay(request, item)
+            if cassette.mode == 'replay':
+                raise CassetteMiss('no recording for ' + key, request=request)
+        response = super().send(request, **kwargs)
+        cassette.put(key, response)
+        return response
+
+    def build_replay(self, request, item):
+        response = requests.Response()
+        response.status_code = item['status']
+        response.reason = item['reason']
+        response.headers = CaseInsensitiveDict(item['headers'])
+        response._content = base64.b64decode(item['body'])
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers) or 'utf-8'
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+
+def use_cassette(session, path, mode='auto', **adapter_kwargs):
+    '''给 Session 挂上磁带，返回 Cassette，用完调用它的 save()'''
+    cassette = Cassette(path, mode)
+    adapter = CassetteAdapter(cassette, **adapter_kwargs)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return cassette
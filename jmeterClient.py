@@ -0,0 +1,48 @@
+import http.client
+import json
+import sys
+
+
+class AddNumbersClient:
+    '''调用常驻 add_numbers 进程的客户端，复用同一个 HTTP 长连接
+
+    JMeter 里直接用 HTTP Request 取样器请求 http://127.0.0.1:8765/add_numbers?a=${a}&b=${b}，
+    取样时间就只包括函数本身和一次本地往返，不再包括 Python 解释器启动。
+    '''
+
+    def __init__(self, host='127.0.0.1', port=8765, timeout=5.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.conn = None
+
+    def add_numbers(self, a, b):
+        path = '/add_numbers?a={}&b={}'.format(int(a), int(b))
+        for attempt in range(2):
+            if self.conn is None:
+                self.conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            try:
+                self.conn.request('GET', path)
+                response = self.conn.getresponse()
+                body = response.read()
+                break
+            except (http.client.HTTPException, ConnectionError):
+                # 服务端关闭了空闲连接，重连一次
+                self.close()
+                if attempt:
+                    raise
+        if response.status != 200:
+            raise ValueError(body.decode('utf-8'))
+        return json.loads(body)
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+if __name__ == '__main__':
+    # 与 jmeterTest.py 的命令行用法相同：python jmeterClient.py a b
+    client = AddNumbersClient()
+    print(client.add_numbers(sys.argv[1], sys.argv[2]))
+    client.close()
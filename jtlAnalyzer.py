@@ -0,0 +1,199 @@
+import argparse
+import csv
+import io
+import json
+from multiprocessing import Pool
+
+from latencyHistogram import LogHistogram
+
+# JMeter 默认 CSV 结果文件的列顺序，没有表头的文件按它解析
+DEFAULT_FIELDS = ['timeStamp', 'elapsed', 'label', 'responseCode', 'responseMessage', 'threadName', 'dataType',
+                  'success', 'failureMessage', 'bytes', 'sentBytes', 'grpThreads', 'allThreads', 'URL',
+                  'Latency', 'IdleTime', 'Connect']
+PERCENTILES = (50, 90, 95, 99, 99.9)
+REQUIRED_FIELDS = ('timeStamp', 'elapsed', 'label', 'success')
+
+
+class LabelStats:
+    '''一个取样器标签的统计，内存大小与样本数无关，可以合并'''
+
+    def __init__(self):
+        self.elapsed = LogHistogram()
+        self.errors = 0
+        self.first = None
+        self.last = None
+
+    def add(self, timestamp, elapsed, success):
+        self.elapsed.record(elapsed)
+        if not success:
+            self.errors += 1
+        if self.first is None or timestamp < self.first:
+            self.first = timestamp
+        end = timestamp + elapsed
+        if self.last is None or end > self.last:
+            self.last = end
+
+    def merge(self, other):
+        self.elapsed.merge(other.elapsed)
+        self.errors += other.errors
+        if other.first is not None and (self.first is None or other.first < self.first):
+            self.first = other.first
+        if other.last is not None and (self.last is None or other.last > self.last):
+            self.last = other.last
+        return self
+
+    def summary(self):
+        count = self.elapsed.count
+        seconds = (self.last - self.first) / 1000 if count and self.last > self.first else 0
+        result = {'count': count,
+                  'throughput': count / seconds if seconds else None,
+                  'error_rate': self.errors / count if count else None,
+                  'mean_ms': self.elapsed.mean,
+                  'max_ms': self.elapsed.max}
+        for p in PERCENTILES:
+            result['p{:g}_ms'.format(p)] = self.elapsed.percentile(p)
+        return result
+
+    def to_dict(self):
+        return {'elapsed': self.elapsed.to_dict(), 'errors': self.errors, 'first': self.first, 'last': self.last}
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        stats.elapsed = LogHistogram.from_dict(data['elapsed'])
+        stats.errors = data['errors']
+        stats.first = data['first']
+        stats.last = data['last']
+        return stats
+
+
+def analyze_file(path):
+    '''逐行读取一个 JTL（CSV）文件，返回 {标签: LabelStats.to_dict()}，结果可以跨进程传递'''
+    stats = {}
+    with io.open(path, 'r', encoding='utf-8', errors='replace', newline='', buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        first = next(reader, None)
+        if first is None:
+            return {}
+        if 'timeStamp' in first and 'elapsed' in first:
+            fields, pending = first, None
+        else:
+            fields, pending = DEFAULT_FIELDS, first
+        missing = [name for name in REQUIRED_FIELDS if name not in fields]
+        if missing:
+            raise ValueError('{}: JTL header is missing column(s): {}'.format(path, ', '.join(missing)))
+        ts_col = fields.index('timeStamp')
+        elapsed_col = fields.index('elapsed')
+        label_col = fields.index('label')
+        success_col = fields.index('success')
+
+        def rows():
+            if pending is not None:
+                yield pending
+            yield from reader
+
+        for row in rows():
+            try:
+                timestamp = int(row[ts_col])
+                elapsed = int(row[elapsed_col])
+                label = row[label_col]
+                success = row[success_col] == 'true'
+            except (IndexError, ValueError):
+                # 截断的最后一行或者时间戳不是毫秒格式，跳过
+                continue
+            label_stats = stats.get(label)
+            if label_stats is None:
+                label_stats = stats[label] = LabelStats()
+            label_stats.add(timestamp, elapsed, success)
+    return {label: label_stats.to_dict() for label, label_stats in stats.items()}
+
+
+def analyze(paths, processes=None):
+    '''并行分析多个文件并合并，返回 ({标签: LabelStats}, 所有标签的汇总 LabelStats)
+
+    汇总单独返回，不放进按标签的字典，免得和真的叫 TOTAL 的取样器合在一起。
+    '''
+    if len(paths) == 1 or processes == 1:
+        parts = [analyze_file(path) for path in paths]
+    else:
+        with Pool(processes) as pool:
+            parts = pool.map(analyze_file, paths)
+    merged = {}
+    total = LabelStats()
+    for part in parts:
+        for label, data in part.items():
+            label_stats = LabelStats.from_dict(data)
+            total.merge(LabelStats.from_dict(data))
+            if label in merged:
+                merged[label].merge(label_stats)
+            else:
+                merged[label] = label_stats
+    return merged, total
+
+
+def compare_stats(before, after):
+    '''对比两份 summary()，返回 {指标: (基准值, 当前值, 变化百分比)}'''
+    row = {}
+    for key in ('count', 'throughput', 'error_rate', 'p50_ms', 'p90_ms', 'p99_ms'):
+        a, b = before.get(key), after.get(key)
+        change = (b - a) / a * 100 if a and b is not None else None
+        row[key] = (a, b, change)
+    return row
+
+
+def compare(baseline, current):
+    '''两次 analyze() 的结果逐标签对比，返回 ({标签: 对比行}, 汇总的对比行)'''
+    (base_labels, base_total), (cur_labels, cur_total) = baseline, current
+    result = {}
+    for label in sorted(set(base_labels) | set(cur_labels)):
+        before = base_labels[label].summary() if label in base_labels else {}
+        after = cur_labels[label].summary() if label in cur_labels else {}
+        result[label] = compare_stats(before, after)
+    return result, compare_stats(base_total.summary(), cur_total.summary())
+
+
+def print_summary(stats, total):
+    print('{:<30} {:>10} {:>10} {:>8} {:>8} {:>8} {:>8} {:>8}'.format(
+        'label', 'count', 'tput/s', 'err%', 'p50', 'p90', 'p99', 'p99.9'))
+    # 汇总行放在最后，名字加括号，和真实的取样器标签区分开
+    for label, label_stats in list(stats.items()) + [('(all labels)', total)]:
+        s = label_stats.summary()
+        print('{:<30} {:>10} {:>10} {:>8.2f} {:>8} {:>8} {:>8} {:>8}'.format(
+            label[:30], s['count'], '-' if s['throughput'] is None else '{:.1f}'.format(s['throughput']),
+            (s['error_rate'] or 0) * 100, s['p50_ms'], s['p90_ms'], s['p99_ms'], s['p99.9_ms']))
+
+
+def print_compare(result, total):
+    print('{:<30} {:<11} {:>12} {:>12} {:>9}'.format('label', 'metric', 'baseline', 'current', 'change'))
+    for label, row in list(result.items()) + [('(all labels)', total)]:
+        for key, (a, b, change) in row.items():
+            print('{:<30} {:<11} {:>12} {:>12} {:>9}'.format(
+                label[:30], key, '-' if a is None else '{:.4g}'.format(a), '-' if b is None else '{:.4g}'.format(b),
+                '-' if change is None else '{:+.1f}%'.format(change)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='流式分析 JMeter JTL（CSV）结果文件')
+    parser.add_argument('files', nargs='+', help='本次运行的结果文件，可以是多个')
+    parser.add_argument('--baseline', nargs='+', help='作为对比基准的运行结果文件')
+    parser.add_argument('--processes', type=int, default=None)
+    parser.add_argument('--json', action='store_true', help='输出 JSON')
+    args = parser.parse_args(argv)
+
+    current = analyze(args.files, args.processes)
+    if args.baseline:
+        result, total = compare(analyze(args.baseline, args.processes), current)
+        if args.json:
+            print(json.dumps({'labels': result, 'total': total}, ensure_ascii=False))
+        else:
+            print_compare(result, total)
+    elif args.json:
+        labels, total = current
+        print(json.dumps({'labels': {label: s.summary() for label, s in labels.items()}, 'total': total.summary()},
+                         ensure_ascii=False))
+    else:
+        print_summary(*current)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+class LogHistogram:
+    '''HDR 风格的对数分桶直方图，记录非负整数（比如微秒）
+
+    小于 2*S 的值每个值一个桶，之后每翻一倍分成 S 个桶（S = 2**sub_bits），
+    相对误差不超过 1/S。桶计数存在字典里，只占用出现过的桶；两个直方图直接按桶相加即可合并。
+    '''
+
+    def __init__(self, sub_bits=7):
+        self.sub_bits = sub_bits
+        self.counts = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def _index(self, value):
+        size = 1 << self.sub_bits
+        if value < 2 * size:
+            return value
+        shift = value.bit_length() - self.sub_bits - 1
+        return (shift + 1) * size + (value >> shift) - size
+
+    def _lower(self, index):
+        size = 1 << self.sub_bits
+        if index < 2 * size:
+            return index
+        shift = index // size - 1
+        return (index - shift * size) << shift
+
+    def _upper(self, index):
+        return self._lower(index + 1) - 1
+
+    def record(self, value, n=1):
+        value = int(value)
+        if value < 0:
+            value = 0
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + n
+        self.count += n
+        self.total += value * n
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        '''把另一个直方图并入自己，两者的 sub_bits 必须相同'''
+        if other.sub_bits != self.sub_bits:
+            raise ValueError('cannot merge histograms with different precision')
+        for index, n in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + n
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+        return self
+
+    def percentile(self, p):
+        '''p 取 0~100，返回所在桶的中点，并限制在实际的最小、最大值之间'''
+        if not self.count:
+            return None
+        rank = max(1, -(-self.count * p // 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                value = (self._lower(index) + self._upper(index)) // 2
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    def summary(self, percentiles=(50, 90, 99, 99.9)):
+        result = {'count': self.count, 'min': self.min, 'mean': self.mean, 'max': self.max}
+        for p in percentiles:
+            result['p{:g}'.format(p)] = self.percentile(p)
+        return result
+
+    def to_dict(self):
+        return {'sub_bits': self.sub_bits, 'counts': {str(k): v for k, v in self.counts.items()},
+                'count': self.count, 'total': self.total, 'min': self.min, 'max': self.max}
+
+    @classmethod
+    def from_dict(cls, data):
+        hist = cls(data['sub_bits'])
+        hist.counts = {int(k): v for k, v in data['counts'].items()}
+        hist.count = data['count']
+        hist.total = data['total']
+        hist.min = data['min']
+        hist.max = data['max']
+        return hist
@@ -0,0 +1,152 @@
+import csv
+import io
+import sys
+import time
+
+from classifyTree import PARENT_COL
+from pgsqlPool import get_conn
+
+LEAF_TABLE = 't_modelrule_classify_leaf'
+LEAF_COLUMNS = (('ftenant_id', 'varchar(64) not null'), ('fnode_id', 'varchar(64) not null'),
+                ('fdepth', 'integer not null'), ('fpath', 'text not null'))
+
+
+def leaf_path(tree, node_id):
+    '''从根到叶子的 id 路径，用 / 连接；最多走 len(nodes) 步'''
+    path = [node_id]
+    for i in range(len(tree.nodes)):
+        if node_id == tree.root or node_id not in tree.nodes:
+            break
+        node_id = tree.nodes[node_id][PARENT_COL]
+        path.append(node_id)
+    path.reverse()
+    return '/'.join(path)
+
+
+def leaf_records(tenant_id, tree):
+    '''生成一个租户的叶子行 (租户, 节点, 深度, 路径)'''
+    index = tree.index
+    for node_id in tree.leaves:
+        yield tenant_id, node_id, index.depth(node_id), leaf_path(tree, node_id)
+
+
+class RecordStream:
+    '''把记录迭代器包装成 copy_expert 可读的文件对象，边生成边发送，不在内存里拼出整个 CSV'''
+
+    def __init__(self, records):
+        self._records = iter(records)
+        self._buf = io.StringIO()
+        self._writer = csv.writer(self._buf, lineterminator='\n')
+        self._pending = ''
+        self.rows = 0
+
+    def read(self, size=-1):
+        size = size if size and size > 0 else 1 << 16
+        while len(self._pending) < size:
+            record = next(self._records, None)
+            if record is None:
+                break
+            self._writer.writerow(record)
+            self.rows += 1
+            if self._buf.tell() >= 1 << 14:
+                self._pending += self._buf.getvalue()
+                self._buf.seek(0)
+                self._buf.truncate()
+        if len(self._pending) < size:
+            self._pending += self._buf.getvalue()
+            self._buf.seek(0)
+            self._buf.truncate()
+        data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
+
+def copy_swap(records, table, columns, indexes=(), tenants=None):
+    '''用 COPY ... FROM STDIN 把记录装进临时表，再在同一个事务里换进正式表
+
+    columns 是建表的列定义，如 (('ftenant_id', 'varchar(64) not null'), ...)，第一列必须是租户 id；
+    indexes 是要建的索引列元组，第 i 个索引名为 表名_idx{i}，两种方式建出的索引同名。
+    tenants 为 None 时整表替换：临时表建好索引后改名成正式表，记录必须覆盖所有租户，
+    否则没出现的租户的行会丢掉。给出 tenants（可以是 COPY 过程中才填满的列表）时只替换这些租户：
+    删掉它们的旧行再从临时表插入，其他租户不受影响。两种方式读者在提交前看到的都是旧数据。
+    返回写入的行数。
+    '''
+    staging = table + '_staging'
+    stream = RecordStream(records)
+    column_defs = ', '.join(name + ' ' + kind for name, kind in columns)
+    column_names = ', '.join(name for name, kind in columns)
+    tenant_col = columns[0][0]
+    with get_conn() as conn:
+        try:
+            with conn.cursor() as cur:
+                if tenants is None:
+                    cur.execute("drop table if exists " + staging)
+                    cur.execute("create table " + staging + " (" + column_defs + ")")
+                else:
+                    cur.execute("create temp table " + staging + " (" + column_defs + ") on commit drop")
+                cur.copy_expert("copy " + staging + " (" + column_names + ") from stdin with (format csv)", stream)
+                if tenants is None:
+                    # 装完数据再建索引，比边插入边维护索引快
+                    for i, index in enumerate(indexes):
+                        cur.execute("create index {}_idx{} on {} ({})".format(staging, i, staging, ', '.join(index)))
+                    cur.execute("drop table if exists " + table)
+                    cur.execute("alter table " + staging + " rename to " + table)
+                    # 索引名和按租户替换时一样是 表名_idx序号，之后按租户刷新不会再建一份重复的索引
+                    for i in range(len(indexes)):
+                        cur.execute("alter index {}_idx{} rename to {}_idx{}".format(staging, i, table, i))
+                else:
+                    cur.execute("create table if not exists " + table + " (" + column_defs + ")")
+                    for i, index in enumerate(indexes):
+                        cur.execute("create index if not exists {}_idx{} on {} ({})".format(
+                            table, i, table, ', '.join(index)))
+                    cur.execute("delete from " + table + " where " + tenant_col + " = any(%s)", (list(tenants),))
+                    cur.execute("insert into " + table + " (" + column_names + ") select " + column_names +
+                                " from " + staging)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    return stream.rows
+
+
+def tenant_records(tenant_trees, make_records, tenants):
+    '''展开 (租户 id, 树) 为记录，同时把遇到的租户 id 记进 tenants，没有记录的租户也会被记下'''
+    if hasattr(tenant_trees, 'items'):
+        tenant_trees = tenant_trees.items()
+    for tenant_id, tree in tenant_trees:
+        tenants.append(tenant_id)
+        yield from make_records(tenant_id, tree)
+
+
+def write_leaves(tenant_trees, table=LEAF_TABLE, full=False):
+    '''把租户的叶子批量写入叶子表，tenant_trees 是 {租户 id: ClassifyTree} 或 (租户 id, 树) 的迭代器
+
+    默认只替换给出的这些租户的行；full=True 时整表替换，tenant_trees 必须包含所有租户。
+    '''
+    tenants = []
+    records = tenant_records(tenant_trees, leaf_records, tenants)
+    return copy_swap(records, table, LEAF_COLUMNS, [('ftenant_id', 'fnode_id')], None if full else tenants)
+
+
+def read_leaves(tenant_id=None, table=LEAF_TABLE):
+    '''用 COPY ... TO STDOUT 批量读回叶子行，返回 [(租户, 节点, 深度, 路径)]'''
+    out = io.StringIO()
+    with get_conn() as conn:
+        with conn.cursor() as cur:
+            query = "select ftenant_id, fnode_id, fdepth, fpath from " + table
+            if tenant_id is not None:
+                query = cur.mogrify(query + " where ftenant_id = %s", (tenant_id,)).decode('utf-8')
+            cur.copy_expert("copy (" + query + ") to stdout with (format csv)", out)
+        conn.rollback()
+    out.seek(0)
+    return [(t, n, int(d), p) for t, n, d, p in csv.reader(out)]
+
+
+if __name__ == '__main__':
+    # 把指定租户的叶子写回数据库，其他租户的行保持不变：python leafCopy.py 租户id [租户id ...]
+    from classifyTree import ClassifyTree
+    from pgsqlPool import fetch_classify, close_pool
+    tenants = sys.argv[1:] or ['39ca61dfcfac43dca8d5cdb0f1cfddf1']
+    t0 = time.perf_counter()
+    n = write_leaves((tenant_id, ClassifyTree(fetch_classify(tenant_id)[0])) for tenant_id in tenants)
+    print('{} leaf rows written in {:.3f}s'.format(n, time.perf_counter() - t0))
+    close_pool()
@@ -0,0 +1,145 @@
+import argparse
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+
+from latencyHistogram import LogHistogram
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def make_target(mode, port=8765):
+    '''返回一个工厂，每个压测线程调用它得到自己的 call(a, b)，worker 模式下每个线程一条长连接
+
+    call 带 close 属性时，线程退出时调用它释放连接。
+    '''
+    if mode == 'inproc':
+        from jmeterTest import add_numbers
+        return lambda: lambda a, b: add_numbers(a, b, echo=False)
+    if mode == 'subprocess':
+        script = os.path.join(HERE, 'jmeterTest.py')
+
+        def factory():
+            def call(a, b):
+                subprocess.run([sys.executable, script, str(a), str(b)], check=True, stdout=subprocess.DEVNULL)
+            return call
+        return factory
+    if mode == 'worker':
+        from jmeterClient import AddNumbersClient
+
+        def factory():
+            client = AddNumbersClient(port=port)
+
+            def call(a, b):
+                return client.add_numbers(a, b)
+            call.close = client.close
+            return call
+        return factory
+    raise ValueError('unknown mode: ' + mode)
+
+
+def run_load(factory, concurrency=1, duration=5.0, rate=0.0, requests=0):
+    '''按并发数（闭环）或目标速率（开环）压测，返回 (纳秒直方图, 完成数, 错误数, 实际耗时)
+
+    开环模式下延迟从计划发送时刻算起，目标处理不过来时排队的时间也算进延迟，
+    避免只统计"发得出去的请求"而低估尾延迟（coordinated omission）。
+    '''
+    hists = [LogHistogram() for i in range(concurrency)]
+    errors = [0] * concurrency
+    start = time.perf_counter() + 0.05
+    deadline = start + duration
+    per_thread = max(1, requests // concurrency) if requests else 0
+    interval = concurrency / rate if rate else 0.0
+
+    def worker(k):
+        call = factory()
+        try:
+            rnd = random.Random(k)
+            hist = hists[k]
+            n = 0
+            planned = start + interval * k / concurrency
+            delay = start - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            while True:
+                if per_thread and n >= per_thread:
+                    break
+                if interval:
+                    now = time.perf_counter()
+                    if planned > now:
+                        time.sleep(planned - now)
+                    t0 = planned
+                    planned += interval
+                else:
+                    t0 = time.perf_counter()
+                if t0 >= deadline and not per_thread:
+                    break
+                try:
+                    call(rnd.randint(0, 1000), rnd.randint(0, 1000))
+                except Exception:
+                    errors[k] += 1
+                hist.record((time.perf_counter() - t0) * 1e9)  # 纳秒，进程内调用也能分辨
+                n += 1
+        finally:
+            if hasattr(call, 'close'):
+                call.close()
+
+    threads = [threading.Thread(target=worker, args=(k,)) for k in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    total = LogHistogram()
+    for hist in hists:
+        total.merge(hist)
+    return total, total.count, sum(errors), elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='add_numbers 压测：进程内、子进程或常驻 worker')
+    parser.add_argument('--mode', choices=('inproc', 'subprocess', 'worker', 'all'), default='all')
+    parser.add_argument('--concurrency', type=int, default=1)
+    parser.add_argument('--duration', type=float, default=3.0)
+    parser.add_argument('--rate', type=float, default=0.0, help='目标总速率（次/秒），0 表示不限速')
+    parser.add_argument('--requests', type=int, default=0, help='总请求数，设置后忽略 duration')
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    modes = ('inproc', 'subprocess', 'worker') if args.mode == 'all' else (args.mode,)
+    server = None
+    if 'worker' in modes:
+        # 没有现成的 worker 时在本进程起一个，测完关掉
+        from jmeterClient import AddNumbersClient
+        probe = AddNumbersClient(port=args.port)
+        try:
+            probe.add_numbers(1, 1)
+        except OSError:
+            from http.server import ThreadingHTTPServer
+            from jmeterTest import AddNumbersHandler
+            server = ThreadingHTTPServer(('127.0.0.1', args.port), AddNumbersHandler)
+            server.daemon_threads = True
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+        finally:
+            probe.close()
+
+    print('{:<11} {:>9} {:>11} {:>9} {:>9} {:>9} {:>9} {:>7}'.format(
+        'mode', 'requests', 'req/s', 'p50(us)', 'p90', 'p99', 'p99.9', 'errors'))
+    try:
+        for mode in modes:
+            hist, n, errors, elapsed = run_load(make_target(mode, args.port), args.concurrency,
+                                                args.duration, args.rate, args.requests)
+            print('{:<11} {:>9} {:>11.1f} {:>9.1f} {:>9.1f} {:>9.1f} {:>9.1f} {:>7}'.format(
+                mode, n, n / elapsed, hist.percentile(50) / 1000, hist.percentile(90) / 1000,
+                hist.percentile(99) / 1000, hist.percentile(99.9) / 1000, errors))
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == '__main__':
+    main()
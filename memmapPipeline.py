@@ -0,0 +1,128 @@
+import sys
+import time
+
+import numpy as np
+
+BLOCK = 1 << 20  # 每块的元素个数
+
+
+def create_random(path, n, low=1, high=100, dtype=np.int64, block=BLOCK, seed=0):
+    '''按块生成 np.random.randint(low, high, size=n) 写进 memmap 文件，内存占用只有一块'''
+    rng = np.random.RandomState(seed)
+    mm = np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=(n,))
+    for start in range(0, n, block):
+        stop = min(start + block, n)
+        mm[start:stop] = rng.randint(low, high, size=stop - start)
+    mm.flush()
+    return mm
+
+
+def open_array(path):
+    '''只读映射 .npy 文件'''
+    return np.load(path, mmap_mode='r')
+
+
+class Sum:
+    def __init__(self, dtype=np.float64):
+        self.dtype = dtype
+        self.value = dtype(0)
+
+    def update(self, block):
+        self.value += block.sum(dtype=self.dtype)
+
+    def result(self):
+        return self.value
+
+
+class MinMax:
+    def __init__(self):
+        self.min = None
+        self.max = None
+
+    def update(self, block):
+        if not len(block):
+            return
+        lo, hi = block.min(), block.max()
+        self.min = lo if self.min is None else min(self.min, lo)
+        self.max = hi if self.max is None else max(self.max, hi)
+
+    def result(self):
+        return self.min, self.max
+
+
+class Histogram:
+    '''固定分箱的直方图，各块的计数直接相加；分箱必须事先给定，不能依赖全局最小、最大值'''
+
+    def __init__(self, bins, range):
+        self.edges = np.linspace(range[0], range[1], bins + 1)
+        self.counts = np.zeros(bins, dtype=np.int64)
+
+    def update(self, block):
+        self.counts += np.histogram(block, bins=self.edges)[0]
+
+    def result(self):
+        return self.counts, self.edges
+
+
+class Pipeline:
+    '''在 memmap 数组上按块流式处理：先依次做逐元素变换，再把结果交给各个归约器，可选写出到新的 memmap
+
+    每次只有一块（加上变换的中间结果）在内存里，所以同一段代码能处理 10^6 到 10^10 个元素。
+    '''
+
+    def __init__(self, source, block=BLOCK):
+        self.source = source
+        self.block = block
+        self.transforms = []
+
+    def map(self, func):
+        '''追加一个逐元素变换 func(block) -> block'''
+        self.transforms.append(func)
+        return self
+
+    def run(self, *reducers, out_path=None, out_dtype=None):
+        '''跑一遍数据，返回各归约器的结果列表；给出 out_path 时把变换后的数据写成 .npy'''
+        source = self.source
+        n = len(source)
+        out = None
+        for start in range(0, n, self.block):
+            block = np.asarray(source[start:start + self.block])
+            for func in self.transforms:
+                block = func(block)
+            if out_path is not None:
+                if out is None:
+                    out = np.lib.format.open_memmap(out_path, mode='w+', dtype=out_dtype or block.dtype, shape=(n,))
+                out[start:start + len(block)] = block
+            for reducer in reducers:
+                reducer.update(block)
+        if out is not None:
+            out.flush()
+            del out
+        return [reducer.result() for reducer in reducers]
+
+
+if __name__ == '__main__':
+    # python memmapPipeline.py [元素个数] [文件]：生成 randint(1, 100) 数据，流式求 1.0/values 的和、最值和直方图
+    # 默认 10^7 个元素（80 MB），不给文件名时写到临时目录，跑完删除
+    import os
+    import tempfile
+    n = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 7
+    tmpdir = None
+    if len(sys.argv) > 2:
+        path = sys.argv[2]
+    else:
+        tmpdir = tempfile.TemporaryDirectory()
+        path = os.path.join(tmpdir.name, 'values.npy')
+    try:
+        t0 = time.perf_counter()
+        create_random(path, n)
+        t1 = time.perf_counter()
+        total, (lo, hi), (counts, edges) = Pipeline(open_array(path)).map(lambda v: 1.0 / v).run(
+            Sum(), MinMax(), Histogram(10, (0.0, 1.0)))
+        t2 = time.perf_counter()
+        print('n={} create {:.2f}s  pipeline {:.2f}s ({:.0f} M elements/s)'.format(
+            n, t1 - t0, t2 - t1, n / (t2 - t1) / 1e6))
+        print('sum={:.6f} min={:.6f} max={:.6f} histogram={}'.format(total, lo, hi, counts.tolist()))
+    finally:
+        if tmpdir is not None:
+            tmpdir.cleanup()
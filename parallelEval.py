@@ -0,0 +1,66 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# 每块的目标字节数：输入和输出加起来能放进 L2 缓存
+CHUNK_BYTES = 256 * 1024
+
+_executors = {}
+
+
+def get_executor(workers):
+    '''按线程数复用线程池，避免每次求值都创建线程'''
+    executor = _executors.get(workers)
+    if executor is None:
+        executor = _executors[workers] = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='np-eval')
+    return executor
+
+
+def chunk_bounds(n, chunk):
+    return [(start, min(start + chunk, n)) for start in range(0, n, chunk)]
+
+
+def parallel_apply(func, *arrays, out=None, dtype=None, workers=None, chunk=None):
+    '''把逐元素表达式切块后在线程池里并行求值，结果写进预分配的 out
+
+    func(*输入块, out=输出块) 必须只做逐元素运算并写入 out，比如
+    lambda v, out: np.divide(1.0, v, out=out)。NumPy 的 ufunc 在计算时会释放 GIL，
+    所以多个线程能同时跑在不同的核上；每块不大于缓存，减少访存。
+    输入是一维数组（或等长的多个数组），返回 out。
+    '''
+    arrays = [np.asarray(a) for a in arrays]
+    n = len(arrays[0])
+    if any(len(a) != n for a in arrays):
+        raise ValueError('input arrays must have the same length')
+    if out is None:
+        out = np.empty(n, dtype=dtype or np.result_type(*arrays, 1.0))
+    if len(out) != n:
+        raise ValueError('out must have the same length as the inputs')
+    workers = workers or os.cpu_count() or 1
+    if chunk is None:
+        itemsize = sum(a.itemsize for a in arrays) + out.itemsize
+        chunk = max(CHUNK_BYTES // itemsize, 1024)
+
+    def run(bounds):
+        for start, stop in bounds:
+            func(*(a[start:stop] for a in arrays), out=out[start:stop])
+
+    bounds = chunk_bounds(n, chunk)
+    if not bounds:
+        return out
+    if workers == 1 or len(bounds) == 1:
+        run(bounds)
+        return out
+    # 每个线程拿一段连续的块，而不是每块一个任务，减少调度开销
+    per_worker = max(1, -(-len(bounds) // workers))
+    groups = [bounds[i:i + per_worker] for i in range(0, len(bounds), per_worker)]
+    for future in [get_executor(workers).submit(run, group) for group in groups]:
+        future.result()
+    return out
+
+
+def reciprocal(values, out=None, workers=None):
+    '''qt101_testPyQt.py 中 1.0/values 的多线程版本'''
+    return parallel_apply(lambda v, out: np.divide(1.0, v, out=out), values, out=out, dtype=np.float64,
+                          workers=workers)
@@ -0,0 +1,86 @@
+import asyncio
+import sys
+import time
+
+import asyncpg
+
+from classifyTree import ClassifyTree
+from pgsqlPool import DB_CONFIG
+
+# asyncpg 用 $1 占位符，并且每个连接会自动缓存预编译语句
+CLASSIFY_SQL = "select * from t_modelrule_model_classify where ftenant_id = $1"
+TENANTS_SQL = "select distinct ftenant_id from t_modelrule_model_classify limit $1"
+
+
+async def create_pool(min_size=1, max_size=8, **config):
+    '''创建异步连接池，max_size 同时也是并发查询数的上限'''
+    config = config or DB_CONFIG
+    return await asyncpg.create_pool(min_size=min_size, max_size=max_size, database=config["database"],
+                                     user=config["user"], password=config["password"],
+                                     host=config["host"], port=int(config["port"]))
+
+
+async def fetch_classify(pool, tenant_id):
+    '''查询一个租户的分类表，返回的 Record 可以按列位置取值，能直接交给 ClassifyTree'''
+    async with pool.acquire() as conn:
+        return await conn.fetch(CLASSIFY_SQL, tenant_id)
+
+
+async def load_tree(pool, tenant_id):
+    rows = await fetch_classify(pool, tenant_id)
+    return ClassifyTree(rows)
+
+
+async def load_trees(pool, tenant_ids):
+    '''并发加载多个租户的树，并发度由连接池大小限制，返回 {租户 id: 树}'''
+    trees = await asyncio.gather(*(load_tree(pool, tenant_id) for tenant_id in tenant_ids))
+    return dict(zip(tenant_ids, trees))
+
+
+async def fetch_tenants(pool, limit):
+    async with pool.acquire() as conn:
+        return [row[0] for row in await conn.fetch(TENANTS_SQL, limit)]
+
+
+def bench_blocking(tenant_ids):
+    '''阻塞方式：连接池 + 预编译语句，但逐个租户串行查询'''
+    from pgsqlPool import fetch_classify as fetch_blocking, close_pool
+    for tenant_id in tenant_ids[:1]:  # 预热，和异步方式一样用切片，没有租户时跳过
+        fetch_blocking(tenant_id)
+    t0 = time.perf_counter()
+    for tenant_id in tenant_ids:
+        rows, description = fetch_blocking(tenant_id)
+        ClassifyTree(rows)
+    elapsed = time.perf_counter() - t0
+    close_pool()
+    return elapsed
+
+
+async def bench_async(pool, tenant_ids):
+    t0 = time.perf_counter()
+    await load_trees(pool, tenant_ids)
+    return time.perf_counter() - t0
+
+
+async def main(n_tenants, repeat, pool_size):
+    pool = await create_pool(max_size=pool_size, **DB_CONFIG)
+    try:
+        tenant_ids = await fetch_tenants(pool, n_tenants)
+        # 不足 n_tenants 个租户时重复使用，保证每种方式的请求数相同
+        tenant_ids = (tenant_ids * (n_tenants // max(len(tenant_ids), 1) + 1))[:n_tenants] * repeat
+        await load_trees(pool, tenant_ids[:pool_size])  # 预热
+        elapsed = await bench_async(pool, tenant_ids)
+    finally:
+        await pool.close()
+    blocking = bench_blocking(tenant_ids)
+    for name, seconds in (("blocking", blocking), ("async", elapsed)):
+        print("{:<10} {} loads in {:.3f}s, {:.1f} trees/s".format(name, len(tenant_ids), seconds, len(tenant_ids) / seconds))
+
+
+if __name__ == '__main__':
+    # 吞吐基准：python pgsqlAsync.py [租户数] [重复次数] [连接池大小] [host]，默认连本机 PostgreSQL
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    size = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+    DB_CONFIG["host"] = sys.argv[4] if len(sys.argv) > 4 else "127.0.0.1"
+    asyncio.run(main(n, repeat, size))
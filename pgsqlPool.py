@@ -0,0 +1,144 @@
+import sys
+import time
+import weakref
+from contextlib import contextmanager
+
+import psycopg2
+from psycopg2 import errors, pool
+
+# 数据库连接参数，与 pgsqlTEST.py 原来写死的一致
+DB_CONFIG = {"database": "jspro_test", "user": "jspro", "password": "AglbCVss", "host": "10.0.10.77", "port": "5432"}
+
+TENANT_ID = '39ca61dfcfac43dca8d5cdb0f1cfddf1'
+
+CLASSIFY_SQL = "select * from t_modelrule_model_classify where ftenant_id = %s"
+
+# 服务端预编译语句，按 ftenant_id 参数化，每个连接只需 PREPARE 一次
+PREPARE_NAME = 'classify_by_tenant'
+PREPARE_SQL = "prepare " + PREPARE_NAME + " (text) as select * from t_modelrule_model_classify where ftenant_id = $1"
+
+# 更新时间列，用于变更探测和增量同步
+UPDATED_COL = 'updated_at'
+FINGERPRINT_SQL = "select count(*), max(" + UPDATED_COL + ") from t_modelrule_model_classify where ftenant_id = %s"
+CHANGES_SQL = ("select * from t_modelrule_model_classify where ftenant_id = %s and " + UPDATED_COL + " >= %s"
+               " order by " + UPDATED_COL)
+
+_pool = None
+# 已经 PREPARE 过的连接对象；弱引用，连接被池关闭回收后自动移除，不会和新连接混淆
+_prepared = weakref.WeakSet()
+
+
+def get_pool(minconn=1, maxconn=8, **config):
+    '''取得全局连接池，第一次调用时创建'''
+    global _pool
+    if _pool is None:
+        _pool = pool.ThreadedConnectionPool(minconn, maxconn, **(config or DB_CONFIG))
+    return _pool
+
+
+def close_pool():
+    '''关闭连接池中的所有连接'''
+    global _pool
+    if _pool is not None:
+        _pool.closeall()
+        _pool = None
+        _prepared.clear()
+
+
+@contextmanager
+def get_conn():
+    '''从连接池借出一个连接，用完归还'''
+    p = get_pool()
+    conn = p.getconn()
+    try:
+        yield conn
+    finally:
+        p.putconn(conn)
+
+
+def _ensure_prepared(conn, cur):
+    if conn not in _prepared:
+        cur.execute(PREPARE_SQL)
+        _prepared.add(conn)
+
+
+def fetch_classify(tenant_id=TENANT_ID):
+    '''通过连接池和预编译语句查询租户的分类表，返回 (rows, description)'''
+    with get_conn() as conn:
+        with conn.cursor() as cur:
+            _ensure_prepared(conn, cur)
+            try:
+                cur.execute("execute " + PREPARE_NAME + " (%s)", (tenant_id,))
+            except errors.InvalidSqlStatementName:
+                # 服务端会话被重置过（比如 DISCARD ALL），预编译语句已经不在了，重新 PREPARE 一次
+                conn.rollback()
+                cur.execute(PREPARE_SQL)
+                cur.execute("execute " + PREPARE_NAME + " (%s)", (tenant_id,))
+            rows = cur.fetchall()
+            description = cur.description
+        # 只读查询，结束事务避免连接在池中处于 idle in transaction
+        conn.rollback()
+    return rows, description
+
+
+def fetch_fingerprint(tenant_id=TENANT_ID):
+    '''廉价的变更探测：返回租户的 (行数, max(更新时间))，任何增删改都会改变它'''
+    with get_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(FINGERPRINT_SQL, (tenant_id,))
+            fingerprint = cur.fetchone()
+        conn.rollback()
+    return fingerprint
+
+
+def fetch_changes(tenant_id, since):
+    '''增量同步：取更新时间不早于水位线 since 的行（包括软删除的行），按更新时间排序
+
+    用 >= 是为了不漏掉与水位线同一时刻的行，重复应用同一行是幂等的。
+    '''
+    with get_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(CHANGES_SQL, (tenant_id, since))
+            rows = cur.fetchall()
+            description = cur.description
+        conn.rollback()
+    return rows, description
+
+
+def fetch_classify_direct(tenant_id=TENANT_ID):
+    '''原来的方式：每次新建连接，发送临时 SQL'''
+    conn = psycopg2.connect(**DB_CONFIG)
+    try:
+        cur = conn.cursor()
+        cur.execute("select * from t_modelrule_model_classify where ftenant_id = '" + tenant_id + "'")
+        return cur.fetchall(), cur.description
+    finally:
+        conn.close()
+
+
+def bench(func, n, tenant_id):
+    '''执行 n 次 func，返回每次耗时（毫秒），已排序'''
+    times = []
+    for i in range(n):
+        t0 = time.perf_counter()
+        func(tenant_id)
+        times.append((time.perf_counter() - t0) * 1000)
+    times.sort()
+    return times
+
+
+def percentile(times, p):
+    return times[min(len(times) - 1, int(len(times) * p))]
+
+
+if __name__ == '__main__':
+    # 延迟基准：python pgsqlPool.py [次数] [host]，默认连本机 PostgreSQL
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    DB_CONFIG["host"] = sys.argv[2] if len(sys.argv) > 2 else "127.0.0.1"
+    get_pool(**DB_CONFIG)
+    fetch_classify(TENANT_ID)  # 预热，完成 PREPARE
+    for name, func in (("direct", fetch_classify_direct), ("pool+prepared", fetch_classify)):
+        times = bench(func, n, TENANT_ID)
+        print("{:<15} n={} p50={:.3f}ms p90={:.3f}ms p99={:.3f}ms".format(
+            name, n, percentile(times, 0.5), percentile(times, 0.9), percentile(times, 0.99)))
+    close_pool()
@@ -1,18 +1,12 @@
-import psycopg2
+from classifyTree import ClassifyTree
+from pgsqlPool import fetch_classify, close_pool
 
-conn = psycopg2.connect(database="jspro_test",user="jspro",password="AglbCVss",host="10.0.10.77",port="5432")
-cur = conn.cursor()
-
-cur.execute("select * from t_modelrule_model_classify where ftenant_id = '39ca61dfcfac43dca8d5cdb0f1cfddf1'")
-
-#获取结果集的每一行
-rows = cur.fetchall()
+# 通过连接池和预编译语句查询，租户 ID 作为参数传入
+#获取结果集的每一行，以及所有字段名
+rows, all_fields = fetch_classify('39ca61dfcfac43dca8d5cdb0f1cfddf1')
 # print(len(rows))
 # print(rows[11][12])
 
-#获取所有字段名
-all_fields = cur.description
-
 # field_messages = []
 
 # for i in range(len(all_fields)):
@@ -29,32 +23,17 @@ all_fields = cur.description
 #         row_messages.append("{str:<{len}}".format(str=str(row[j]),len=50))
 #     row_message = "".join(row_messages)
 #     print(row_message)
-row_minid = []
-def find_next(parent_id):
-    row_minidb = []
-    row_ida =[]
-    for parent_idb in parent_id:
-        row_idb = []
-        for i in range(len(rows)):
-            if rows[i][10] == 0 and rows[i][12] == parent_idb:
-                row_idb.append(rows[i][0])
-                row_ida.append(rows[i][0])
-        if len(row_idb) == 0:
-            row_minidb.append(parent_idb)
-    return row_ida,row_minidb
-
-row_ida = ["rootid"]
-while len(row_ida):
-    row_ida, row_minida = find_next(row_ida)
-    row_minid = row_minid + row_minida
+# 按层遍历找叶子节点，用 visited 集合保证每个节点只访问一次，
+# 数据里有环或重复 id 时也能结束，同时报告环、孤儿和不可达子树
+tree = ClassifyTree(rows)
+row_minid = tree.leaves
 
 print(row_minid)
 
-
-# parent_id = ["7e9dcd7d54bc4fc694b50c7de0f60893"]
-# print(find_next(parent_id))
-# print(row_minid)
-
+report = tree.diagnose()
+if report['cycles'] or report['orphans'] or report['repeated']:
+    print('数据异常：环 {}，孤儿 {}，重复到达 {}，不可达节点 {}'.format(
+        len(report['cycles']), len(report['orphans']), len(report['repeated']), len(report['unreachable'])))
 
 
-conn.close()
\ No newline at end of file
+close_pool()
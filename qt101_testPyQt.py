@@ -13,4 +13,6 @@ import numpy as np
 import timeit
 np.random.seed(0)
 values = np.random.randint(1,100,size=1000000)
-timeit.timeit(result = 1.0/values)
+# timeit.timeit(result = 1.0/values) 会先算好 1.0/values 再把结果当关键字参数传进去，什么都没计时；
+# 要计时的语句得作为可调用对象传入。几种写法的完整对比见 python benchHarness.py benchReciprocal
+print(timeit.timeit(lambda: 1.0/values, number=100) / 100)
@@ -0,0 +1,171 @@
+import argparse
+import os
+import sys
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from apiRunner import EVENT_API_ENV, get_session, load_tests, run_one
+from latencyHistogram import LogHistogram
+
+
+class CaptureAdapter(HTTPAdapter):
+    '''正常发送请求，同时记下每个请求的方法、地址和请求体'''
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.captured = []
+
+    def send(self, request, **kwargs):
+        self.captured.append((request.method, request.url, request.body))
+        return super().send(request, **kwargs)
+
+
+def capture_requests(tests):
+    '''把用例跑一遍，收集它们发出的请求，作为压测要重放的请求集合'''
+    session = get_session()
+    saved = dict(session.adapters)
+    adapter = CaptureAdapter()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    try:
+        results = [run_one(test) for test in tests]
+    finally:
+        session.adapters.clear()
+        session.adapters.update(saved)
+    failed = [r for r in results if r[1] in ('FAIL', 'ERROR')]
+    if failed:
+        raise RuntimeError('test {} failed before soak: {}'.format(failed[0][0], failed[0][3]))
+    return adapter.captured
+
+
+def run_soak(reqs, rate=100.0, duration=60.0, window=5.0, connections=4, timeout=5.0):
+    '''按固定总速率（开环）轮流重放请求，返回 (各时间窗口的微秒直方图列表, 总直方图, 错误数)
+
+    每个线程一个 Session，一条长连接；延迟从计划发送时刻算起，服务变慢时排队时间也计入。
+    状态码不是 2xx 或者请求异常都算错误。
+    '''
+    nwin = max(1, int(-(-duration // window)))
+    hists = [[LogHistogram() for w in range(nwin)] for k in range(connections)]
+    errors = [0] * connections
+    interval = connections / rate
+    start = time.perf_counter() + 0.05
+    deadline = start + duration
+
+    def worker(k):
+        session = requests.Session()
+        session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        planned = start + interval * k / connections
+        i = k
+        while planned < deadline:
+            now = time.perf_counter()
+            if planned > now:
+                time.sleep(planned - now)
+            method, url, body = reqs[i % len(reqs)]
+            try:
+                r = session.request(method, url, data=body, timeout=timeout)
+                r.content
+                if not 200 <= r.status_code < 300:
+                    errors[k] += 1
+            except requests.RequestException:
+                errors[k] += 1
+            hists[k][min(int((planned - start) / window), nwin - 1)].record((time.perf_counter() - planned) * 1e6)
+            planned += interval
+            i += connections
+        session.close()
+
+    threads = [threading.Thread(target=worker, args=(k,), name='soak-{}'.format(k)) for k in range(connections)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    windows = [LogHistogram() for w in range(nwin)]
+    for per_thread in hists:
+        for w, hist in enumerate(per_thread):
+            windows[w].merge(hist)
+    total = LogHistogram()
+    for hist in windows:
+        total.merge(hist)
+    return windows, total, sum(errors)
+
+
+def drift(windows, p=99):
+    '''延迟漂移：后三分之一窗口的 p 分位中位数 / 前三分之一窗口的，返回 (比值, 前段微秒, 后段微秒)
+
+    第一个窗口包含建连和预热，不参与比较；窗口太少时返回 (1.0, None, None)。
+    '''
+    values = [hist.percentile(p) for hist in windows[1:] if hist.count]
+    if len(values) < 3:
+        return 1.0, None, None
+    third = len(values) // 3
+    head = sorted(values[:third])[third // 2]
+    tail = sorted(values[-third:])[third // 2]
+    return tail / max(head, 1), head, tail
+
+
+def check(windows, total, errors, slo_p99, max_drift, min_drift_ms):
+    '''对照 SLO 检查压测结果，返回不满足的条件列表，空列表表示通过'''
+    problems = []
+    p99 = total.percentile(99) / 1000
+    if p99 > slo_p99:
+        problems.append('p99 {:.2f}ms exceeds SLO {:.2f}ms'.format(p99, slo_p99))
+    ratio, head, tail = drift(windows)
+    # 微秒级的抖动不算漂移，增量同时超过 min_drift_ms 才报
+    if head is not None and ratio > max_drift and (tail - head) / 1000 > min_drift_ms:
+        problems.append('p99 drifted from {:.2f}ms to {:.2f}ms ({:.2f}x)'.format(head / 1000, tail / 1000, ratio))
+    if errors:
+        problems.append('{} requests failed'.format(errors))
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='按固定速率重放接口用例的请求，检查延迟 SLO 和漂移')
+    parser.add_argument('modules', nargs='*', default=['test'], help='包含用例的模块')
+    parser.add_argument('-k', '--filter', help='只重放 id 包含这个字符串的用例')
+    parser.add_argument('--rate', type=float, default=100.0, help='总请求速率（次/秒）')
+    parser.add_argument('--duration', type=float, default=60.0, help='压测时长（秒）')
+    parser.add_argument('--window', type=float, default=5.0, help='统计窗口（秒）')
+    parser.add_argument('--connections', type=int, default=4, help='长连接数（线程数）')
+    parser.add_argument('--slo-p99', type=float, default=50.0, help='整体 p99 上限（毫秒）')
+    parser.add_argument('--max-drift', type=float, default=1.5, help='后段/前段 p99 的最大比值')
+    parser.add_argument('--min-drift-ms', type=float, default=1.0, help='p99 增量小于这个值时不算漂移')
+    parser.add_argument('--stub', action='store_true', help='启动本地 get_event_list 桩服务并对它压测')
+    args = parser.parse_args(argv)
+
+    server = None
+    if args.stub:
+        from eventStub import start_stub
+        server, url = start_stub()
+        os.environ[EVENT_API_ENV] = url
+    try:
+        reqs = capture_requests(load_tests(args.modules, args.filter))
+        if not reqs:
+            print('no requests captured')
+            return 1
+        windows, total, errors = run_soak(reqs, args.rate, args.duration, args.window, args.connections)
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+    print('{:>8} {:>8} {:>9} {:>9} {:>9} {:>9}'.format('window', 'requests', 'p50(ms)', 'p90', 'p99', 'max'))
+    for w, hist in enumerate(windows):
+        if hist.count:
+            print('{:>7.1f}s {:>8} {:>9.2f} {:>9.2f} {:>9.2f} {:>9.2f}'.format(
+                w * args.window, hist.count, hist.percentile(50) / 1000, hist.percentile(90) / 1000,
+                hist.percentile(99) / 1000, hist.max / 1000))
+    print('{} requests over {} distinct, {:.1f} req/s, p50 {:.2f}ms p99 {:.2f}ms p99.9 {:.2f}ms, {} errors'.format(
+        total.count, len(set(reqs)), total.count / args.duration, total.percentile(50) / 1000,
+        total.percentile(99) / 1000, total.percentile(99.9) / 1000, errors))
+    problems = check(windows, total, errors, args.slo_p99, args.max_drift, args.min_drift_ms)
+    for problem in problems:
+        print('FAIL: ' + problem)
+    if not problems:
+        print('PASS')
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
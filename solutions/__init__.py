@@ -0,0 +1,89 @@
+'''可直接导入的题解
+
+questionTest.py 和 HUAWEIquestionFile/HUAWEIanswer.py 里的题解都是注释掉的 while True: input() 循环，
+这里把它们改写成普通函数：参数和返回值是解析好的 int、list、str，不读写标准输入输出。
+
+题号的约定：
+  q<N>   questionTest.py 里按顺序的第 N 个题目文档字符串（从 1 开始）
+  hw<N>  HUAWEIanswer.py 里的 "# N" 题号；题号重复时第二个记为 hw<N>-2
+  hw<N>-s<K>  HUAWEIanswer.py 里 "# N" 之后没有题号、题面写在三引号字符串里的第 K 道题
+
+    from solutions import get
+    get('hw20')(100)              # 直接调用函数
+    get('hw20').run('100\\n')      # 按原题的标准输入格式求解，返回标准输出文本
+'''
+
+# 已注册的题解：题号 -> Solution
+SOLUTIONS = {}
+
+
+class Solution:
+    '''一道题的解法：func 是纯函数，parse 把标准输入文本解析成 func 的参数元组，format 把返回值转成输出文本'''
+
+    def __init__(self, problem_id, title, func, parse, format):
+        self.problem_id = problem_id
+        self.title = title
+        self.func = func
+        self.parse = parse
+        self.format = format
+
+    def __call__(self, *args):
+        return self.func(*args)
+
+    def run(self, text):
+        return self.format(self.func(*self.parse(text)))
+
+    def __repr__(self):
+        return '<Solution {} {}>'.format(self.problem_id, self.title)
+
+
+def lines(text):
+    '''按行切分标准输入，去掉每行首尾空白和空行'''
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+def ints(line, sep=None):
+    return [int(x) for x in line.split(sep)]
+
+
+def one_line(text):
+    return (lines(text)[0],)
+
+
+def format_lines(result):
+    '''列表每项一行，其余直接转成字符串'''
+    if isinstance(result, (list, tuple)):
+        return '\n'.join(format_spaced(x) if isinstance(x, (list, tuple)) else str(x) for x in result)
+    return str(result)
+
+
+def format_spaced(result):
+    return ' '.join(str(x) for x in result)
+
+
+def register(problem_id, title, parse=one_line, format=format_lines):
+    '''注册题解，可以叠加多次把同一个函数注册到多个题号下'''
+    def decorator(func):
+        if problem_id in SOLUTIONS:
+            raise ValueError('duplicate problem id: ' + problem_id)
+        SOLUTIONS[problem_id] = Solution(problem_id, title, func, parse, format)
+        return func
+    return decorator
+
+
+def get(key):
+    '''按题号或标题查找题解'''
+    solution = SOLUTIONS.get(key)
+    if solution is None:
+        for solution in SOLUTIONS.values():
+            if solution.title == key:
+                return solution
+        raise KeyError(key)
+    return solution
+
+
+def solve(key, text):
+    return get(key).run(text)
+
+
+from solutions import questions, huawei  # noqa: E402  导入时注册各题
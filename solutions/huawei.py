@@ -0,0 +1,1206 @@
+'''HUAWEIquestionFile/HUAWEIanswer.py 中的题目，题面见 HUAWEIquestion.md 中相同题号的图片
+
+md 27 是 hw26-2，md 28 是 hw27，其余题号和 HUAWEIanswer.py 相同。
+hw3 和 hw83 只有 md 里的图片，HUAWEIanswer.py 里没有，样例在 test_solutions.py 里。
+'''
+import heapq
+import json
+import math
+import re
+from bisect import bisect_left
+from collections import Counter, deque
+from itertools import combinations, groupby, permutations, product
+
+from solutions import format_spaced, ints, lines, register
+from solutions.questions import remaining_charset
+
+register('hw5', '剩余可用字符集')(remaining_charset)
+
+
+@register('hw1', '子序列最后一个字符的位置', parse=lambda text: tuple(lines(text)[:2]))
+def subsequence_end(s, target):
+    '''s 作为子序列在 target 中贪心匹配，返回匹配到 s 最后一个字符的下标，不是子序列时返回 -1'''
+    k = 0
+    for i, ch in enumerate(target):
+        if k < len(s) and ch == s[k]:
+            k += 1
+            if k == len(s):
+                return i
+    return -1
+
+
+@register('hw2', '山峰个数', parse=lambda text: (ints(lines(text)[0], ','),))
+def count_peaks(heights):
+    '''比左右相邻的元素都大的个数，两端只和一侧比较'''
+    n = len(heights)
+    return sum(1 for i, h in enumerate(heights)
+               if (i == 0 or h > heights[i - 1]) and (i == n - 1 or h > heights[i + 1]))
+
+
+def parse_letters(text):
+    letters, n = lines(text)[0].split()
+    return letters, int(n)
+
+
+@register('hw3', '构成指定长度字符串的个数', parse=parse_letters)
+def count_arrangements(letters, n):
+    '''每个字符只能用一次，相同字符不能相邻，输入非法时返回 0'''
+    if not (letters.isalpha() and letters.islower() and 0 < len(letters) <= 30 and 0 < n <= 5):
+        return 0
+    counts = Counter(letters)
+
+    def count(length, last):
+        if length == n:
+            return 1
+        total = 0
+        for c in counts:
+            if c != last and counts[c]:
+                counts[c] -= 1
+                total += count(length + 1, c)
+                counts[c] += 1
+        return total
+
+    return count(0, None)
+
+
+@register('hw4', '连续自然数之和', parse=lambda text: (int(lines(text)[0]),))
+def consecutive_sums(n):
+    '''n 表示成连续自然数之和的所有方式，按项数从少到多，最后一行是方式的个数'''
+    ways = [[n]]
+    for start in range(1, n):
+        total = 0
+        for k in range(start, n):
+            total += k
+            if total >= n:
+                break
+        if total == n:
+            ways.append(list(range(start, k + 1)))
+    ways.sort(key=len)
+    return ['{}={}'.format(n, '+'.join(map(str, way))) for way in ways] + ['result:{}'.format(len(ways))]
+
+
+@register('hw6', '密码输入检测')
+def check_password(s):
+    '''< 表示退格；退格后的密码长度至少 8 位且包含数字、大写、小写和特殊字符时为 true'''
+    chars = []
+    for ch in s:
+        if ch == '<':
+            if chars:
+                chars.pop()
+        else:
+            chars.append(ch)
+    res = ''.join(chars)
+    ok = (len(res) >= 8 and any(c.isdigit() for c in res) and any(c.isupper() for c in res)
+          and any(c.islower() for c in res) and any(not c.isalnum() for c in res))
+    return res + (',true' if ok else ',false')
+
+
+@register('hw8', '指定瑕疵度的元音子串', parse=lambda text: (int(lines(text)[0]), lines(text)[1]))
+def vowel_substring(n, s):
+    '''首尾都是元音、中间恰好有 n 个非元音字符的最长子串长度'''
+    vowels = [i for i, c in enumerate(s) if c in 'aeiouAEIOU']
+    best = 0
+    left = 0
+    for right in range(len(vowels)):
+        while vowels[right] - vowels[left] - (right - left) > n:
+            left += 1
+        if vowels[right] - vowels[left] - (right - left) == n:
+            best = max(best, vowels[right] - vowels[left] + 1)
+    return best
+
+
+@register('hw9', '两数组元素和最小的 k 对', parse=lambda text: (
+    ints(lines(text)[0])[1:], ints(lines(text)[1])[1:], int(lines(text)[2])))
+def smallest_pair_sums(a, b, k):
+    return sum(sorted(x + y for x in a for y in b)[:k])
+
+
+@register('hw10', '分差最小的选手', parse=lambda text: (
+    [tuple(ints(row)) for row in lines(text)[1:int(lines(text)[0]) + 1]],))
+def closest_scores(players):
+    '''players：(编号, 分数) 列表，返回按分数相邻、分差最小的编号对，小编号在前'''
+    ranked = sorted(players, key=lambda p: p[1])
+    pairs = [(min(a[0], b[0]), max(a[0], b[0]), b[1] - a[1]) for a, b in zip(ranked, ranked[1:])]
+    if not pairs:
+        return []
+    least = min(p[2] for p in pairs)
+    return sorted(p[:2] for p in pairs if p[2] == least)
+
+
+@register('hw11', '环形字符串中 o 出现偶数次的最长子串')
+def even_o_length(s):
+    return len(s) if s.count('o') % 2 == 0 else len(s) - 1
+
+
+@register('hw12', '最多还能种几棵树')
+def plant_count(s):
+    '''0 是空位；一个空位左右都空（或在边上）时可以种，种下后变成 1'''
+    plots = list(s)
+    count = 0
+    for i, c in enumerate(plots):
+        if c == '0' and (i == 0 or plots[i - 1] == '0') and (i == len(plots) - 1 or plots[i + 1] == '0'):
+            plots[i] = '1'
+            count += 1
+    return count
+
+
+@register('hw13', '环形数组加上下一个更小的数', parse=lambda text: (ints(lines(text)[0]),), format=format_spaced)
+def add_next_smaller(values):
+    n = len(values)
+    result = list(values)
+    stack = []  # 还没找到更小数的下标，对应的值单调不减
+    for j in range(2 * n):
+        v = values[j % n]
+        while stack and values[stack[-1]] > v:
+            i = stack.pop()
+            result[i] = values[i] + v
+        if j < n:
+            stack.append(j)
+    return result
+
+
+@register('hw14', '下一个更大元素的下标', parse=lambda text: (ints(lines(text)[1]),), format=format_spaced)
+def next_greater_index(values):
+    result = [0] * len(values)
+    stack = []
+    for j, v in enumerate(values):
+        while stack and values[stack[-1]] < v:
+            result[stack.pop()] = j
+        stack.append(j)
+    return result
+
+
+@register('hw15', '最小的吃桃速度', parse=lambda text: (ints(lines(text)[0]), int(lines(text)[1])))
+def min_eating_speed(piles, hours):
+    '''每小时只吃一堆，hours 小时内吃完的最小速度，堆数多于小时数时返回 0'''
+    return 0 if len(piles) > hours else min_energy(piles, hours)
+
+
+@register('hw16', '分两队实力差最小', parse=lambda text: (ints(lines(text)[0]),))
+def split_teams(values):
+    '''10 个人分成两队各 5 人，两队实力和之差的最小值'''
+    total = sum(values)
+    return min(abs(total - 2 * sum(team)) for team in combinations(values, len(values) // 2))
+
+
+@register('hw17', '只含一个字母的最长子串')
+def one_letter_substring(s):
+    '''子串里恰好一个字母、其余都是数字，返回最长长度，找不到时返回 -1'''
+    best = -1
+    letters = [-1] + [i for i, c in enumerate(s) if c.isalpha()] + [len(s)]
+    for k in range(1, len(letters) - 1):
+        # 第 k 个字母向两边延伸到相邻的字母为止，至少要带上一个数字
+        length = letters[k + 1] - letters[k - 1] - 1
+        if length > 1:
+            best = max(best, length)
+    return best
+
+
+@register('hw18', '平衡串的最大分割数')
+def balanced_splits(s):
+    count = depth = 0
+    for c in s:
+        depth += 1 if c == 'X' else -1
+        if depth == 0:
+            count += 1
+    return count
+
+
+@register('hw19', '8 小时内搬完砖的最小能量', parse=lambda text: (ints(lines(text)[0]),))
+def min_energy(bricks, hours=8):
+    if len(bricks) > hours:
+        return -1
+    lo, hi = 1, max(bricks)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if sum(math.ceil(b / mid) for b in bricks) > hours:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+@register('hw20', '跳过 4 的计数器', parse=lambda text: (int(lines(text)[0]),))
+def skip_four(n):
+    '''表盘跳过数字 4，显示 n 时实际走过的数：按去掉 4 的九进制解读'''
+    value = 0
+    for ch in str(n):
+        d = int(ch)
+        value = value * 9 + (d - 1 if d > 4 else d)
+    return value
+
+
+def parse_tree(text):
+    rows = lines(text)
+    n = int(rows[0])
+    return ints(rows[1]), [tuple(ints(row)) for row in rows[2:n + 1]]
+
+
+@register('hw21', '节点与子节点权值和的最大值', parse=parse_tree)
+def max_family_weight(weights, edges):
+    '''edges 是 (父, 子) 编号对，编号从 1 开始'''
+    family = list(weights)
+    for parent, child in edges:
+        family[parent - 1] += weights[child - 1]
+    return max(family)
+
+
+def parse_ranking(text):
+    rows = lines(text)
+    n = int(rows[0])
+    return ints(rows[1]), [(row.split()[0], ints(row.split(None, 1)[1])) for row in rows[2:n + 2]]
+
+
+@register('hw22', '加权成绩排名', parse=parse_ranking)
+def weighted_ranking(weights, players):
+    '''players：(名字, 各项成绩) 列表，按加权总分降序，同分按名字（忽略大小写）升序'''
+    scored = [(-sum(w * s for w, s in zip(weights, scores)), name.lower(), name) for name, scores in players]
+    return [name for score, key, name in sorted(scored)]
+
+
+def attendance_ok(records):
+    '''缺勤不超过一次，没有连续的迟到/早退，任意连续 7 次中缺勤、迟到、早退不超过 3 次'''
+    if records.count('absent') > 1:
+        return False
+    for i, r in enumerate(records):
+        if i and r in ('late', 'leaveearly') and records[i - 1] in ('late', 'leaveearly'):
+            return False
+        if i >= 6 and sum(1 for x in records[i - 6:i + 1] if x != 'present') > 3:
+            return False
+    return True
+
+
+@register('hw23', '考勤', parse=lambda text: ([row.split() for row in lines(text)[1:int(lines(text)[0]) + 1]],))
+def check_attendance(days):
+    return ['true' if attendance_ok(records) else 'false' for records in days]
+
+
+@register('hw24', '按与基准值的差排序', parse=lambda text: (ints(lines(text)[0])[0], ints(lines(text)[1])),
+          format=format_spaced)
+def sort_by_distance(base, values):
+    return sorted(values, key=lambda x: (abs(x - base), x))
+
+
+def parse_matrix(text):
+    rows = lines(text)
+    m = ints(rows[0])[0]
+    return ([ints(row) for row in rows[1:m + 1]],)
+
+
+@register('hw25', '同一数字的外接矩形最大面积', parse=parse_matrix)
+def max_bounding_area(grid):
+    bounds = {}
+    for i, row in enumerate(grid):
+        for j, v in enumerate(row):
+            if v:
+                r0, c0, r1, c1 = bounds.get(v, (i, j, i, j))
+                bounds[v] = (min(r0, i), min(c0, j), max(r1, i), max(c1, j))
+    return max(((r1 - r0 + 1) * (c1 - c0 + 1) for r0, c0, r1, c1 in bounds.values()), default=0)
+
+
+@register('hw26', '三块石头相互抵消后的最大重量', parse=lambda text: (ints(lines(text)[1]),))
+def smash_stones(stones):
+    stones = sorted(stones, reverse=True)
+    while len(stones) > 2:
+        z, y, x = stones[:3]
+        del stones[:3]
+        if x == y != z:
+            stones.append(z - y)
+        elif x != y == z:
+            stones.append(y - x)
+        elif x != y != z and abs((z - y) - (y - x)):
+            stones.append(abs((z - y) - (y - x)))
+        stones.sort(reverse=True)
+    return max(stones) if stones else 0
+
+
+@register('hw26-2', '出现次数不少于 k 的数字', parse=lambda text: (ints(lines(text)[1]), int(lines(text)[2])),
+          format=format_spaced)
+def frequent_values(values, k):
+    '''出现次数不少于 k 的数按次数降序、数值升序排列，前面加上个数；一个都没有时只输出 0'''
+    counts = {}
+    for v in values:
+        counts[v] = counts.get(v, 0) + 1
+    found = sorted((v for v, c in counts.items() if c >= k), key=lambda v: (-counts[v], v))
+    return [len(found)] + found if found else [0]
+
+
+@register('hw27', '字符串摘要')
+def string_digest(s):
+    '''连续出现的字母记为 字母+次数，不连续的记为 字母+后面出现的次数，按次数降序、字母升序拼接'''
+    letters = [c.lower() for c in s if c.isalpha()]
+    parts = []
+    i = 0
+    while i < len(letters):
+        j = i
+        while j < len(letters) and letters[j] == letters[i]:
+            j += 1
+        count = j - i if j - i > 1 else letters[j:].count(letters[i])
+        parts.append((letters[i], count))
+        i = j
+    return ''.join('{}{}'.format(c, n) for c, n in sorted(parts, key=lambda p: (-p[1], p[0])))
+
+
+@register('hw29', '按个位数排序')
+def sort_by_last_digit(s):
+    return ','.join(sorted(s.split(','), key=lambda x: x[-1]))
+
+
+@register('hw30', '按出现次数排序')
+def sort_by_frequency(s):
+    counts = {}
+    for x in s.split(','):
+        counts[x] = counts.get(x, 0) + 1
+    return ','.join(sorted(counts, key=lambda x: -counts[x]))
+
+
+def parse_scores(text):
+    rows = lines(text)
+    n = ints(rows[0])[0]
+    return rows[1].split(), [(row.split()[0], ints(row.split(None, 1)[1])) for row in rows[2:n + 2]], rows[n + 2]
+
+
+@register('hw31', '按科目或总分排名', parse=parse_scores, format=format_spaced)
+def rank_students(subjects, students, key):
+    '''key 是科目名时按该科成绩排，否则按总分排，同分按名字升序'''
+    if key in subjects:
+        i = subjects.index(key)
+        return [name for name, scores in sorted(students, key=lambda st: (-st[1][i], st[0]))]
+    return [name for name, scores in sorted(students, key=lambda st: (-sum(st[1]), st[0]))]
+
+
+@register('hw32', '按身高体重排队', parse=lambda text: (ints(lines(text)[1]), ints(lines(text)[2])),
+          format=format_spaced)
+def line_up(heights, weights):
+    return sorted(range(1, len(heights) + 1), key=lambda i: (heights[i - 1], weights[i - 1], i))
+
+
+
+@register('hw33', '交换一次得到最小字符串')
+def smallest_after_swap(s):
+    '''从前往后找第一个后面有更小字符的位置，和后面最小字符的最后一次出现交换'''
+    chars = list(s)
+    for i in range(len(chars) - 1):
+        smallest = min(chars[i + 1:])
+        if smallest < chars[i]:
+            j = len(chars) - 1 - chars[::-1].index(smallest)
+            chars[i], chars[j] = chars[j], chars[i]
+            break
+    return ''.join(chars)
+
+
+@register('hw34', '处理完所有任务的秒数', parse=lambda text: (int(lines(text)[0]), ints(lines(text)[2])))
+def task_seconds(capacity, tasks):
+    '''每秒新来一批任务，最多处理 capacity 个，剩下的留到下一秒'''
+    pending = seconds = 0
+    for count in tasks:
+        pending = max(0, pending + count - capacity)
+        seconds += 1
+    return seconds + (pending + capacity - 1) // capacity
+
+
+@register('hw35', '最大 N 个数与最小 N 个数的和', parse=lambda text: (ints(lines(text)[1]), int(lines(text)[2])))
+def extreme_sum(values, n):
+    '''去重后取最小和最大的各 n 个，有重叠时返回 -1'''
+    values = sorted(set(values))
+    if n * 2 > len(values):
+        return -1
+    return sum(values[:n]) + sum(values[-n:])
+
+
+@register('hw36', '有序数组中的插入位置', parse=lambda text: (ints(lines(text)[0], ','), int(lines(text)[1])))
+def insert_position(values, target):
+    '''返回从 1 开始的插入位置'''
+    return bisect_left(values, target) + 1
+
+
+def parse_sla_tasks(text):
+    rows = lines(text)
+    return int(rows[1]), [tuple(ints(row)) for row in rows[2:int(rows[0]) + 2]]
+
+
+@register('hw37', '任务调度的最大价值', parse=parse_sla_tasks)
+def max_task_value(total_time, tasks):
+    '''每个时间单位做一个任务，任务要在 SLA 时刻之前完成；按价值从大到小放进最晚的空闲时刻'''
+    free = [True] * (total_time + 1)
+    value = 0
+    for sla, v in sorted(tasks, key=lambda t: -t[1]):
+        for t in range(min(sla, total_time), 0, -1):
+            if free[t]:
+                free[t] = False
+                value += v
+                break
+    return value
+
+
+@register('hw38', '能买到的最多连续宝石', parse=lambda text: (
+    [int(x) for x in lines(text)[1:int(lines(text)[0]) + 1]], int(lines(text)[int(lines(text)[0]) + 1])))
+def max_gems(prices, money):
+    '''价格和不超过 money 的最长连续区间'''
+    best = total = left = 0
+    for right, price in enumerate(prices):
+        total += price
+        while total > money:
+            total -= prices[left]
+            left += 1
+        best = max(best, right - left + 1)
+    return best
+
+
+@register('hw39', '分解为两个素数的乘积', parse=lambda text: (int(lines(text)[0]),), format=format_spaced)
+def prime_factors_pair(n):
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            q = n // p
+            if all(q % d for d in range(2, math.isqrt(q) + 1)):
+                return p, q
+            break
+        p += 1
+    return -1, -1
+
+
+@register('hw40', '能拼写的单词个数', parse=lambda text: (lines(text)[1:int(lines(text)[0]) + 1],
+                                                    lines(text)[int(lines(text)[0]) + 1]))
+def spellable_words(words, chars):
+    '''每个字符只能用一次，? 可以当作任意字母'''
+    count = 0
+    for word in words:
+        need = Counter(word)
+        need.subtract(Counter(chars))
+        if sum(v for v in need.values() if v > 0) <= chars.count('?'):
+            count += 1
+    return count
+
+
+@register('hw41', '交换 CPU 使两组算力相等', parse=lambda text: (ints(lines(text)[1]), ints(lines(text)[2])),
+          format=format_spaced)
+def swap_cpu(a, b):
+    '''A 组的 x 和 B 组的 y 交换后两组总和相等，x 取最小的'''
+    diff = sum(a) - sum(b)
+    if diff % 2:
+        return ()
+    b_set = set(b)
+    for x in sorted(a):
+        if x - diff // 2 in b_set:
+            return x, x - diff // 2
+    return ()
+
+
+@register('hw42', '幸运数', parse=lambda text: (int(lines(text)[0]), int(lines(text)[1]), ints(lines(text)[2])))
+def lucky_max_position(n, luck, commands):
+    '''指令等于幸运数时多走一步，返回到过的最大坐标（含起点 0）；输入不合法时返回 12345'''
+    if len(commands) != n or not 1 <= n <= 100 or any(abs(x) > 100 for x in commands + [luck]):
+        return 12345
+    position = best = 0
+    for step in commands:
+        if step == luck and step:
+            step += 1 if step > 0 else -1
+        position += step
+        best = max(best, position)
+    return best
+
+
+@register('hw43', 'M 进制下某个数字出现的次数', parse=lambda text: tuple(ints(lines(text)[0])))
+def digit_count_in_base(k, digit, base):
+    count = 0
+    while k:
+        k, d = divmod(k, base)
+        count += d == digit
+    return count
+
+
+@register('hw44', '迷宫从左上到右下的路径数', parse=lambda text: (
+    [ints(row) for row in lines(text)[1:ints(lines(text)[0])[0] + 1]],))
+def count_paths(grid):
+    '''只能走 0 的格子，上下左右移动，每条路径不重复经过同一格'''
+    rows, cols = len(grid), len(grid[0])
+    if grid[0][0] or grid[-1][-1]:
+        return 0
+    seen = [[False] * cols for i in range(rows)]
+
+    def dfs(r, c):
+        if (r, c) == (rows - 1, cols - 1):
+            return 1
+        seen[r][c] = True
+        total = 0
+        for nr, nc in ((r + 1, c), (r - 1, c), (r, c + 1), (r, c - 1)):
+            if 0 <= nr < rows and 0 <= nc < cols and not grid[nr][nc] and not seen[nr][nc]:
+                total += dfs(nr, nc)
+        seen[r][c] = False
+        return total
+
+    return dfs(0, 0)
+
+
+@register('hw45', '单词联想', parse=lambda text: (' '.join(lines(text)[:-1]), lines(text)[-1]))
+def suggest_words(sentence, prefix):
+    '''标点都当作分隔符（don't 是 don 和 t），区分大小写，按字典序输出以 prefix 开头的单词'''
+    words = set(re.findall('[A-Za-z]+', sentence))
+    found = sorted(word for word in words if word.startswith(prefix))
+    return ' '.join(found) if found else prefix
+
+
+@register('hw46', '第 K 小的字母的位置', parse=lambda text: (lines(text)[0], int(lines(text)[1])))
+def kth_letter_index(s, k):
+    '''k 超过长度时取最大的字母，重复字母取最小下标'''
+    return s.index(sorted(s)[min(k, len(s)) - 1])
+
+
+@register('hw47', '拼接 URL', parse=lambda text: tuple((lines(text) or [','])[0].split(',', 1)))
+def join_url(prefix, suffix):
+    return prefix.rstrip('/') + '/' + suffix.lstrip('/')
+
+
+@register('hw48', '停车场最少停车数')
+def min_cars(s):
+    '''连续的车位按长度 3、2、1 的车尽量少地停满'''
+    return sum((len(run) + 2) // 3 for run in s.replace(',', '').split('0'))
+
+
+def parse_paths(text):
+    rows = lines(text)
+    n = int(rows[0])
+    level, name = rows[n + 1].split()
+    return [row.strip('/').split('/') for row in rows[1:n + 1]], int(level), name
+
+
+@register('hw49', '某一层目录名出现的次数', parse=parse_paths)
+def count_directory(paths, level, name):
+    return sum(1 for parts in paths if len(parts) >= level and parts[level - 1] == name)
+
+
+@register('hw50', '最多可以派出的团队数', parse=lambda text: (ints(lines(text)[1]), int(lines(text)[2])))
+def max_teams(abilities, minimum):
+    '''一人或两人一队，能力和不低于 minimum；能力最强的单独成队，否则和能搭配的最弱的人组队'''
+    abilities = sorted(abilities)
+    left, right = 0, len(abilities) - 1
+    teams = 0
+    while left <= right:
+        if abilities[right] >= minimum:
+            teams += 1
+            right -= 1
+        elif left < right and abilities[left] + abilities[right] >= minimum:
+            teams += 1
+            left += 1
+            right -= 1
+        else:
+            left += 1
+    return teams
+
+
+@register('hw51', '和不小于 x 的连续子数组个数', parse=lambda text: (ints(lines(text)[1]), ints(lines(text)[0])[1]))
+def count_subarrays_at_least(values, x):
+    count = total = left = 0
+    for right, value in enumerate(values):
+        total += value
+        while total >= x:
+            count += len(values) - right
+            total -= values[left]
+            left += 1
+    return count
+
+
+def convert_case(part):
+    upper = sum(1 for c in part if c.isupper())
+    lower = sum(1 for c in part if c.islower())
+    if upper > lower:
+        return part.upper()
+    if upper < lower:
+        return part.lower()
+    return part
+
+
+@register('hw52', '按 K 个字符重新分组转换大小写', parse=lambda text: (int(lines(text)[0]), lines(text)[1]))
+def regroup_key(k, s):
+    '''第一个 - 之前的部分保持不变，其余去掉 - 后每 k 个字符一组，大写多转大写，小写多转小写'''
+    first, _, rest = s.partition('-')
+    rest = rest.replace('-', '')
+    return '-'.join([first] + [convert_case(rest[i:i + k]) for i in range(0, len(rest), k)])
+
+
+@register('hw53', '连续出现次数第 k 多的字母', parse=lambda text: (lines(text)[0], int(lines(text)[1])))
+def kth_longest_run(s, k):
+    '''每个字母只取最长的一段，不足 k 个字母时返回 -1'''
+    longest = {}
+    for c, group in groupby(s):
+        longest[c] = max(longest.get(c, 0), len(list(group)))
+    runs = sorted(longest.values(), reverse=True)
+    return runs[k - 1] if k <= len(runs) else -1
+
+
+def apply_operator(expression, op, func):
+    values = [int(x) for x in expression.split(op)]
+    result = values[0]
+    for value in values[1:]:
+        result = func(result, value)
+    return result
+
+
+@register('hw54', '火星文计算')
+def martian_expression(s):
+    '''x#y = 2x+3y+4，x$y = 3x+y+2；$ 优先级高于 #，同级从左到右算'''
+    terms = [apply_operator(term, '$', lambda x, y: 3 * x + y + 2) for term in s.split('#')]
+    return apply_operator('#'.join(str(term) for term in terms), '#', lambda x, y: 2 * x + 3 * y + 4)
+
+
+def parse_products(text):
+    rows = lines(text)
+    m, money, risk = ints(rows[0])
+    return money, risk, ints(rows[1])[:m], ints(rows[2])[:m], ints(rows[3])[:m]
+
+
+@register('hw55', '最大化投资回报', parse=parse_products, format=format_spaced)
+def best_investment(money, max_risk, rates, risks, limits):
+    '''最多投两个产品，总风险不超过 max_risk，钱先投回报率高的那个'''
+    best, plan = 0, [0] * len(rates)
+    for i in range(len(rates)):
+        candidates = [(i,)] + [(i, j) for j in range(i + 1, len(rates))]
+        for chosen in candidates:
+            if sum(risks[x] for x in chosen) > max_risk:
+                continue
+            left, amounts = money, {}
+            for x in sorted(chosen, key=lambda x: -rates[x]):
+                amounts[x] = min(left, limits[x])
+                left -= amounts[x]
+            total = sum(amounts[x] * rates[x] for x in chosen)
+            if total > best:
+                best, plan = total, [amounts.get(x, 0) for x in range(len(rates))]
+    return plan
+
+
+def parse_drawing(text):
+    rows = lines(text)
+    n, end = ints(rows[0])
+    return end, [tuple(ints(row)) for row in rows[1:n + 1]]
+
+
+@register('hw56', '绘图机器围成的面积', parse=parse_drawing)
+def drawing_area(end, commands):
+    '''每条指令在横坐标 x 处把纵坐标偏移 offset，面积是 [0, end) 上每个单位宽度的 |y| 之和'''
+    area = y = last = 0
+    for x, offset in commands:
+        area += abs(y) * (x - last)
+        y += offset
+        last = x
+    return area + abs(y) * (end - last)
+
+
+@register('hw57', '航班排序')
+def sort_flights(s):
+    '''先按航空公司代码，再按航班号排序，都是字符串比较'''
+    return ','.join(sorted(s.split(',')))
+
+
+@register('hw58', '围棋的气', parse=lambda text: (ints(lines(text)[0]), ints(lines(text)[1])), format=format_spaced)
+def count_liberties(black, white):
+    '''19x19 棋盘，每种颜色棋子周围不重复的空格数'''
+    stones = [set(zip(coords[::2], coords[1::2])) for coords in (black, white)]
+    occupied = stones[0] | stones[1]
+    result = []
+    for own in stones:
+        liberties = {(r + dr, c + dc) for r, c in own for dr, dc in ((1, 0), (-1, 0), (0, 1), (0, -1))}
+        result.append(sum(1 for r, c in liberties - occupied if 0 <= r < 19 and 0 <= c < 19))
+    return result
+
+
+def digit_sum(n):
+    return sum(int(d) for d in str(n))
+
+
+@register('hw59', '机器人能到达的格子数', parse=lambda text: tuple(ints(lines(text)[0])))
+def reachable_cells(rows, cols, k):
+    '''从 (0, 0) 出发上下左右走，只能进入行列数位和不超过 k 的格子'''
+    if k < 0:
+        return 0
+    seen = {(0, 0)}
+    queue = deque([(0, 0)])
+    while queue:
+        r, c = queue.popleft()
+        for nr, nc in ((r + 1, c), (r - 1, c), (r, c + 1), (r, c - 1)):
+            if (0 <= nr < rows and 0 <= nc < cols and (nr, nc) not in seen
+                    and digit_sum(nr) + digit_sum(nc) <= k):
+                seen.add((nr, nc))
+                queue.append((nr, nc))
+    return len(seen)
+
+
+@register('hw60', '三叉搜索树的高度', parse=lambda text: (ints(lines(text)[1]),))
+def ternary_tree_height(values):
+    '''比节点小 500 以上放左子树，大 500 以上放右子树，其余放中间子树'''
+    children = []  # 每个节点的 [左, 中, 右] 子节点下标
+    height = 0
+    for i, value in enumerate(values):
+        children.append([None, None, None])
+        node, depth = 0, 1
+        while i:
+            slot = 0 if value < values[node] - 500 else 2 if value > values[node] + 500 else 1
+            depth += 1
+            if children[node][slot] is None:
+                children[node][slot] = i
+                break
+            node = children[node][slot]
+        height = max(height, depth)
+    return height
+
+
+# 手势 -> 它能赢的手势：A 石头、B 剪刀、C 布
+BEATS = {'A': 'B', 'B': 'C', 'C': 'A'}
+
+
+@register('hw61', '石头剪刀布的赢家', parse=lambda text: ([row.split() for row in lines(text)],))
+def rock_paper_scissors_winners(players):
+    '''只出现两种手势时才有赢家，按名字升序；否则返回 NULL'''
+    gestures = {gesture for name, gesture in players}
+    if len(gestures) != 2:
+        return 'NULL'
+    winner = next(g for g in gestures if BEATS[g] in gestures)
+    return sorted(name for name, gesture in players if gesture == winner)
+
+
+@register('hw62', '简化路径只保留拐点', parse=lambda text: (ints(lines(text)[0]),), format=format_spaced)
+def turning_points(coords):
+    points = list(zip(coords[::2], coords[1::2]))
+    result = points[:1]
+    for prev, curr, nxt in zip(points, points[1:], points[2:]):
+        if (curr[0] - prev[0]) * (nxt[1] - curr[1]) != (curr[1] - prev[1]) * (nxt[0] - curr[0]):
+            result.append(curr)
+    if len(points) > 1:
+        result.append(points[-1])
+    return [x for point in result for x in point]
+
+
+@register('hw63', '字符串中数字的最小和')
+def min_digit_sum(s):
+    '''正数按单个数字相加，- 后面的整段数字当作一个负数'''
+    return sum(int(x) for x in re.findall(r'-\d+|\d', s))
+
+
+@register('hw64', '跳数敲出后的幸存数之和', parse=lambda text: (ints(lines(text)[0], ','), int(lines(text)[1]),
+                                                       int(lines(text)[2])))
+def sum_of_left(nums, jump, left):
+    '''从下标 0 起跳，跳过 jump 个数敲出下一个，再从被敲出的位置起跳，循环到只剩 left 个'''
+    nums = list(nums)
+    i = jump + 1
+    while len(nums) > max(left, 0):
+        i %= len(nums)
+        nums.pop(i)
+        i += jump
+    return sum(nums)
+
+
+@register('hw65', '二叉树从根出发的最长耗时', parse=lambda text: (ints(lines(text)[0]),))
+def max_path_time(tree):
+    '''层序数组表示的二叉树，-1 是空节点，返回根到某个节点的节点值之和的最大值'''
+    totals = list(tree)
+    best = totals[0]
+    for i in range(1, len(totals)):
+        if tree[i] != -1 and tree[(i - 1) // 2] != -1:
+            totals[i] += totals[(i - 1) // 2]
+            best = max(best, totals[i])
+    return best
+
+
+@register('hw66', '密码本解密')
+def decrypt_digits(s):
+    '''1~9 对应 a~i，10*~26* 对应 j~z'''
+    return ''.join(chr(ord('a') + int(x.rstrip('*')) - 1) for x in re.findall(r'\d\d\*|\d', s))
+
+
+@register('hw67', '哈夫曼树的中序遍历', parse=lambda text: (ints(lines(text)[1]),), format=format_spaced)
+def huffman_inorder(weights):
+    '''左节点权值不大于右节点；权值相同时左子树高度不大于右子树'''
+    # 堆里是 (权值, 高度, 序号, 中序遍历)，先弹出的放左边
+    heap = [(w, 0, i, [w]) for i, w in enumerate(weights)]
+    heapq.heapify(heap)
+    seq = len(heap)
+    while len(heap) > 1:
+        left = heapq.heappop(heap)
+        right = heapq.heappop(heap)
+        weight = left[0] + right[0]
+        heapq.heappush(heap, (weight, max(left[1], right[1]) + 1, seq, left[3] + [weight] + right[3]))
+        seq += 1
+    return heap[0][3] if heap else []
+
+
+def parse_network(text):
+    rows = lines(text)
+    n = int(rows[0])
+    return ints(rows[1], ','), [ints(row, ',') for row in rows[2:n + 2]]
+
+
+@register('hw68', '病毒传播新感染的人数', parse=parse_network)
+def newly_infected(infected, contacts):
+    '''contacts[i][j] 为 1 表示 i 和 j 接触过，感染会沿接触关系传递'''
+    seen = set(infected)
+    queue = deque(infected)
+    while queue:
+        i = queue.popleft()
+        for j, contact in enumerate(contacts[i]):
+            if contact and j not in seen:
+                seen.add(j)
+                queue.append(j)
+    return len(seen) - len(set(infected))
+
+
+@register('hw69', '从两端取 N 张牌的最大点数和', parse=lambda text: (ints(lines(text)[1]), int(lines(text)[2])))
+def max_end_cards(cards, n):
+    '''等价于总和减去长度 len - n 的连续区间的最小和'''
+    width = len(cards) - n
+    window = sum(cards[:width])
+    smallest = window
+    for i in range(width, len(cards)):
+        window += cards[i] - cards[i - width]
+        smallest = min(smallest, window)
+    return sum(cards) - smallest
+
+
+@register('hw70', '压缩图像中某个像素的灰度', parse=lambda text: (ints(lines(text)[0]), *ints(lines(text)[1])))
+def pixel_gray(image, row, col):
+    '''image 是 宽 高 之后若干个 (灰度, 连续像素数)，像素按行从左到右排'''
+    position = row * image[0] + col
+    for gray, count in zip(image[2::2], image[3::2]):
+        if position < count:
+            return gray
+        position -= count
+    return -1
+
+
+def parse_apps(text):
+    rows = lines(text.replace('：', ':'))
+    n = int(rows[0])
+    apps = [(name, int(priority), start, end) for name, priority, start, end in
+            (row.split() for row in rows[1:n + 1])]
+    return apps, rows[n + 1]
+
+
+@register('hw71', 'App 防沉迷系统', parse=parse_apps)
+def app_at(apps, moment):
+    '''按顺序注册，时段 [起始, 结束)；和优先级不低于自己的已注册时段冲突时注册不上，否则注销冲突的低优先级时段'''
+    registered = []
+    for name, priority, start, end in apps:
+        if start >= end:
+            continue
+        conflicts = [app for app in registered if app[2] < end and start < app[3]]
+        if any(app[1] >= priority for app in conflicts):
+            continue
+        registered = [app for app in registered if app not in conflicts] + [(name, priority, start, end)]
+    for name, priority, start, end in registered:
+        if start <= moment < end:
+            return name
+    return 'NA'
+
+
+@register('hw72', '小朋友至少来自几个小区', parse=lambda text: (ints(lines(text)[0]),))
+def min_gardens(answers):
+    '''说还有 k 个同小区的小朋友，每 k + 1 个人至少是一个小区'''
+    return sum((count + k) // (k + 1) for k, count in Counter(answers).items())
+
+
+def parse_ratings(text):
+    rows = lines(text)
+    n, m = ints(rows[0])
+    return [int(row) for row in rows[1:n + 1]], [ints(row) for row in rows[n + 1:n + m + 1]]
+
+
+@register('hw73', '按总分排序的组合', parse=parse_ratings, format=format_spaced)
+def rank_groups(scores, groups):
+    '''每组的分数是组内编号对应分数之和，按分数降序、组号升序输出组号'''
+    totals = [sum(scores[i - 1] for i in group) for group in groups]
+    return sorted(range(1, len(groups) + 1), key=lambda k: (-totals[k - 1], k))
+
+
+@register('hw74', '螺旋矩阵', parse=lambda text: tuple(ints(lines(text)[0])))
+def spiral_matrix(n, rows):
+    '''1 到 n 按顺时针螺旋填进 rows 行、ceil(n / rows) 列的矩阵，空位是 *'''
+    cols = -(-n // rows)
+    grid = [['*'] * cols for i in range(rows)]
+    r = c = 0
+    dr, dc = 0, 1
+    for num in range(1, n + 1):
+        grid[r][c] = num
+        nr, nc = r + dr, c + dc
+        if not (0 <= nr < rows and 0 <= nc < cols and grid[nr][nc] == '*'):
+            dr, dc = dc, -dr
+            nr, nc = r + dr, c + dc
+        r, c = nr, nc
+    return grid
+
+
+def parse_blocks(text):
+    rows = lines(text)
+    return int(rows[0]), [tuple(ints(row)) for row in rows[1:]]
+
+
+@register('hw75', '内存最佳适配', parse=parse_blocks)
+def best_fit(size, blocks, total=100):
+    '''blocks 是已分配的 (偏移, 大小)，在 total 字节的堆里找足够大且最接近 size 的空闲块；
+    申请失败或已分配的块不合法（重叠、越界、大小不为正）时返回 -1'''
+    if not 0 < size <= total:
+        return -1
+    gaps = []  # 空闲块 (偏移, 大小)
+    start = 0
+    for offset, length in sorted(blocks):
+        if offset < start or length <= 0 or offset + length > total:
+            return -1
+        gaps.append((start, offset - start))
+        start = offset + length
+    gaps.append((start, total - start))
+    fits = [(length - size, offset) for offset, length in gaps if length >= size]
+    return min(fits)[1] if fits else -1
+
+
+@register('hw76', '不能超车的单行道', parse=lambda text: (ints(lines(text)[0])[1], [int(x) for x in lines(text)[1:]]))
+def last_car_time(distance, speeds):
+    '''第 i 辆车在第 i 小时出发，追上前车后只能跟着前车，返回最后一辆车在路上花的时间'''
+    arrival = 0
+    for i, speed in enumerate(speeds):
+        arrival = max(arrival, distance / speed + i)
+    return arrival - len(speeds) + 1
+
+
+def reachable(grid, start):
+    '''从 start 出发上下左右能走到的格子，1 是障碍'''
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        r, c = queue.popleft()
+        for nr, nc in ((r + 1, c), (r - 1, c), (r, c + 1), (r, c - 1)):
+            if 0 <= nr < len(grid) and 0 <= nc < len(grid[0]) and grid[nr][nc] != 1 and (nr, nc) not in seen:
+                seen.add((nr, nc))
+                queue.append((nr, nc))
+    return seen
+
+
+@register('hw77', '两人都能到达的聚餐地点', parse=lambda text: (
+    [ints(row) for row in lines(text)[1:ints(lines(text)[0])[0] + 1]],))
+def shared_restaurants(grid):
+    '''2 是两个人的位置，3 是餐厅，1 是障碍'''
+    cells = [(r, c) for r in range(len(grid)) for c in range(len(grid[0]))]
+    first, second = [reachable(grid, cell) for cell in cells if grid[cell[0]][cell[1]] == 2]
+    return sum(1 for r, c in cells if grid[r][c] == 3 and (r, c) in first and (r, c) in second)
+
+
+@register('hw78', '最大局域网的服务器个数', parse=lambda text: (
+    [ints(row) for row in lines(text)[1:ints(lines(text)[0])[0] + 1]],))
+def largest_network(grid):
+    '''上下左右相邻的服务器连成局域网，单独一台不算局域网'''
+    walls = [[1 - x for x in row] for row in grid]
+    seen = set()
+    best = 0
+    for r, row in enumerate(grid):
+        for c, server in enumerate(row):
+            if server and (r, c) not in seen:
+                network = reachable(walls, (r, c))
+                seen |= network
+                best = max(best, len(network))
+    return best if best > 1 else 0
+
+
+@register('hw79', 'CSV 单元格引用替换')
+def expand_cells(s):
+    '''<X> 引用第 X 个单元格（A 是第一个），每个单元格最多一个引用；格式错误或引用不存在时返回 -1'''
+    cells = s.split(',')
+    expanded = {}
+
+    def expand(i, depth=0):
+        if i not in expanded:
+            m = re.fullmatch(r'([^<>]*)(?:<([A-Z])>([^<>]*))?', cells[i])
+            if not m or depth > len(cells):
+                raise ValueError(cells[i])
+            if m.group(2) is None:
+                expanded[i] = cells[i]
+            else:
+                ref = ord(m.group(2)) - ord('A')
+                if ref >= len(cells) or ref == i:
+                    raise ValueError(cells[i])
+                expanded[i] = m.group(1) + expand(ref, depth + 1) + m.group(3)
+        return expanded[i]
+
+    try:
+        return ','.join(expand(i) for i in range(len(cells)))
+    except ValueError:
+        return -1
+
+
+def parse_links(text):
+    rows = lines(text)
+    n, m = int(rows[0]), int(rows[1])
+    return n, [tuple(ints(row)) for row in rows[2:m + 2]]
+
+
+@register('hw80', '基站连通的最小成本', parse=parse_links)
+def min_network_cost(n, links):
+    '''links 是 (站点, 站点, 成本, 是否已连通)，已连通的边不花钱；不能全部连通时返回 -1'''
+    parent = list(range(n + 1))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    cost, groups = 0, n
+    for a, b, price, built in sorted(links, key=lambda link: (-link[3], link[2])):
+        ra, rb = find(a), find(b)
+        if ra != rb:
+            parent[ra] = rb
+            groups -= 1
+            cost += 0 if built else price
+    return cost if groups == 1 else -1
+
+
+@register('hw80-s1', '数组分组', parse=lambda text: (ints(lines(text)[1]),),
+          format=lambda result: str(result).lower())
+def split_by_multiples(values):
+    '''5 的倍数在一组，其余 3 的倍数在另一组，剩下的数任意放，两组的和能否相等'''
+    fives = sum(x for x in values if x % 5 == 0)
+    threes = sum(x for x in values if x % 3 == 0 and x % 5)
+    sums = {fives - threes}  # 第一组减第二组的差
+    for x in values:
+        if x % 5 and x % 3:
+            sums = {d + x for d in sums} | {d - x for d in sums}
+    return 0 in sums
+
+
+def parse_chain(text):
+    rows = lines(text)
+    n = int(rows[0])
+    return [tuple(ints(row)) for row in rows[1:n + 1]], rows[n + 1]
+
+
+@register('hw80-s2', '矩阵乘法计算量估算', parse=parse_chain)
+def chain_multiplications(shapes, order):
+    stack = []
+    total = 0
+    for c in order:
+        if c.isalpha():
+            stack.append(shapes[ord(c) - ord('A')])
+        elif c == ')' and len(stack) >= 2:
+            (rows, inner), (_, cols) = stack.pop(-2), stack.pop()
+            total += rows * inner * cols
+            stack.append((rows, cols))
+    return total
+
+
+CARD_VALUES = {'A': 1, 'J': 11, 'Q': 12, 'K': 13}
+OPERATORS = {'+': lambda a, b: a + b, '-': lambda a, b: a - b, '*': lambda a, b: a * b,
+             '/': lambda a, b: int(a / b)}
+
+
+@register('hw80-s3', '扑克牌 24 点', parse=lambda text: (lines(text)[0].split(),))
+def poker_24(cards):
+    '''从左到右计算、整数除法，返回任意一个结果为 24 的算式；有大小王返回 ERROR，无解返回 NONE'''
+    if 'joker' in cards or 'JOKER' in cards:
+        return 'ERROR'
+    for order in permutations(cards):
+        values = [CARD_VALUES.get(card) or int(card) for card in order]
+        for ops in product(OPERATORS, repeat=len(cards) - 1):
+            result = values[0]
+            for op, value in zip(ops, values[1:]):
+                result = OPERATORS[op](result, value)
+            if result == 24:
+                return order[0] + ''.join(op + card for op, card in zip(ops, order[1:]))
+    return 'NONE'
+
+
+@register('hw81', '雨花石平分最少拿出几块', parse=lambda text: (ints(lines(text)[1]),))
+def min_stones_to_split(weights):
+    '''凑出总重量一半所需的最少块数，不能平分时返回 -1'''
+    total = sum(weights)
+    if total % 2:
+        return -1
+    half = total // 2
+    fewest = [0] + [None] * half  # 凑出重量 w 的最少块数
+    for weight in weights:
+        for w in range(half, weight - 1, -1):
+            if fewest[w - weight] is not None and (fewest[w] is None or fewest[w - weight] + 1 < fewest[w]):
+                fewest[w] = fewest[w - weight] + 1
+    return fewest[half] if fewest[half] is not None else -1
+
+
+@register('hw82', '游乐园门票最低消费', parse=lambda text: (ints(lines(text)[0]), ints(lines(text)[1])))
+def min_ticket_cost(costs, days):
+    '''costs 依次是一日票、三日票、周票、月票的价格'''
+    plan = set(days)
+    last = max(days, default=0)
+    cost = [0] * (last + 1)
+    for day in range(1, last + 1):
+        if day not in plan:
+            cost[day] = cost[day - 1]
+        else:
+            cost[day] = min(cost[max(day - span, 0)] + price for span, price in zip((1, 3, 7, 30), costs))
+    return cost[last]
+
+
+def leetcode_list(text):
+    '''"nums = [1,2,3]" 这种写法的输入'''
+    return (json.loads(lines(text)[0].split('=', 1)[1]),)
+
+
+def format_leetcode(result):
+    return json.dumps(result, separators=(',', ':'))
+
+
+@register('hw82-s1', '有效的括号', parse=lambda text: (re.search(r'"(.*?)"', text).group(1),),
+          format=format_leetcode)
+def valid_brackets(s):
+    pairs = {')': '(', ']': '[', '}': '{'}
+    stack = []
+    for c in s:
+        if c in pairs:
+            if not stack or stack.pop() != pairs[c]:
+                return False
+        else:
+            stack.append(c)
+    return not stack
+
+
+@register('hw82-s2', '循环数组的下一个更大元素', parse=leetcode_list, format=format_leetcode)
+def next_greater_circular(nums):
+    result = [-1] * len(nums)
+    stack = []  # 还没找到更大元素的下标，对应的值单调不增
+    for i in range(2 * len(nums)):
+        value = nums[i % len(nums)]
+        while stack and nums[stack[-1]] < value:
+            result[stack.pop()] = value
+        if i < len(nums):
+            stack.append(i)
+    return result
+
+
+@register('hw82-s3', '每日温度', parse=leetcode_list, format=format_leetcode)
+def daily_temperatures(temperatures):
+    answer = [0] * len(temperatures)
+    stack = []
+    for i, temperature in enumerate(temperatures):
+        while stack and temperatures[stack[-1]] < temperature:
+            j = stack.pop()
+            answer[j] = i - j
+        stack.append(i)
+    return answer
+
+
+@register('hw83', '每个月需要的最小人力', parse=lambda text: (int(lines(text)[0]), ints(lines(text)[1])))
+def min_manpower(months, requirements):
+    '''每个月最多开发两个需求，二分人力，最大的需求尽量和最小的配成一个月'''
+    requirements = sorted(requirements)
+
+    def months_needed(power):
+        left, right = 0, len(requirements) - 1
+        used = 0
+        while left <= right:
+            if left < right and requirements[left] + requirements[right] <= power:
+                left += 1
+            right -= 1
+            used += 1
+        return used
+
+    low, high = requirements[-1], requirements[-1] + (requirements[-2] if len(requirements) > 1 else 0)
+    while low < high:
+        mid = (low + high) // 2
+        if months_needed(mid) <= months:
+            high = mid
+        else:
+            low = mid + 1
+    return low
@@ -0,0 +1,1291 @@
+'''questionTest.py 中的题目'''
+import json
+import re
+from bisect import bisect_left
+from collections import deque
+from itertools import combinations, groupby
+from math import gcd
+
+from solutions import format_spaced, ints, lines, register
+
+UNITS = {'M': 1, 'G': 1024, 'T': 1024 * 1024}
+
+
+def disk_capacity(s):
+    '''把 3M12G9M 这样的容量换算成 M'''
+    return sum(int(m) * UNITS[v] for m, v in re.findall(r'(\d+)([MGT])', s))
+
+
+@register('q1', '磁盘容量排序', parse=lambda text: (lines(text)[1:int(lines(text)[0]) + 1],))
+def sort_disks(disks):
+    return sorted(disks, key=disk_capacity)  # sorted 是稳定排序，容量相同时保持输入顺序
+
+
+@register('q2', '大雁叫声')
+def count_geese(s):
+    '''最少几只大雁：只有叫完整的 quack 才算一只，答案是完整叫声在时间上重叠的最大个数
+
+    含有 quack 以外的字符或者一声完整的叫声都没有时返回 -1。
+    '''
+    order = 'quack'
+    if not s or set(s) - set(order):
+        return -1
+    waiting = [deque() for i in range(4)]  # waiting[i]：叫到第 i 个字母的大雁各自开始叫的位置，先开始的先接下一个字母
+    calls = []  # 完整叫声的 (开始位置, 结束位置)
+    for pos, ch in enumerate(s):
+        i = order.index(ch)
+        if i == 0:
+            waiting[0].append(pos)
+        elif waiting[i - 1]:
+            start = waiting[i - 1].popleft()
+            if i == 4:
+                calls.append((start, pos))
+            else:
+                waiting[i].append(start)
+    if not calls:
+        return -1
+    # 按位置扫描：开始 +1，结束 -1，位置不会重复所以先后无歧义
+    events = sorted([(start, 1) for start, end in calls] + [(end, -1) for start, end in calls])
+    most = current = 0
+    for pos, delta in events:
+        current += delta
+        most = max(most, current)
+    return most
+
+
+VOWELS = 'aeiou'
+
+
+@register('q3', '相对开音节', parse=lambda text: (text.strip(),))
+def open_syllables(s):
+    '''全是字母的单词先反转，再数长度为 4、形如 辅音+元音+辅音(r 除外)+e 的子串个数'''
+    count = 0
+    for word in s.split(' '):
+        if word.isalpha():
+            word = word[::-1]
+        for i in range(len(word) - 3):
+            a, b, c, d = word[i:i + 4]
+            if (a.isalpha() and a not in VOWELS and b in VOWELS and c.isalpha() and c not in VOWELS + 'r'
+                    and d == 'e'):
+                count += 1
+    return count
+
+
+def parse_dirs(text):
+    rows = lines(text)
+    m, n = ints(rows[0])
+    dirs = {}
+    for row in rows[1:m + 1]:
+        did, size, subs = re.match(r'(\d+)\s+(\d+)\s*\((.*)[)）]', row).groups()
+        dirs[int(did)] = (int(size), [int(x) for x in re.split(r'[,，]', subs) if x.strip()])
+    return dirs, n
+
+
+@register('q4', '目录大小', parse=parse_dirs)
+def dir_size(dirs, target):
+    '''dirs：目录 id -> (本目录文件大小, 子目录 id 列表)，返回 target 及其所有子目录的大小之和'''
+    total = 0
+    stack = [target]
+    seen = set()
+    while stack:
+        did = stack.pop()
+        if did in seen or did not in dirs:
+            continue
+        seen.add(did)
+        size, subs = dirs[did]
+        total += size
+        stack.extend(subs)
+    return total
+
+
+@register('q5', '移除数字后最小', parse=lambda text: (lines(text)[0], int(lines(text)[1])))
+def remove_digits(num, k):
+    stack = []
+    for d in num:
+        while k and stack and stack[-1] > d:
+            stack.pop()
+            k -= 1
+        stack.append(d)
+    return ''.join(stack[:len(stack) - k])
+
+
+def parse_charset(s):
+    return [(name, int(count)) for name, count in (item.split(':') for item in s.split(',') if item)]
+
+
+@register('q6', '剩余可用字符集')
+def remaining_charset(s):
+    '''a:3,b:5,c:2@a:1,b:2 -> a:2,b:3,c:2，按全量字符集的顺序输出，用完的字符不输出'''
+    full, used = s.split('@')
+    if not used:
+        return full + '@'
+    used = dict(parse_charset(used))
+    return ','.join('{}:{}'.format(name, count - used.get(name, 0))
+                    for name, count in parse_charset(full) if count - used.get(name, 0) > 0)
+
+
+def runs(s):
+    return [(int(n), c) for n, c in re.findall(r'(\d+)(\D)', s)]
+
+
+@register('q7', '误码率', parse=lambda text: tuple(lines(text)[:2]))
+def bit_error_rate(a, b):
+    '''按段比较两个游程编码的字符串，不展开，长度上亿也只和压缩后的长度有关'''
+    ra, rb = runs(a), runs(b)
+    i = j = errors = total = 0
+    na, ca = ra[0] if ra else (0, '')
+    nb, cb = rb[0] if rb else (0, '')
+    while i < len(ra) and j < len(rb):
+        step = min(na, nb)
+        if ca != cb:
+            errors += step
+        total += step
+        na -= step
+        nb -= step
+        if not na:
+            i += 1
+            if i < len(ra):
+                na, ca = ra[i]
+        if not nb:
+            j += 1
+            if j < len(rb):
+                nb, cb = rb[j]
+    return '{}/{}'.format(errors, total)
+
+
+@register('q8', '无相同字符的元素长度乘积最大值', parse=lambda text: (lines(text)[0].split(','),))
+def max_product(words):
+    masks = [(sum(1 << (ord(c) - 97) for c in set(w)), len(w)) for w in words]
+    best = 0
+    for i, (mi, li) in enumerate(masks):
+        for mj, lj in masks[i + 1:]:
+            if not mi & mj and li * lj > best:
+                best = li * lj
+    return best
+
+
+@register('q9', '外观数列', parse=lambda text: (int(lines(text)[0]),))
+def look_and_say(n):
+    s = '1'
+    for i in range(n):
+        s = ''.join(str(len(list(group))) + d for d, group in groupby(s))
+    return s
+
+
+@register('q10', '循环移位后的矩阵最大值', parse=lambda text: (
+    [ints(row, ',') for row in lines(text)[1:int(lines(text)[0]) + 1]],))
+def max_rotated_sum(matrix):
+    '''每行循环移位到二进制值最大，再把各行的值相加'''
+    total = 0
+    for row in matrix:
+        bits = ''.join(map(str, row))
+        total += max(int(bits[i:] + bits[:i], 2) for i in range(len(bits)))
+    return total
+
+
+@register('q11', '虚拟 IPv4 地址转整数')
+def virtual_ip(s):
+    parts = s.split('#')
+    if len(parts) != 4 or any(not p.isdigit() or str(int(p)) != p for p in parts):
+        return 'invalid IP'
+    values = [int(p) for p in parts]
+    if not 1 <= values[0] <= 128 or any(v > 255 for v in values[1:]):
+        return 'invalid IP'
+    return (values[0] << 24) | (values[1] << 16) | (values[2] << 8) | values[3]
+
+
+def play_round(strength, ids):
+    '''相邻两两比赛，返回 (胜者列表, 负者列表)，轮空的直接晋级'''
+    winners, losers = [], []
+    for i in range(0, len(ids) - 1, 2):
+        a, b = ids[i], ids[i + 1]
+        # 实力大的胜，实力相同编号小的胜；ids 按编号递增，所以 a 的编号更小
+        win, lose = (a, b) if strength[a] >= strength[b] else (b, a)
+        winners.append(win)
+        losers.append(lose)
+    if len(ids) % 2:
+        winners.append(ids[-1])
+    return winners, losers
+
+
+@register('q12', '冠亚季军', parse=lambda text: (ints(lines(text)[0]),), format=format_spaced)
+def podium(strength):
+    ids = list(range(len(strength)))
+    while len(ids) > 4:
+        ids, losers = play_round(strength, ids)
+    semi, semi_losers = play_round(strength, ids)
+    final, final_losers = play_round(strength, semi)
+    if len(semi_losers) > 1:
+        third = play_round(strength, semi_losers)[0][0]
+    else:
+        third = semi_losers[0]
+    return [final[0], final_losers[0], third]
+
+
+@register('q13', 'A 赢 B 的最大分数', parse=lambda text: (ints(lines(text)[1]), ints(lines(text)[2])))
+def max_score(a, b):
+    '''田忌赛马：最快的能赢就用最快的赢，否则用最慢的去换掉对方最快的'''
+    a, b = sorted(a), sorted(b)
+    a_lo, a_hi, b_lo, b_hi = 0, len(a) - 1, 0, len(b) - 1
+    score = 0
+    while a_lo <= a_hi:
+        if a[a_hi] > b[b_hi]:
+            score += 1
+            a_hi -= 1
+            b_hi -= 1
+        elif a[a_lo] > b[b_lo]:
+            score += 1
+            a_lo += 1
+            b_lo += 1
+        else:
+            if a[a_lo] < b[b_hi]:
+                score -= 1
+            a_lo += 1
+            b_hi -= 1
+    return score
+
+
+@register('q14', '各列最大值中的最小值', parse=lambda text: (json.loads(lines(text)[0]),))
+def min_of_column_max(matrix):
+    if not matrix or not matrix[0]:
+        return 0
+    return min(max(column) for column in zip(*matrix))
+
+
+def parse_heights(text):
+    try:
+        return (ints(lines(text)[0]),)
+    except ValueError:
+        return (None,)
+
+
+@register('q15', '小朋友高矮排队', parse=parse_heights, format=lambda result: format_spaced(result) if result else '[]')
+def zigzag(heights):
+    '''偶数位是“高”，奇数位是“矮”，相邻两个不满足时交换，移动距离最小；输入不合法时返回空列表'''
+    if not heights:
+        return []
+    heights = list(heights)
+    for i in range(len(heights) - 1):
+        if (i % 2 == 0) == (heights[i] < heights[i + 1]):
+            heights[i], heights[i + 1] = heights[i + 1], heights[i]
+    return heights
+
+
+def parse_messages(text):
+    rows = lines(text)
+    n, m = ints(rows[0])
+    return n, m, [tuple(ints(row)) for row in rows[1:m + 1]]
+
+
+@register('q16', '是否是一个团队', parse=parse_messages)
+def team_messages(n, m, messages):
+    if not 1 <= n <= 100000 or not 1 <= m <= 100000:
+        return 'NULL'
+    parent = list(range(n + 1))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    result = []
+    for a, b, c in messages:
+        if not (1 <= a <= n and 1 <= b <= n) or c not in (0, 1):
+            result.append('da pian zi')
+        elif c == 0:
+            parent[find(a)] = find(b)
+        else:
+            result.append('we are a team' if find(a) == find(b) else 'we are not a team')
+    return result
+
+
+CHAIN_CARDS = ['3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
+
+
+@register('q17', '对手可能的最长顺子', parse=lambda text: tuple(lines(text)[:2]))
+def longest_chain(hand, played):
+    '''每种牌 4 张，减去自己手上的和已经出过的，剩下的牌里最长的顺子，长度相同取牌面大的'''
+    left = {card: 4 for card in CHAIN_CARDS}
+    for card in hand.split('-') + played.split('-'):
+        if card in left:
+            left[card] -= 1
+    best = None
+    start = 0
+    for end in range(len(CHAIN_CARDS) + 1):
+        if end == len(CHAIN_CARDS) or left[CHAIN_CARDS[end]] <= 0:
+            if end - start >= 5 and (best is None or end - start >= best[1] - best[0]):
+                best = (start, end)
+            start = end + 1
+    return '-'.join(CHAIN_CARDS[best[0]:best[1]]) if best else 'NO-CHAIN'
+
+
+@register('q18', '选牌的最高总分', parse=lambda text: (ints(lines(text)[0], ','),))
+def max_card_score(values):
+    '''score[i]：第 i 轮结束时的最高分，选这一轮加上牌面，不选还原到三轮前'''
+    score = []
+    for i, v in enumerate(values):
+        take = (score[i - 1] if i else 0) + v
+        skip = score[i - 3] if i >= 3 else 0
+        score.append(max(take, skip))
+    return score[-1]
+
+
+def wall_layers(blocks, width):
+    '''每层一块长度为 width 的积木或两块拼成 width，能用完所有积木时返回层数，否则返回 0'''
+    lo, hi = 0, len(blocks) - 1
+    layers = 0
+    while lo <= hi:
+        if blocks[hi] == width:
+            hi -= 1
+        elif lo < hi and blocks[lo] + blocks[hi] == width:
+            lo += 1
+            hi -= 1
+        else:
+            return 0
+        layers += 1
+    return layers
+
+
+@register('q19', '积木叠墙的最大层数', parse=lambda text: (ints(lines(text)[0]),))
+def max_wall_layers(blocks):
+    '''最长的积木要么单独一层，要么和最短的拼成一层，所以层宽只有这两种可能'''
+    blocks = sorted(blocks)
+    layers = max(wall_layers(blocks, blocks[-1]), wall_layers(blocks, blocks[0] + blocks[-1]))
+    return layers or -1
+
+
+@register('q20', '三个矩形的相交面积', parse=lambda text: ([tuple(ints(row)) for row in lines(text)[:3]],))
+def intersection_area(rects):
+    '''rects：(左上角 x, 左上角 y, 宽, 高)，y 轴向上'''
+    width = min(x + w for x, y, w, h in rects) - max(x for x, y, w, h in rects)
+    height = min(y for x, y, w, h in rects) - max(y - h for x, y, w, h in rects)
+    return max(width, 0) * max(height, 0)
+
+
+@register('q21', '找出所有顺子', parse=lambda text: (lines(text)[0].split(),))
+def find_chains(cards):
+    '''从最小的牌开始尽量往后接，够 5 张就作为一个顺子取出，按第一张牌从小到大输出'''
+    left = [cards.count(card) for card in CHAIN_CARDS]
+    chains = []
+    for start in range(len(CHAIN_CARDS)):
+        while left[start]:
+            end = start
+            while end < len(CHAIN_CARDS) and left[end]:
+                end += 1
+            if end - start < 5:
+                break
+            for i in range(start, end):
+                left[i] -= 1
+            chains.append(CHAIN_CARDS[start:end])
+    return chains or 'No'
+
+
+NARCISSISTIC = {153, 370, 371, 407}
+
+
+@register('q22', '分割成水仙花数')
+def split_narcissistic(s):
+    '''ways[i]：前 i 个字符的分割方式数（超过 1 种按 2 算），parts[i]：唯一分割时的子串数'''
+    prefix = [0]
+    for ch in s:
+        prefix.append(prefix[-1] + ord(ch))
+    ways = [1] + [0] * len(s)
+    parts = [0] * (len(s) + 1)
+    for i in range(1, len(s) + 1):
+        for j in range(i):
+            if ways[j] and prefix[i] - prefix[j] in NARCISSISTIC:
+                ways[i] = min(2, ways[i] + ways[j])
+                parts[i] = parts[j] + 1
+    if not ways[-1]:
+        return 0
+    return -1 if ways[-1] > 1 else parts[-1]
+
+
+@register('q23', '跳格子的最高分数', parse=lambda text: (ints(lines(text)[0]),))
+def max_jump_score(nums):
+    '''不能跳相邻的格子：打家劫舍'''
+    take = skip = 0
+    for v in nums:
+        take, skip = skip + v, max(take, skip)
+    return max(take, skip)
+
+
+@register('q24', '蛋糕和礼物的购买方案', parse=lambda text: (
+    ints(lines(text)[0], ','), ints(lines(text)[1], ','), int(lines(text)[2])))
+def purchase_plans(cakes, gifts, budget):
+    cakes, gifts = sorted(cakes), sorted(gifts)
+    count = 0
+    j = len(gifts)
+    for cake in cakes:
+        while j and cake + gifts[j - 1] > budget:
+            j -= 1
+        count += j
+    return count
+
+
+@register('q25', '内存池分配', parse=lambda text: tuple(lines(text)[:2]))
+def allocate_memory(pool, requests):
+    '''每次分配不小于申请量的最小粒度，分不到时为 false'''
+    sizes = []
+    for item in pool.split(','):
+        size, count = item.split(':')
+        sizes.extend([int(size)] * int(count))
+    sizes.sort()
+    result = []
+    for request in ints(requests, ','):
+        i = bisect_left(sizes, request)
+        if i < len(sizes):
+            sizes.pop(i)
+            result.append('true')
+        else:
+            result.append('false')
+    return ','.join(result)
+
+
+@register('q26', '需要打开的监控器', parse=lambda text: ([ints(row) for row in lines(text)[1:ints(lines(text)[0])[0] + 1]],))
+def monitors(grid):
+    '''本车位或者上下左右有车的车位都要打开'''
+    m, n = len(grid), len(grid[0])
+    return sum(1 for i in range(m) for j in range(n)
+               if any(0 <= x < m and 0 <= y < n and grid[x][y]
+                      for x, y in ((i, j), (i - 1, j), (i + 1, j), (i, j - 1), (i, j + 1))))
+
+
+@register('q27', '带可选段的 strstr', parse=lambda text: tuple(lines(text)[:2]))
+def fuzzy_strstr(haystack, needle):
+    '''[] 里的字符任选一个，其余字符按原样匹配，返回第一次匹配的位置，找不到返回 -1'''
+    pattern = ''.join('[{}]'.format(re.escape(group)) if group else re.escape(ch)
+                      for group, ch in re.findall(r'\[([^\]]*)\]|(.)', needle))
+    m = re.search(pattern, haystack)
+    return m.start() if m else -1
+
+
+@register('q28', '最后一个单词的长度', parse=lambda text: (text.strip(),))
+def last_word_length(s):
+    return len(s.split(' ')[-1])
+
+
+@register('q29', '字符个数统计', parse=lambda text: tuple(lines(text)[:2]))
+def count_char(s, ch):
+    return s.lower().count(ch.lower())
+
+
+@register('q30', '明明的随机数', parse=lambda text: ([int(x) for x in lines(text)[1:int(lines(text)[0]) + 1]],))
+def unique_sorted(values):
+    return sorted(set(values))
+
+
+@register('q31', '字符串分隔', parse=lambda text: (lines(text),))
+def split_by_8(strings):
+    return ['{:0<8}'.format(s[i:i + 8]) for s in strings for i in range(0, len(s), 8)]
+
+
+@register('q32', '进制转换')
+def hex_to_int(s):
+    return int(s, 16)
+
+
+@register('q33', '质数因子', parse=lambda text: (int(lines(text)[0]),), format=format_spaced)
+def prime_factors(n):
+    factors = []
+    d = 2
+    while d * d <= n:
+        while n % d == 0:
+            factors.append(d)
+            n //= d
+        d += 1
+    if n > 1:
+        factors.append(n)
+    return factors
+
+
+def parse_pairs(text):
+    rows = lines(text)
+    return ([tuple(ints(row)) for row in rows[1:int(rows[0]) + 1]],)
+
+
+@register('q34', '合并表记录', parse=parse_pairs)
+def merge_records(pairs):
+    merged = {}
+    for key, value in pairs:
+        merged[key] = merged.get(key, 0) + value
+    return [(key, merged[key]) for key in sorted(merged)]
+
+
+@register('q35', '提取不重复的整数')
+def reverse_unique_digits(s):
+    return ''.join(dict.fromkeys(s[::-1]))
+
+
+@register('q36', '字符个数统计（不同字符）')
+def distinct_chars(s):
+    return len({c for c in s if ord(c) < 128})
+
+
+@register('q37', '数字颠倒')
+def reverse_number(s):
+    return s[::-1]
+
+
+@register('q38', '句子逆序', parse=lambda text: (text.strip(),))
+def reverse_sentence(s):
+    return ' '.join(s.split(' ')[::-1])
+
+
+@register('q39', '字符串排序', parse=lambda text: (lines(text)[1:int(lines(text)[0]) + 1],))
+def sort_strings(strings):
+    return sorted(strings)
+
+
+@register('q40', '求int型正整数在内存中存储时1的个数', parse=lambda text: (int(lines(text)[0]),))
+def count_ones(n):
+    return bin(n).count('1')
+
+
+def parse_goods(text):
+    rows = lines(text)
+    budget, m = ints(rows[0])[:2]
+    # 样例里有的行后面带着作者的备注数字，只取前三个
+    return budget, [tuple(ints(row)[:3]) for row in rows[1:m + 1]]
+
+
+@register('q41', '购物单', parse=parse_goods)
+def shopping_list(budget, goods):
+    '''goods：(价格, 重要度, 主件编号)，主件编号为 0 表示主件；买附件必须先买主件，每个主件最多两个附件
+
+    分组背包：每个主件连同附件只有“主件”“主件+附件1”“主件+附件2”“主件+两个附件”几种买法。
+    '''
+    unit = 10  # 价格都是 10 的整数倍
+    groups = {}
+    for i, (v, p, q) in enumerate(goods, 1):
+        if q == 0:
+            groups.setdefault(i, [None, []])[0] = (v // unit, v * p)
+        else:
+            groups.setdefault(q, [None, []])[1].append((v // unit, v * p))
+    best = [0] * (budget // unit + 1)
+    for main, extras in groups.values():
+        if main is None:
+            continue
+        options = [main]
+        for k in range(1, len(extras) + 1):
+            for chosen in combinations(extras, k):
+                options.append((main[0] + sum(c[0] for c in chosen), main[1] + sum(c[1] for c in chosen)))
+        for cost in range(len(best) - 1, -1, -1):
+            for price, value in options:
+                if price <= cost:
+                    best[cost] = max(best[cost], best[cost - price] + value)
+    return best[-1]
+
+
+@register('q42', '坐标移动')
+def move_point(s):
+    moves = {'A': (-1, 0), 'D': (1, 0), 'W': (0, 1), 'S': (0, -1)}
+    x = y = 0
+    for step in s.split(';'):
+        if re.fullmatch(r'[ADWS]\d{1,2}', step):
+            dx, dy = moves[step[0]]
+            x += dx * int(step[1:])
+            y += dy * int(step[1:])
+    return '{},{}'.format(x, y)
+
+
+def ip_octets(s):
+    parts = s.split('.')
+    if len(parts) != 4 or not all(p.isdigit() and int(p) <= 255 for p in parts):
+        return None
+    return [int(p) for p in parts]
+
+
+def valid_mask(octets):
+    bits = '{:032b}'.format(sum(o << (24 - 8 * i) for i, o in enumerate(octets)))
+    return '01' not in bits and '1' in bits and '0' in bits
+
+
+@register('q43', '识别有效的 IP 地址和掩码', parse=lambda text: (lines(text),), format=format_spaced)
+def classify_ips(rows):
+    '''返回 A、B、C、D、E 类、错误 IP 或掩码、私有 IP 的个数；0.*.*.* 和 127.*.*.* 不计数'''
+    counts = [0] * 7
+    for row in rows:
+        ip, mask = row.split('~')
+        ip, mask = ip_octets(ip), ip_octets(mask)
+        if ip and ip[0] in (0, 127):
+            continue
+        if not ip or not mask or not valid_mask(mask):
+            counts[5] += 1
+            continue
+        for k, upper in enumerate((126, 191, 223, 239, 255)):
+            if ip[0] <= upper:
+                counts[k] += 1
+                break
+        if ip[0] == 10 or ip[0] == 172 and 16 <= ip[1] <= 31 or ip[0] == 192 and ip[1] == 168:
+            counts[6] += 1
+    return counts
+
+
+@register('q44', '简单错误记录', parse=lambda text: ([re.search(r'(\S+)\s+(\d+)', row).groups() for row in lines(text)],))
+def error_records(records):
+    '''records：(带路径的文件名, 行号)；文件名取最后 16 个字符，按第一次出现的顺序输出最后 8 条'''
+    counts = {}
+    for path, line in records:
+        key = (path.split('\\')[-1][-16:], line)
+        counts[key] = counts.get(key, 0) + 1
+    return ['{} {} {}'.format(name, line, count) for (name, line), count in list(counts.items())[-8:]]
+
+
+def password_ok(s):
+    kinds = sum(1 for test in (str.isupper, str.islower, str.isdigit) if any(test(c) for c in s))
+    kinds += any(not c.isalnum() and not c.isspace() for c in s)
+    repeated = any(s[i:i + 3] in s[i + 1:] for i in range(len(s) - 2))
+    return len(s) > 8 and kinds >= 3 and not repeated
+
+
+@register('q45', '密码验证合格程序', parse=lambda text: (lines(text),))
+def check_passwords(passwords):
+    return ['OK' if password_ok(s) else 'NG' for s in passwords]
+
+
+KEYPAD = {c: str(d) for d, letters in enumerate(('', '', 'abc', 'def', 'ghi', 'jkl', 'mno', 'pqrs', 'tuv', 'wxyz'))
+          for c in letters}
+
+
+@register('q46', '简单密码')
+def simple_password(s):
+    return ''.join(KEYPAD[c] if c in KEYPAD else chr((ord(c.lower()) - 96) % 26 + 97) if c.isupper() else c
+                   for c in s)
+
+
+@register('q47', '汽水瓶', parse=lambda text: ([int(row) for row in lines(text)],))
+def soda_bottles(counts):
+    '''两个空瓶借一个就能换一瓶，所以能喝 n // 2 瓶，0 表示输入结束'''
+    result = []
+    for n in counts:
+        if n == 0:
+            break
+        result.append(n // 2)
+    return result
+
+
+@register('q48', '删除出现次数最少的字符')
+def drop_rarest(s):
+    least = min(s.count(c) for c in s)
+    return ''.join(c for c in s if s.count(c) > least)
+
+
+@register('q49', '数据分类处理', parse=lambda text: (ints(lines(text)[0])[1:], ints(lines(text)[1])[1:]),
+          format=format_spaced)
+def classify_data(values, rules):
+    result = []
+    for rule in sorted(set(rules)):
+        found = [(i, v) for i, v in enumerate(values) if str(rule) in str(v)]
+        if found:
+            result += [rule, len(found)]
+            for i, v in found:
+                result += [i, v]
+    return [len(result)] + result
+
+
+@register('q50', '字符串排序（只排字母）', parse=lambda text: (text.strip('\n'),))
+def sort_letters(s):
+    '''字母按字母表顺序排列（不区分大小写、保持原顺序），其它字符位置不变'''
+    letters = iter(sorted((c for c in s if c.isalpha()), key=str.lower))
+    return ''.join(next(letters) if c.isalpha() else c for c in s)
+
+
+def parse_brothers(text):
+    tokens = lines(text)[0].split()
+    n = int(tokens[0])
+    return tokens[1:n + 1], tokens[n + 1], int(tokens[n + 2])
+
+
+@register('q51', '查找兄弟单词', parse=parse_brothers)
+def brother_words(words, x, k):
+    brothers = sorted(w for w in words if w != x and sorted(w) == sorted(x))
+    return [len(brothers)] + brothers[k - 1:k]
+
+
+def is_prime(n):
+    if n < 2:
+        return False
+    d = 2
+    while d * d <= n:
+        if n % d == 0:
+            return False
+        d += 1
+    return True
+
+
+@register('q52', '素数伴侣', parse=lambda text: (ints(lines(text)[1]),))
+def prime_partners(values):
+    '''和为素数的两个数一奇一偶，奇数和偶数之间做二分图最大匹配（匈牙利算法）'''
+    odds = [v for v in values if v % 2]
+    evens = [v for v in values if not v % 2]
+    edges = [[j for j, e in enumerate(evens) if is_prime(o + e)] for o in odds]
+    match = [-1] * len(evens)  # match[j]：和第 j 个偶数配对的奇数下标
+
+    def augment(i, seen):
+        for j in edges[i]:
+            if j not in seen:
+                seen.add(j)
+                if match[j] < 0 or augment(match[j], seen):
+                    match[j] = i
+                    return True
+        return False
+
+    return sum(1 for i in range(len(odds)) if augment(i, set()))
+
+
+def shift_char(c, step):
+    '''字母移一位并变换大小写，数字加一，step 为 -1 时是解密'''
+    if c.isdigit():
+        return str((int(c) + step) % 10)
+    if c.isalpha():
+        base = 'a' if c.isupper() else 'A'
+        return chr((ord(c.lower()) - ord('a') + step) % 26 + ord(base))
+    return c
+
+
+@register('q53', '字符串加解密', parse=lambda text: tuple(lines(text)[:2]))
+def encrypt_decrypt(plain, cipher):
+    return [''.join(shift_char(c, 1) for c in plain), ''.join(shift_char(c, -1) for c in cipher)]
+
+
+@register('q54', '字符串合并处理', parse=lambda text: (''.join(lines(text)[0].split()),))
+def merge_and_convert(s):
+    chars = list(s)
+    chars[::2] = sorted(chars[::2])
+    chars[1::2] = sorted(chars[1::2])
+    result = []
+    for c in chars:
+        if c in '0123456789abcdefABCDEF':
+            result.append('{:X}'.format(int('{:04b}'.format(int(c, 16))[::-1], 2)))
+        else:
+            result.append(c)
+    return ''.join(result)
+
+
+@register('q55', '单词倒排', parse=lambda text: (text.strip('\n'),))
+def reverse_words(s):
+    return ' '.join(re.findall(r'[A-Za-z]+', s)[::-1])
+
+
+@register('q56', '最长回文子串长度')
+def longest_palindrome(s):
+    '''中心扩展'''
+    best = 0
+    for center in range(2 * len(s) - 1):
+        lo, hi = center // 2, (center + 1) // 2
+        while lo >= 0 and hi < len(s) and s[lo] == s[hi]:
+            lo -= 1
+            hi += 1
+        best = max(best, hi - lo - 1)
+    return best
+
+
+@register('q57', '整数与 IP 地址间的转换', parse=lambda text: (lines(text)[0], int(lines(text)[1])))
+def convert_ip(ip, number):
+    value = 0
+    for part in ip.split('.'):
+        value = value << 8 | int(part)
+    return [value, '.'.join(str(number >> shift & 255) for shift in (24, 16, 8, 0))]
+
+
+@register('q58', '按 ASCII 码排序字符')
+def sort_chars(s):
+    return ''.join(sorted(s))
+
+
+@register('q59', '字符串加密', parse=lambda text: tuple(lines(text)[:2]))
+def keyword_cipher(key, s):
+    alphabet = 'abcdefghijklmnopqrstuvwxyz'
+    table = dict(zip(alphabet, dict.fromkeys(key.lower() + alphabet)))
+    return ''.join(table[c.lower()].upper() if c.isupper() else table.get(c, c) for c in s)
+
+
+@register('q60', '统计每个月兔子的总数', parse=lambda text: (int(lines(text)[0]),))
+def rabbits(n):
+    a, b = 1, 1
+    for i in range(n - 1):
+        a, b = b, a + b
+    return a
+
+
+@register('q61', '求小球落地 5 次后所经历的路程和第 5 次反弹的高度', parse=lambda text: (int(lines(text)[0]),))
+def bouncing_ball(height, times=5):
+    distance = height
+    for i in range(1, times):
+        distance += 2 * height / 2 ** i
+    return [distance, height / 2 ** times]
+
+
+@register('q62', '判断两个 IP 是否属于同一子网', parse=lambda text: (
+    [lines(text)[i:i + 3] for i in range(0, len(lines(text)) - 2, 3)],))
+def same_subnet(groups):
+    '''每组是 (掩码, IP1, IP2)：格式非法为 1，同一子网为 0，否则为 2'''
+    result = []
+    for mask, ip1, ip2 in groups:
+        mask, ip1, ip2 = ip_octets(mask), ip_octets(ip1), ip_octets(ip2)
+        if not (mask and ip1 and ip2) or '01' in ''.join('{:08b}'.format(o) for o in mask):
+            result.append(1)
+        else:
+            result.append(0 if all(m & a == m & b for m, a, b in zip(mask, ip1, ip2)) else 2)
+    return result
+
+
+def increasing_lengths(values):
+    '''lengths[i]：以 values[i] 结尾的最长严格递增子序列长度'''
+    tails = []
+    lengths = []
+    for v in values:
+        i = bisect_left(tails, v)
+        if i == len(tails):
+            tails.append(v)
+        else:
+            tails[i] = v
+        lengths.append(i + 1)
+    return lengths
+
+
+@register('q63', '合唱队', parse=lambda text: (ints(lines(text)[1]),))
+def chorus(heights):
+    left = increasing_lengths(heights)
+    right = increasing_lengths(heights[::-1])[::-1]
+    return len(heights) - max(a + b - 1 for a, b in zip(left, right))
+
+
+@register('q64', '输入一行字符，分别统计出包含英文字母、空格、数字和其它字符的个数', parse=lambda text: (text.rstrip('\n'),))
+def count_kinds(s):
+    letters = sum(1 for c in s if c.isalpha())
+    spaces = s.count(' ')
+    digits = sum(1 for c in s if c.isdigit())
+    return [letters, spaces, digits, len(s) - letters - spaces - digits]
+
+
+@register('q65', '称砝码', parse=lambda text: (ints(lines(text)[1]), ints(lines(text)[2])))
+def weigh(weights, counts):
+    totals = {0}
+    for w, n in zip(weights, counts):
+        totals = {t + w * k for t in totals for k in range(n + 1)}
+    return len(totals)
+
+
+ONES = ('zero one two three four five six seven eight nine ten eleven twelve thirteen fourteen fifteen '
+        'sixteen seventeen eighteen nineteen').split()
+TENS = ('', '', 'twenty', 'thirty', 'forty', 'fifty', 'sixty', 'seventy', 'eighty', 'ninety')
+
+
+def below_thousand(n):
+    words = []
+    if n >= 100:
+        words += [ONES[n // 100], 'hundred']
+        n %= 100
+        if n:
+            words.append('and')
+    if n >= 20:
+        words.append(TENS[n // 10])
+        n %= 10
+    if n or not words:
+        words.append(ONES[n])
+    return words
+
+
+@register('q66', '学英语', parse=lambda text: (int(lines(text)[0]),))
+def number_to_english(n):
+    words = []
+    for unit, name in ((10 ** 9, 'billion'), (10 ** 6, 'million'), (10 ** 3, 'thousand'), (1, '')):
+        if n >= unit:
+            words += below_thousand(n // unit) + ([name] if name else [])
+            n %= unit
+    return ' '.join(words)
+
+
+def parse_matrix_rows(text):
+    rows = lines(text)
+    m = ints(rows[0])[0]
+    return ([ints(row) for row in rows[1:m + 1]],)
+
+
+@register('q67', '迷宫问题', parse=parse_matrix_rows)
+def maze_path(grid):
+    '''广度优先搜索左上角到右下角的最短路径'''
+    m, n = len(grid), len(grid[0])
+    prev = {(0, 0): None}
+    queue = deque([(0, 0)])
+    while queue:
+        i, j = queue.popleft()
+        if (i, j) == (m - 1, n - 1):
+            break
+        for x, y in ((i + 1, j), (i - 1, j), (i, j + 1), (i, j - 1)):
+            if 0 <= x < m and 0 <= y < n and not grid[x][y] and (x, y) not in prev:
+                prev[(x, y)] = (i, j)
+                queue.append((x, y))
+    path = []
+    cell = (m - 1, n - 1)
+    while cell:
+        path.append('({},{})'.format(*cell))
+        cell = prev[cell]
+    return path[::-1]
+
+
+@register('q68', '数独', parse=lambda text: ([ints(row) for row in lines(text)[:9]],))
+def sudoku(board):
+    '''回溯，每次填候选数最少的空格'''
+    board = [list(row) for row in board]
+    rows = [set(row) for row in board]
+    cols = [{board[i][j] for i in range(9)} for j in range(9)]
+    boxes = [{board[i][j] for i in range(b // 3 * 3, b // 3 * 3 + 3) for j in range(b % 3 * 3, b % 3 * 3 + 3)}
+             for b in range(9)]
+    empty = [(i, j) for i in range(9) for j in range(9) if not board[i][j]]
+
+    def candidates(i, j):
+        return set(range(1, 10)) - rows[i] - cols[j] - boxes[i // 3 * 3 + j // 3]
+
+    def solve():
+        if not empty:
+            return True
+        i, j = min(empty, key=lambda cell: len(candidates(*cell)))
+        empty.remove((i, j))
+        for v in candidates(i, j):
+            board[i][j] = v
+            rows[i].add(v)
+            cols[j].add(v)
+            boxes[i // 3 * 3 + j // 3].add(v)
+            if solve():
+                return True
+            rows[i].discard(v)
+            cols[j].discard(v)
+            boxes[i // 3 * 3 + j // 3].discard(v)
+        board[i][j] = 0
+        empty.append((i, j))
+        return False
+
+    solve()
+    return board
+
+
+@register('q69', '名字的漂亮度', parse=lambda text: (lines(text)[1:int(lines(text)[0]) + 1],))
+def name_beauty(names):
+    '''出现次数多的字母给大的漂亮度'''
+    result = []
+    for name in names:
+        counts = sorted((name.lower().count(c) for c in set(name.lower())), reverse=True)
+        result.append(sum(count * (26 - i) for i, count in enumerate(counts)))
+    return result
+
+
+@register('q70', '截取字符串', parse=lambda text: (lines(text)[0], int(lines(text)[1])))
+def truncate(s, k):
+    return s[:k]
+
+
+@register('q71', '从单向链表中删除指定值的节点', parse=lambda text: (ints(lines(text)[0]),), format=format_spaced)
+def delete_node(tokens):
+    '''tokens：节点数、头节点、若干 (新值, 插在它后面的值)、要删除的值'''
+    n, head = tokens[0], tokens[1]
+    nodes = [head]
+    for i in range(n - 1):
+        value, after = tokens[2 + 2 * i], tokens[3 + 2 * i]
+        nodes.insert(nodes.index(after) + 1, value)
+    target = tokens[2 * n]
+    return [v for v in nodes if v != target]
+
+
+def tokenize(expression):
+    return re.findall(r'\d+|[-+*/()]', expression.translate(str.maketrans('[]{}', '()()')))
+
+
+@register('q72', '四则运算')
+def calculate(expression):
+    '''递归下降：expr := term (+|- term)*，term := factor (*|/ factor)*，factor := -factor | 数字 | (expr)'''
+    tokens = tokenize(expression)
+    pos = 0
+
+    def factor():
+        nonlocal pos
+        token = tokens[pos]
+        pos += 1
+        if token == '-':
+            return -factor()
+        if token == '(':
+            value = expr()
+            pos += 1  # 右括号
+            return value
+        return int(token)
+
+    def term():
+        nonlocal pos
+        value = factor()
+        while pos < len(tokens) and tokens[pos] in '*/':
+            op = tokens[pos]
+            pos += 1
+            right = factor()
+            value = value * right if op == '*' else int(value / right)
+        return value
+
+    def expr():
+        nonlocal pos
+        value = term()
+        while pos < len(tokens) and tokens[pos] in '+-':
+            op = tokens[pos]
+            pos += 1
+            value = value + term() if op == '+' else value - term()
+        return value
+
+    return expr()
+
+
+@register('q73', '输出单向链表中倒数第 k 个结点', parse=lambda text: (ints(lines(text)[1]), int(lines(text)[2])))
+def kth_from_end(values, k):
+    return values[-k] if 0 < k <= len(values) else 0
+
+
+@register('q74', '杨辉三角的变形', parse=lambda text: (int(lines(text)[0]),))
+def first_even_position(n):
+    '''第 1、2 行没有偶数，之后按 n 除以 4 的余数循环：2、3、2、4'''
+    if n <= 2:
+        return -1
+    return (2, 3, 2, 4)[(n - 3) % 4]
+
+
+@register('q75', '挑 7', parse=lambda text: (int(lines(text)[0]),))
+def count_sevens(n):
+    return sum(1 for i in range(1, n + 1) if i % 7 == 0 or '7' in str(i))
+
+
+@register('q76', '完全数计算', parse=lambda text: (int(lines(text)[0]),))
+def count_perfect(n):
+    sums = [0] * (n + 1)
+    for d in range(1, n // 2 + 1):
+        for multiple in range(2 * d, n + 1, d):
+            sums[multiple] += d
+    return sum(1 for i in range(2, n + 1) if sums[i] == i)
+
+
+@register('q77', '找出字符串中第一个只出现一次的字符')
+def first_unique(s):
+    for c in s:
+        if s.count(c) == 1:
+            return c
+    return -1
+
+
+@register('q78', '查找组成一个偶数最接近的两个素数', parse=lambda text: (int(lines(text)[0]),))
+def closest_primes(n):
+    for a in range(n // 2, 1, -1):
+        if is_prime(a) and is_prime(n - a):
+            return [a, n - a]
+
+
+@register('q79', '放苹果', parse=lambda text: tuple(ints(lines(text)[0])))
+def put_apples(m, n):
+    '''f(m, n) = f(m, n - 1)（有空盘子） + f(m - n, n)（每个盘子至少一个）'''
+    if m == 0 or n == 1:
+        return 1
+    if n > m:
+        return put_apples(m, m)
+    return put_apples(m, n - 1) + put_apples(m - n, n)
+
+
+@register('q80', 'DNA 序列', parse=lambda text: (lines(text)[0], int(lines(text)[1])))
+def best_gc_window(dna, n):
+    best = count = sum(1 for c in dna[:n] if c in 'GC')
+    start = 0
+    for i in range(n, len(dna)):
+        count += (dna[i] in 'GC') - (dna[i - n] in 'GC')
+        if count > best:
+            best, start = count, i - n + 1
+    return dna[start:start + n]
+
+
+@register('q81', 'MP3 光标位置', parse=lambda text: (int(lines(text)[0]), lines(text)[1]))
+def mp3_cursor(n, commands, page=4):
+    '''返回 (当前屏幕显示的歌曲, 光标所在歌曲)，歌曲从 1 开始编号'''
+    cursor, top = 1, 1
+    for command in commands:
+        if command == 'U':
+            cursor = n if cursor == 1 else cursor - 1
+        else:
+            cursor = 1 if cursor == n else cursor + 1
+        if cursor < top:
+            top = cursor
+        elif cursor >= top + page:
+            top = cursor - page + 1
+    shown = list(range(top, min(top + page, n + 1)))
+    return [shown, cursor]
+
+
+@register('q82', '最长公共子串', parse=lambda text: tuple(lines(text)[:2]))
+def longest_common_substring(a, b):
+    if len(a) > len(b):
+        a, b = b, a
+    best = ''
+    for i in range(len(a)):
+        # 只找比当前结果更长的子串
+        j = i + len(best) + 1
+        while j <= len(a) and a[i:j] in b:
+            best = a[i:j]
+            j += 1
+    return best
+
+
+COMMANDS = [('reset',), ('reset', 'board'), ('board', 'add'), ('board', 'delete'),
+            ('reboot', 'backplane'), ('backplane', 'abort')]
+COMMAND_RESULTS = ['reset what', 'board fault', 'where to add', 'no board at all', 'impossible', 'install first']
+
+
+@register('q83', '配置文件恢复', parse=lambda text: (lines(text),))
+def match_commands(rows):
+    '''每个关键字按前缀匹配，关键字个数相同且只匹配到一条命令时才执行'''
+    result = []
+    for row in rows:
+        words = row.split()
+        found = [i for i, command in enumerate(COMMANDS)
+                 if len(command) == len(words) and all(key.startswith(w) for key, w in zip(command, words))]
+        result.append(COMMAND_RESULTS[found[0]] if len(found) == 1 else 'unknown command')
+    return result
+
+
+def parse_grades(text):
+    rows = lines(text)
+    n, order = int(rows[0]), int(rows[1])
+    return [(row.split()[0], int(row.split()[1])) for row in rows[2:n + 2]], order
+
+
+@register('q84', '成绩排序', parse=parse_grades)
+def sort_grades(students, order):
+    '''order 为 0 时从高到低，为 1 时从低到高，成绩相同的保持输入顺序'''
+    ranked = sorted(students, key=lambda st: st[1] if order else -st[1])
+    return ['{} {}'.format(name, grade) for name, grade in ranked]
+
+
+def parse_matrices(text):
+    rows = lines(text)
+    x, y = int(rows[0]), int(rows[1])
+    return [ints(row) for row in rows[3:3 + x]], [ints(row) for row in rows[3 + x:3 + x + y]]
+
+
+@register('q85', '矩阵乘法', parse=parse_matrices)
+def matrix_multiply(a, b):
+    return [[sum(x * y for x, y in zip(row, column)) for column in zip(*b)] for row in a]
+
+
+@register('q86', '字符串通配符', parse=lambda text: tuple(lines(text)[:2]), format=lambda result: str(result).lower())
+def wildcard_match(pattern, s):
+    '''* 匹配 0 个以上、? 匹配 1 个字母或数字，其余字符不区分大小写地原样匹配'''
+    pattern, s = pattern.lower(), s.lower()
+    # matched[j]：模式的当前前缀能否匹配 s[:j]
+    matched = [True] + [False] * len(s)
+    for p in pattern:
+        if p == '*':
+            for j in range(1, len(s) + 1):
+                matched[j] = matched[j] or matched[j - 1] and s[j - 1].isalnum()
+        else:
+            for j in range(len(s), 0, -1):
+                matched[j] = matched[j - 1] and (s[j - 1] == p or p == '?' and s[j - 1].isalnum())
+            matched[0] = False
+    return matched[-1]
+
+
+@register('q87', '百钱买百鸡问题', parse=lambda text: ())
+def hundred_chickens():
+    return [(cock, hen, 100 - cock - hen) for cock in range(0, 21) for hen in range(0, 34)
+            if 5 * cock + 3 * hen + (100 - cock - hen) / 3 == 100]
+
+
+@register('q88', '计算日期到天数转换', parse=lambda text: tuple(ints(lines(text)[0])))
+def day_of_year(year, month, day):
+    days = [31, 29 if year % 4 == 0 and year % 100 != 0 or year % 400 == 0 else 28,
+            31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+    return sum(days[:month - 1]) + day
+
+
+@register('q89', '参数解析', parse=lambda text: (lines(text)[0],))
+def parse_arguments(command):
+    args = [quoted or plain for quoted, plain in re.findall(r'"([^"]*)"|(\S+)', command)]
+    return [len(args)] + args
+
+
+@register('q90', '公共子串计算', parse=lambda text: tuple(lines(text)[:2]))
+def common_substring_length(a, b):
+    return len(longest_common_substring(a, b))
+
+
+@register('q91', '尼科彻斯定理', parse=lambda text: (int(lines(text)[0]),))
+def nicomachus(m):
+    first = m * m - m + 1
+    return '+'.join(str(first + 2 * i) for i in range(m))
+
+
+@register('q92', '火车进站', parse=lambda text: (ints(lines(text)[1]),))
+def train_orders(trains):
+    '''按入站顺序，每一步可以进一辆车或者出站台上最后进的车，返回所有出站顺序，按字典序'''
+    orders = []
+
+    def visit(i, station, out):
+        if i == len(trains) and not station:
+            orders.append(out)
+        if i < len(trains):
+            visit(i + 1, station + [trains[i]], out)
+        if station:
+            visit(i, station[:-1], out + [station[-1]])
+
+    visit(0, [], [])
+    return sorted(orders)
+
+
+@register('q93', '合并表记录去重排序', parse=lambda text: (ints(lines(text)[1]), ints(lines(text)[3])))
+def merge_unique(a, b):
+    return ''.join(str(v) for v in sorted(set(a) | set(b)))
+
+
+def egyptian(a, b):
+    '''a/b 拆成埃及分数，返回各项分母
+
+    分子减一能整除分母时，拆成 (a - 1)/b + 1/b 两项；否则取不超过 a/b 的最大埃及分数 1/c，余下的约分后继续拆。
+    '''
+    denominators = []
+    while a != 1:
+        if a > 2 and b % (a - 1) == 0:
+            denominators.append(b // (a - 1))
+            a = 1
+        else:
+            c = b // a + 1
+            denominators.append(c)
+            a, b = a * c - b, b * c
+            g = gcd(a, b)
+            a, b = a // g, b // g
+    return denominators + [b]
+
+
+@register('q94', '将真分数分解为埃及分数', parse=lambda text: ([tuple(ints(row, '/')) for row in lines(text)],))
+def egyptian_fractions(fractions):
+    return ['+'.join('1/{}'.format(d) for d in egyptian(a, b)) for a, b in fractions]
+
+
+register('q95', '最长回文子串')(longest_palindrome)
+
+
+@register('q96', '求最大连续 bit 数', parse=lambda text: (int(lines(text)[0]),))
+def longest_ones(n):
+    return max(len(run) for run in bin(n)[2:].split('0'))
+
+
+@register('q97', '密码强度等级')
+def password_level(s):
+    letters = [c for c in s if c.isalpha()]
+    digits = sum(1 for c in s if c.isdigit())
+    symbols = sum(1 for c in s if 0x21 <= ord(c) <= 0x7e and not c.isalnum())
+    mixed = any(c.islower() for c in letters) and any(c.isupper() for c in letters)
+    score = 5 if len(s) <= 4 else 10 if len(s) <= 7 else 25
+    score += 20 if mixed else 10 if letters else 0
+    score += 20 if digits > 1 else 10 if digits else 0
+    score += 25 if symbols > 1 else 10 if symbols else 0
+    if letters and digits and symbols:
+        score += 5 if mixed else 3
+    elif letters and digits:
+        score += 2
+    for limit, level in ((90, 'VERY_SECURE'), (80, 'SECURE'), (70, 'VERY_STRONG'), (60, 'STRONG'),
+                         (50, 'AVERAGE'), (25, 'WEAK')):
+        if score >= limit:
+            return level
+    return 'VERY_WEAK'
@@ -1,37 +1,56 @@
-# import requests
-# import unittest
-#
-# class GetEventListTest(unittest.TestCase):
-# 	'''查询发布会接口测试'''
-#
-# 	def setUp(self):
-# 		self.url = 'http://127.0.0.1:8000/api/get_event_list/'
-#
-# 	def test_get_event_null(self):
-# 		'''发布会id为空'''
-# 		r = requests.get(self.url,params={'eid':''})
-# 		result = r.json()
-# 		self.assertEqual(result['status'],10021)
-# 		self.assertEqual(result['message'],'parameter error')
-#
-# 	def test_get_event_error(self):
-# 		'''发布会id不存在'''
-# 		r = requests.get(self.url,params={'eid':'901'})
-# 		result = r.json()
-# 		self.assertEqual(result['status'],10022)
-# 		self.assertEqual(result['message'],'query result is empty')
-#
-# 	def test_get_event_success(self):
-# 		'''发布会id为1，查询成功'''
-# 		r = requests.get(self.url,params={'eid':'1'})
-# 		result = r.json()
-# 		self.assertEqual(result['status'],200)
-# 		self.assertEqual(result['message'],'success')
-# 		self.assertEqual(result['data']['name'],'小米11发布会')
-# 		self.assertEqual(result['data']['address'],'深圳体育中心')
-#
-# if __name__ == '__main__':
-#     unittest.main()
+import os
+import unittest
+
+from apiRunner import CASSETTE_ENV, EVENT_API_ENV, get_session, event_api_url
+
+class GetEventListTest(unittest.TestCase):
+	'''查询发布会接口测试'''
+
+	@classmethod
+	def setUpClass(cls):
+		# 没有设置 EVENT_API_URL（也没有回放磁带）时在本进程起 eventStub 桩服务，不依赖外部服务；
+		# apiRunner 单独运行每个方法，不走这里，由它的 --stub 参数负责
+		cls.server = None
+		if EVENT_API_ENV not in os.environ and CASSETTE_ENV not in os.environ:
+			from eventStub import start_stub
+			cls.server, os.environ[EVENT_API_ENV] = start_stub()
+
+	@classmethod
+	def tearDownClass(cls):
+		if cls.server is not None:
+			cls.server.shutdown()
+			cls.server.server_close()
+			del os.environ[EVENT_API_ENV]
+
+	def setUp(self):
+		# 地址默认是 http://127.0.0.1:8000/api/get_event_list/，可用环境变量 EVENT_API_URL 修改
+		self.url = event_api_url()
+		# 共用连接池，不再每个用例新建连接
+		self.session = get_session()
+
+	def test_get_event_null(self):
+		'''发布会id为空'''
+		r = self.session.get(self.url,params={'eid':''})
+		result = r.json()
+		self.assertEqual(result['status'],10021)
+		self.assertEqual(result['message'],'parameter error')
+
+	def test_get_event_error(self):
+		'''发布会id不存在'''
+		r = self.session.get(self.url,params={'eid':'901'})
+		result = r.json()
+		self.assertEqual(result['status'],10022)
+		self.assertEqual(result['message'],'query result is empty')
+
+	def test_get_event_success(self):
+		'''发布会id为1，查询成功'''
+		r = self.session.get(self.url,params={'eid':'1'})
+		result = r.json()
+		self.assertEqual(result['status'],200)
+		self.assertEqual(result['message'],'success')
+		self.assertEqual(result['data']['name'],'小米11发布会')
+		self.assertEqual(result['data']['address'],'深圳体育中心')
+
 import random
 
 # plus = lambda x,y : (x or 0) + (y or 0)
@@ -136,11 +155,13 @@ import random
 #         break
 
 
-a = 2
-match a:
-    case 1:
-        print('aaaa')
-    case 2:
-        print('bbb')
+# a = 2
+# match a:
+#     case 1:
+#         print('aaaa')
+#     case 2:
+#         print('bbb')
 
 
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+from caseCorpus import QUOTES, SKIPPED_EXAMPLES, corpus_cases, run_case
+from solutions import SOLUTIONS
+
+
+class CaseCorpusTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.cases = list(corpus_cases())
+
+    def test_no_string_delimiters(self):
+        for case in self.cases:
+            for quote in QUOTES:
+                self.assertNotIn(quote, case['stdin'], case['id'])
+                self.assertNotIn(quote, case['expected'], case['id'])
+
+    def test_unnumbered_problems_are_split(self):
+        # "# 80" 之后三引号里的三道题各自成段，不并入 hw80
+        counts = {}
+        for case in self.cases:
+            counts[case['problem_id']] = counts.get(case['problem_id'], 0) + 1
+        self.assertEqual(counts['hw80'], 3)
+        self.assertEqual((counts['hw80-s1'], counts['hw80-s2'], counts['hw80-s3']), (3, 1, 4))
+        self.assertEqual(counts['hw82'], 1)
+
+    def test_registered_solutions(self):
+        for case in self.cases:
+            if case['problem_id'] in SOLUTIONS and case['id'] not in SKIPPED_EXAMPLES:
+                case_id, status, elapsed, actual = run_case(case)
+                self.assertEqual(status, 'ok', '{} -> {!r}, expected {!r}'.format(case_id, actual, case['expected']))
+
+    def test_skipped_examples_exist(self):
+        ids = {case['id'] for case in self.cases}
+        for case_id in SKIPPED_EXAMPLES:
+            self.assertIn(case_id, ids)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import re
+import unittest
+
+from solutions import get
+
+
+class CountGeeseTest(unittest.TestCase):
+    '''q2 题面没有样例，用例写在这里'''
+
+    def setUp(self):
+        self.solution = get('q2')
+
+    def test_complete_calls(self):
+        self.assertEqual(self.solution('quack'), 1)
+        self.assertEqual(self.solution('quackquack'), 1)
+        self.assertEqual(self.solution('qquuaacckk'), 2)
+        self.assertEqual(self.solution('quqauckack'), 2)
+
+    def test_unfinished_calls_do_not_count(self):
+        # 没叫完的大雁不占用同时在叫的数量
+        self.assertEqual(self.solution('qqqqquack'), 1)
+        self.assertEqual(self.solution('qquack'), 1)
+        self.assertEqual(self.solution('quackqua'), 1)
+
+    def test_no_goose(self):
+        self.assertEqual(self.solution('qua'), -1)
+        self.assertEqual(self.solution('kcauq'), -1)
+        self.assertEqual(self.solution('quacx'), -1)
+
+    def test_run(self):
+        self.assertEqual(self.solution.run('qquuaacckk\n'), '2')
+
+
+class OpenSyllablesTest(unittest.TestCase):
+    '''q3 题面没有样例'''
+
+    def test_reversed_words(self):
+        self.assertEqual(get('q3')('ekam a ekac'), 2)
+        self.assertEqual(get('q3')('!ekam a ekekac'), 2)
+
+
+class NumberToEnglishTest(unittest.TestCase):
+    '''q66 题面只有文字说明，没有输入输出样例'''
+
+    def test_examples(self):
+        solution = get('q66')
+        self.assertEqual(solution(22), 'twenty two')
+        self.assertEqual(solution(100), 'one hundred')
+        self.assertEqual(solution(145), 'one hundred and forty five')
+        self.assertEqual(solution(1234), 'one thousand two hundred and thirty four')
+        self.assertEqual(solution(8088), 'eight thousand eighty eight')
+        self.assertEqual(solution(486669), 'four hundred and eighty six thousand six hundred and sixty nine')
+        self.assertEqual(solution(1652510), 'one million six hundred and fifty two thousand five hundred and ten')
+
+
+class ImageOnlyProblemsTest(unittest.TestCase):
+    '''hw3 和 hw83 只有 HUAWEIquestion.md 里的图片，没有 HUAWEIanswer.py 里的段落，样例抄在这里'''
+
+    def test_arrangements(self):
+        self.assertEqual(get('hw3').run('aab 2\n'), '2')
+        self.assertEqual(get('hw3').run('abc 2\n'), '6')
+        self.assertEqual(get('hw3')('aB', 1), 0)
+
+    def test_manpower(self):
+        self.assertEqual(get('hw83').run('3\n3 5 3 4\n'), '6')
+        self.assertEqual(get('hw83')(4, [3, 5, 3, 4]), 5)
+
+
+class Poker24Test(unittest.TestCase):
+    '''hw80-s3 输出任意一个算式都对，按从左到右、整数除法算出的值检查'''
+
+    def evaluate(self, expression):
+        tokens = re.findall(r'[+\-*/]|[^+\-*/]+', expression)
+        values = {'A': 1, 'J': 11, 'Q': 12, 'K': 13}
+        result = values.get(tokens[0]) or int(tokens[0])
+        for op, card in zip(tokens[1::2], tokens[2::2]):
+            value = values.get(card) or int(card)
+            result = {'+': result + value, '-': result - value, '*': result * value,
+                      '/': int(result / value)}[op]
+        return result
+
+    def test_expression_is_24(self):
+        expression = get('hw80-s3').run('4 2 K A\n')
+        self.assertEqual(sorted(re.split(r'[+\-*/]', expression)), ['2', '4', 'A', 'K'])
+        self.assertEqual(self.evaluate(expression), 24)
+
+    def test_no_answer(self):
+        self.assertEqual(get('hw80-s3').run('A A A A\n'), 'NONE')
+        self.assertEqual(get('hw80-s3').run('B 5 joker 4\n'), 'ERROR')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import random
+import unittest
+
+from classifyTree import ClassifyTree, ID_COL, DEL_COL, PARENT_COL, ROOT_ID
+from treeUpdater import apply_changes, apply_row, check_consistency
+
+
+def make_row(node_id, parent_id, deleted=0):
+    row = [None] * (PARENT_COL + 1)
+    row[ID_COL] = node_id
+    row[DEL_COL] = deleted
+    row[PARENT_COL] = parent_id
+    return tuple(row)
+
+
+def random_tree(rnd, n=200):
+    current = {}
+    for i in range(n):
+        current['n%d' % i] = make_row('n%d' % i, rnd.choice([ROOT_ID] + list(current)))
+    return current
+
+
+class TreeUpdaterTest(unittest.TestCase):
+    '''增量更新后的树必须和全量重建的树一致'''
+
+    def run_deltas(self, seed, steps=2000, delete_ratio=0.2):
+        # 随机插入（新 id）、移动（已有 id 换父节点，可能成环）、软删除，每一步都和全量重建对比
+        rnd = random.Random(seed)
+        current = random_tree(rnd)
+        tree = ClassifyTree(current.values())
+        for step in range(steps):
+            node_id = 'n%d' % rnd.randrange(len(current) + 60)
+            parent_id = rnd.choice([ROOT_ID] + list(current))
+            row = make_row(node_id, parent_id, 1 if rnd.random() < delete_ratio else 0)
+            current[node_id] = row
+            apply_row(tree, row)
+            problems = check_consistency(tree, current.values())
+            self.assertEqual(problems, [], 'seed {} step {}: {}'.format(seed, step, problems))
+
+    def test_random_deltas(self):
+        for seed in range(3):
+            self.run_deltas(seed)
+
+    def test_delete_heavy(self):
+        self.run_deltas(10, steps=500, delete_ratio=0.6)
+
+    def test_batch_changes(self):
+        rnd = random.Random(1)
+        current = random_tree(rnd)
+        tree = ClassifyTree(current.values())
+        batch = []
+        for i in range(300):
+            node_id = 'n%d' % rnd.randrange(260)
+            row = make_row(node_id, rnd.choice([ROOT_ID] + list(current)), 1 if rnd.random() < 0.2 else 0)
+            current[node_id] = row
+            batch.append(row)
+        apply_changes(tree, batch)
+        self.assertEqual(check_consistency(tree, current.values()), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
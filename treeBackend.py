@@ -0,0 +1,142 @@
+import sqlite3
+from abc import ABC, abstractmethod
+
+from classifyTree import ClassifyTree
+
+# 基准和回归测试用的分类表结构，列位置与 classifyTree 中的 ID_COL / DEL_COL / PARENT_COL 对应
+CLASSIFY_TABLE = 't_modelrule_model_classify'
+CLASSIFY_COLUMNS = (
+    ('fid', 'varchar(64) primary key'),
+    ('ftenant_id', 'varchar(64) not null'),
+    ('fcode', 'varchar(64)'),
+    ('fname', 'varchar(255)'),
+    ('fsort', 'integer'),
+    ('fcreate_by', 'varchar(64)'),
+    ('fcreate_time', 'timestamp'),
+    ('fupdate_by', 'varchar(64)'),
+    ('updated_at', 'timestamp'),
+    ('fremark', 'varchar(255)'),
+    ('fdelete_flag', 'integer not null default 0'),
+    ('flevel', 'integer'),
+    ('fparent_id', 'varchar(64)'),
+)
+
+
+class Backend(ABC):
+    '''分类表的存储后端接口，加载、变更探测和批量写入；少实现了抽象方法的后端在创建时就报 TypeError
+
+    可以直接接到缓存上：TreeCache(loader=backend.load_tree, probe=backend.fetch_fingerprint)
+    '''
+
+    @abstractmethod
+    def fetch_classify(self, tenant_id):
+        '''返回租户的全部行，列顺序同 CLASSIFY_COLUMNS'''
+
+    @abstractmethod
+    def fetch_fingerprint(self, tenant_id):
+        '''返回能反映租户数据是否变化的值，如 (行数, 最大更新时间)'''
+
+    @abstractmethod
+    def create_schema(self):
+        '''建分类表和租户索引，已存在时不报错'''
+
+    @abstractmethod
+    def insert_rows(self, rows):
+        '''批量写入行，返回写入的行数'''
+
+    def close(self):
+        pass
+
+    def load_tree(self, tenant_id):
+        return ClassifyTree(self.fetch_classify(tenant_id))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class PostgresBackend(Backend):
+    '''走 pgsqlPool 的连接池和预编译语句'''
+
+    def __init__(self, **config):
+        from pgsqlPool import get_pool
+        get_pool(**config)
+
+    def fetch_classify(self, tenant_id):
+        from pgsqlPool import fetch_classify
+        return fetch_classify(tenant_id)[0]
+
+    def fetch_fingerprint(self, tenant_id):
+        from pgsqlPool import fetch_fingerprint
+        return fetch_fingerprint(tenant_id)
+
+    def create_schema(self):
+        '''只用于本地基准库，线上库已经有这张表'''
+        from pgsqlPool import get_conn
+        with get_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute("create table if not exists " + CLASSIFY_TABLE + " (" +
+                            ', '.join(name + ' ' + kind for name, kind in CLASSIFY_COLUMNS) + ")")
+                cur.execute("create index if not exists idx_classify_tenant on " + CLASSIFY_TABLE + " (ftenant_id)")
+            conn.commit()
+
+    def insert_rows(self, rows):
+        '''用 COPY 批量写入'''
+        from leafCopy import RecordStream
+        from pgsqlPool import get_conn
+        stream = RecordStream(('' if value is None else value for value in row) for row in rows)
+        with get_conn() as conn:
+            with conn.cursor() as cur:
+                cur.copy_expert("copy " + CLASSIFY_TABLE + " (" + ', '.join(name for name, kind in CLASSIFY_COLUMNS) +
+                                ") from stdin with (format csv, null '')", stream)
+            conn.commit()
+        return stream.rows
+
+    def close(self):
+        from pgsqlPool import close_pool
+        close_pool()
+
+
+class SqliteBackend(Backend):
+    '''本地 SQLite 替身，不需要网络，用于基准和回归测试'''
+
+    def __init__(self, path=':memory:'):
+        self.conn = sqlite3.connect(path)
+
+    def fetch_classify(self, tenant_id):
+        return self.conn.execute("select * from " + CLASSIFY_TABLE + " where ftenant_id = ?", (tenant_id,)).fetchall()
+
+    def fetch_fingerprint(self, tenant_id):
+        return self.conn.execute("select count(*), max(updated_at) from " + CLASSIFY_TABLE + " where ftenant_id = ?",
+                                 (tenant_id,)).fetchone()
+
+    def create_schema(self):
+        self.conn.execute("create table if not exists " + CLASSIFY_TABLE + " (" +
+                          ', '.join(name + ' ' + kind for name, kind in CLASSIFY_COLUMNS) + ")")
+        self.conn.execute("create index if not exists idx_classify_tenant on " + CLASSIFY_TABLE + " (ftenant_id)")
+        self.conn.commit()
+
+    def insert_rows(self, rows):
+        cur = self.conn.executemany("insert into " + CLASSIFY_TABLE + " values (" +
+                                    ', '.join('?' * len(CLASSIFY_COLUMNS)) + ")", rows)
+        self.conn.commit()
+        return cur.rowcount
+
+    def close(self):
+        self.conn.close()
+
+
+def open_backend(url):
+    '''按地址打开后端：sqlite:路径 或 postgres[:host]'''
+    kind, _, rest = url.partition(':')
+    if kind == 'sqlite':
+        return SqliteBackend(rest or ':memory:')
+    if kind in ('postgres', 'postgresql', 'pg'):
+        from pgsqlPool import DB_CONFIG
+        config = dict(DB_CONFIG)
+        if rest:
+            config['host'] = rest
+        return PostgresBackend(**config)
+    raise ValueError('unknown backend: ' + url)
@@ -0,0 +1,145 @@
+import select
+import threading
+import time
+from collections import OrderedDict
+
+from classifyTree import ClassifyTree
+
+# 数据库端需要的触发器，分类表有变动时以租户 id 作为 payload 发通知：
+#   create function notify_classify() returns trigger as $$
+#   begin
+#       perform pg_notify('classify_changed', coalesce(new.ftenant_id, old.ftenant_id));
+#       return null;
+#   end $$ language plpgsql;
+#   create trigger classify_changed after insert or update or delete on t_modelrule_model_classify
+#       for each row execute function notify_classify();
+NOTIFY_CHANNEL = 'classify_changed'
+
+
+def load_tree(tenant_id):
+    '''默认的加载函数：查库并构建分类树'''
+    from pgsqlPool import fetch_classify
+    rows, description = fetch_classify(tenant_id)
+    return ClassifyTree(rows)
+
+
+def probe_tree(tenant_id):
+    '''默认的变更探测函数'''
+    from pgsqlPool import fetch_fingerprint
+    return fetch_fingerprint(tenant_id)
+
+
+class TreeCache:
+    '''按租户缓存构建好的分类树，LRU 淘汰 + TTL 过期 + 变更探测失效
+
+    ttl 是缓存条目的最长寿命，决定数据最多陈旧多久；
+    probe_interval 内的重复请求直接命中，超过后先跑一次廉价探测，指纹没变就继续用。
+    probe 为 None 时只靠 TTL 和显式 invalidate（例如 LISTEN/NOTIFY）失效。
+    '''
+
+    def __init__(self, loader=load_tree, probe=probe_tree, maxsize=128, ttl=300.0, probe_interval=1.0):
+        self.loader = loader
+        self.probe = probe
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.probe_interval = probe_interval
+        self._entries = OrderedDict()  # 租户 id -> [tree, fingerprint, loaded_at, checked_at]
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, tenant_id):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(tenant_id)
+            if entry is not None and now - entry[2] < self.ttl:
+                if self.probe is None or now - entry[3] < self.probe_interval:
+                    self._entries.move_to_end(tenant_id)
+                    self.hits += 1
+                    return entry[0]
+        # 探测和加载都在锁外进行，避免一个租户的慢查询阻塞其它租户
+        if entry is not None and now - entry[2] < self.ttl:
+            fingerprint = self.probe(tenant_id)
+            if fingerprint == entry[1]:
+                with self._lock:
+                    entry[3] = now
+                    if tenant_id in self._entries:
+                        self._entries.move_to_end(tenant_id)
+                    self.hits += 1
+                return entry[0]
+        return self._load(tenant_id)
+
+    def _load(self, tenant_id):
+        # 先取指纹再加载，加载期间发生的变更会在下一次探测时被发现
+        fingerprint = self.probe(tenant_id) if self.probe is not None else None
+        tree = self.loader(tenant_id)
+        now = time.monotonic()
+        with self._lock:
+            self.misses += 1
+            self._entries[tenant_id] = [tree, fingerprint, now, now]
+            self._entries.move_to_end(tenant_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return tree
+
+    def leaves(self, tenant_id):
+        return self.get(tenant_id).leaves
+
+    def invalidate(self, tenant_id=None):
+        '''使某个租户的缓存失效，不传则清空全部'''
+        with self._lock:
+            if tenant_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(tenant_id, None)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, tenant_id):
+        return tenant_id in self._entries
+
+
+def listen_invalidations(cache, channel=NOTIFY_CHANNEL, config=None, stop=None):
+    '''在后台线程里 LISTEN 通知频道，收到租户 id 就让对应缓存失效
+
+    用独立连接（不占连接池），stop 是 threading.Event，设置后线程退出。
+    '''
+    import psycopg2
+    import psycopg2.extensions
+    from pgsqlPool import DB_CONFIG
+
+    stop = stop or threading.Event()
+    conn = psycopg2.connect(**(config or DB_CONFIG))
+    conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+    conn.cursor().execute("listen " + channel)
+
+    def run():
+        try:
+            while not stop.is_set():
+                if select.select([conn], [], [], 1.0) == ([], [], []):
+                    continue
+                conn.poll()
+                while conn.notifies:
+                    notify = conn.notifies.pop(0)
+                    cache.invalidate(notify.payload or None)
+        finally:
+            conn.close()
+
+    thread = threading.Thread(target=run, name='classify-listen', daemon=True)
+    thread.start()
+    return thread, stop
+
+
+if __name__ == '__main__':
+    import sys
+    tenant = sys.argv[1] if len(sys.argv) > 1 else '39ca61dfcfac43dca8d5cdb0f1cfddf1'
+    cache = TreeCache()
+    t0 = time.perf_counter()
+    cache.leaves(tenant)
+    print('cold: {:.3f}ms'.format((time.perf_counter() - t0) * 1000))
+    n = 100000
+    t0 = time.perf_counter()
+    for i in range(n):
+        cache.leaves(tenant)
+    print('hot : {:.3f}us'.format((time.perf_counter() - t0) * 1e6 / n))
@@ -0,0 +1,78 @@
+import random
+import sys
+import time
+from collections import deque
+from itertools import islice
+
+from classifyTree import ClassifyTree, ROOT_ID
+from treeBackend import CLASSIFY_COLUMNS, open_backend
+
+
+def generate_rows(tenant_id, n, fanout=8, depth=6, delete_ratio=0.0, seed=0):
+    '''按层生成一棵合成分类树的行，列顺序同 CLASSIFY_COLUMNS
+
+    每个节点的子节点数在 1..fanout 之间随机，超过 depth 层或凑够 n 个节点就停止；
+    delete_ratio 比例的节点打上软删除标志。逐行生成，10^7 个节点也不会先堆在内存里。
+    '''
+    rnd = random.Random(seed)
+    width = len(CLASSIFY_COLUMNS)
+    queue = deque([(ROOT_ID, 0)])
+    count = 0
+    while queue and count < n:
+        parent_id, level = queue.popleft()
+        if level >= depth:
+            continue
+        for i in range(rnd.randint(1, fanout)):
+            if count >= n:
+                break
+            node_id = '{}-{:x}'.format(tenant_id[:8], count)
+            row = [None] * width
+            row[0] = node_id
+            row[1] = tenant_id
+            row[3] = node_id
+            row[4] = i
+            row[8] = '2024-01-01 00:00:00'
+            row[10] = 1 if rnd.random() < delete_ratio else 0
+            row[11] = level + 1
+            row[12] = parent_id
+            count += 1
+            yield tuple(row)
+            queue.append((node_id, level + 1))
+
+
+def populate(backend, tenant_id, n, fanout=8, depth=6, delete_ratio=0.0, seed=0, batch=100000):
+    '''生成并分批写入后端，返回写入的行数'''
+    backend.create_schema()
+    rows = generate_rows(tenant_id, n, fanout, depth, delete_ratio, seed)
+    total = 0
+    while True:
+        chunk = list(islice(rows, batch))
+        if not chunk:
+            return total
+        backend.insert_rows(chunk)
+        total += len(chunk)
+
+
+if __name__ == '__main__':
+    # python treeGenerator.py [节点数] [fanout] [depth] [删除比例] [后端，默认 sqlite:内存]
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    fanout = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    depth = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+    ratio = float(sys.argv[4]) if len(sys.argv) > 4 else 0.01
+    tenant = 'bench0000000000000000000000000000'
+    with open_backend(sys.argv[5] if len(sys.argv) > 5 else 'sqlite:') as backend:
+        t0 = time.perf_counter()
+        populate(backend, tenant, n, fanout, depth, ratio)
+        t1 = time.perf_counter()
+        rows = backend.fetch_classify(tenant)
+        t2 = time.perf_counter()
+        tree = ClassifyTree(rows)
+        t3 = time.perf_counter()
+        tree.changed()
+        leaves = tree.leaves
+        t4 = time.perf_counter()
+        tree.index
+        t5 = time.perf_counter()
+    print('rows={} nodes={} leaves={}'.format(len(rows), len(tree), len(leaves)))
+    print('populate {:.3f}s  load {:.3f}s  build {:.3f}s  leaves {:.3f}s  index {:.3f}s'.format(
+        t1 - t0, t2 - t1, t3 - t2, t4 - t3, t5 - t4))
@@ -0,0 +1,105 @@
+import json
+import sys
+import time
+from contextlib import contextmanager
+
+import psycopg2
+
+from classifyTree import ClassifyTree
+from pgsqlPool import DB_CONFIG, CLASSIFY_SQL, TENANT_ID
+
+
+class Profiler:
+    '''按阶段记录墙钟时间、行数和字节数，最后输出 JSON 报告'''
+
+    def __init__(self):
+        self.phases = []
+        self.extra = {}
+
+    @contextmanager
+    def phase(self, name):
+        record = {'phase': name, 'ms': 0.0, 'rows': None, 'bytes': None}
+        t0 = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['ms'] = round((time.perf_counter() - t0) * 1000, 3)
+            self.phases.append(record)
+
+    def report(self):
+        total = sum(record['ms'] for record in self.phases)
+        return dict(self.extra, phases=self.phases, total_ms=round(total, 3))
+
+    def dumps(self):
+        return json.dumps(self.report(), ensure_ascii=False, default=str)
+
+
+def rows_bytes(rows):
+    '''结果集的大致文本字节数，只在开启统计时计算'''
+    return sum(len(str(value)) for row in rows for value in row if value is not None)
+
+
+def explain(cur, tenant_id):
+    '''EXPLAIN (ANALYZE, BUFFERS) 分类查询，返回 JSON 格式的执行计划
+
+    计划里 ftenant_id 或父节点列上出现 Seq Scan 就说明缺索引。
+    '''
+    cur.execute("explain (analyze, buffers, format json) " + CLASSIFY_SQL, (tenant_id,))
+    plan = cur.fetchone()[0]
+    return plan if not isinstance(plan, str) else json.loads(plan)
+
+
+def seq_scans(plan):
+    '''从执行计划里找出顺序扫描的表'''
+    found = []
+    stack = [node['Plan'] for node in plan]
+    while stack:
+        node = stack.pop()
+        if node.get('Node Type') == 'Seq Scan':
+            found.append({'table': node.get('Relation Name'), 'filter': node.get('Filter'),
+                          'rows_removed': node.get('Rows Removed by Filter')})
+        stack.extend(node.get('Plans', ()))
+    return found
+
+
+def profile_load(tenant_id=TENANT_ID, capture_explain=False, config=None):
+    '''分阶段执行一次完整的加载：连接、执行、取数、建树、找叶子、数据检查'''
+    profiler = Profiler()
+    profiler.extra['tenant_id'] = tenant_id
+    with profiler.phase('connect'):
+        conn = psycopg2.connect(**(config or DB_CONFIG))
+    try:
+        cur = conn.cursor()
+        # psycopg2 在 execute 时就把整个结果集收到客户端，所以这一阶段包括服务端执行和网络传输，
+        # fetch 阶段是把结果转换成 Python 对象
+        with profiler.phase('execute+transfer'):
+            cur.execute(CLASSIFY_SQL, (tenant_id,))
+        with profiler.phase('fetch') as record:
+            rows = cur.fetchall()
+            record['rows'] = len(rows)
+        record['bytes'] = rows_bytes(rows)
+        if capture_explain:
+            with profiler.phase('explain') as record:
+                plan = explain(cur, tenant_id)
+            profiler.extra['explain'] = plan
+            profiler.extra['seq_scans'] = seq_scans(plan)
+        conn.rollback()
+    finally:
+        conn.close()
+    # build 包括建子节点索引和第一次找叶子，leaves 阶段清掉缓存单独再测一次遍历
+    with profiler.phase('build') as record:
+        tree = ClassifyTree(rows)
+        record['rows'] = len(tree)
+    with profiler.phase('leaves') as record:
+        tree.changed()
+        record['rows'] = len(tree.leaves)
+    with profiler.phase('diagnose') as record:
+        report = tree.diagnose()
+        record['rows'] = len(report['unreachable'])
+    return profiler
+
+
+if __name__ == '__main__':
+    # python treeProfile.py [租户id] [--explain]，输出 JSON 报告
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    print(profile_load(args[0] if args else TENANT_ID, '--explain' in sys.argv).dumps())
@@ -0,0 +1,203 @@
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+
+from classifyTree import ClassifyTree, PARENT_COL
+
+# 快照文件格式（小端）：
+#   头部  magic, version, 节点数 n, 边数 m, 叶子数 k, 指纹长度
+#   指纹  JSON 字节串，补齐到 4 字节
+#   ids   n+1 个 uint32 偏移 + UTF-8 字节串，补齐到 4 字节
+#   parent        n 个 int32，父节点下标，-1 表示没有（根或孤儿的父节点）
+#   child_offsets n+1 个 uint32，CSR 格式的子节点区间
+#   child_index   m 个 int32
+#   leaves        k 个 int32，按层序
+MAGIC = b'CLTS'
+VERSION = 1
+HEADER = struct.Struct('<4sIIIII')
+
+# 数组部分按本机字节序直接映射，只支持小端机器
+if sys.byteorder != 'little':
+    raise ImportError('treeSnapshot only supports little-endian hosts')
+
+
+def _pad(n):
+    return (4 - n % 4) % 4
+
+
+def encode_fingerprint(fingerprint):
+    '''数据库指纹 (行数, max(更新时间)) 转成可比较的字符串'''
+    if fingerprint is None:
+        return ''
+    return json.dumps([str(x) for x in fingerprint])
+
+
+def save_snapshot(tree, path, fingerprint=None):
+    '''把树保存为二进制快照，先写临时文件再替换，读者不会看到写了一半的文件'''
+    ids = [tree.root]
+    pos = {tree.root: 0}
+    for node_id in list(tree.nodes) + list(tree.children):
+        if node_id not in pos:
+            pos[node_id] = len(ids)
+            ids.append(node_id)
+
+    blob = bytearray()
+    id_offsets = array('I', [0])
+    for node_id in ids:
+        blob += str(node_id).encode('utf-8')
+        id_offsets.append(len(blob))
+
+    parent = array('i', [-1]) * len(ids)
+    for node_id, row in tree.nodes.items():
+        parent[pos[node_id]] = pos.get(row[PARENT_COL], -1)
+
+    child_offsets = array('I', [0])
+    child_index = array('i')
+    for node_id in ids:
+        child_index.extend(pos[x] for x in tree.children.get(node_id, ()))
+        child_offsets.append(len(child_index))
+    leaves = array('i', (pos[x] for x in tree.leaves))
+
+    fp = encode_fingerprint(fingerprint).encode('utf-8')
+    # 临时文件名唯一，多个 warm_start 进程同时写同一个快照时不会互相覆盖
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp',
+                               dir=os.path.dirname(path) or '.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, len(ids), len(child_index), len(leaves), len(fp)))
+            f.write(fp + b'\0' * _pad(len(fp)))
+            f.write(id_offsets.tobytes())
+            f.write(bytes(blob) + b'\0' * _pad(len(blob)))
+            for arr in (parent, child_offsets, child_index, leaves):
+                f.write(arr.tobytes())
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class TreeSnapshot:
+    '''内存映射的树快照，数组直接指向映射的页面，不做拷贝'''
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._views = []
+        try:
+            self._parse(memoryview(self._mm))
+        except Exception:
+            self.close()
+            raise
+        self._ids = None
+        self._pos = None
+
+    def _parse(self, mm):
+        self._views.append(mm)
+        magic, version, n, m, k, fp_len = HEADER.unpack_from(mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('unsupported snapshot: {} v{}'.format(magic, version))
+        offset = HEADER.size
+
+        def take(size, fmt=None):
+            # 每一段都检查是否越过文件末尾，截断的文件在这里就报错，而不是读出少一截的数组
+            nonlocal offset
+            if offset + size > len(mm):
+                raise ValueError('truncated snapshot')
+            view = mm[offset:offset + size]
+            offset += size
+            if fmt:
+                view = view.cast(fmt)
+            self._views.append(view)
+            return view
+
+        self.fingerprint = bytes(take(fp_len)).decode('utf-8')
+        take(_pad(fp_len))
+        id_offsets = take(4 * (n + 1), 'I')
+        self._id_offsets = id_offsets
+        self._blob = take(id_offsets[n])
+        take(_pad(id_offsets[n]))
+        self.parent = take(4 * n, 'i')
+        self.child_offsets = take(4 * (n + 1), 'I')
+        self.child_index = take(4 * m, 'i')
+        self.leaf_index = take(4 * k, 'i')
+        if offset != len(mm):
+            raise ValueError('snapshot has {} trailing bytes'.format(len(mm) - offset))
+
+    @property
+    def ids(self):
+        if self._ids is None:
+            blob = bytes(self._blob)
+            offsets = self._id_offsets
+            self._ids = [blob[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(len(offsets) - 1)]
+        return self._ids
+
+    def id_at(self, i):
+        '''只解码一个 id，还没解码全部 id 时用它避免 O(n) 的开销'''
+        if self._ids is not None:
+            return self._ids[i]
+        offsets = self._id_offsets
+        return bytes(self._blob[offsets[i]:offsets[i + 1]]).decode('utf-8')
+
+    @property
+    def root(self):
+        return self.id_at(0)
+
+    @property
+    def leaves(self):
+        id_at = self.id_at
+        return [id_at(i) for i in self.leaf_index]
+
+    def pos(self, node_id):
+        if self._pos is None:
+            self._pos = {x: i for i, x in enumerate(self.ids)}
+        return self._pos[node_id]
+
+    def children(self, node_id):
+        i = self.pos(node_id)
+        ids = self.ids
+        return [ids[j] for j in self.child_index[self.child_offsets[i]:self.child_offsets[i + 1]]]
+
+    def parent_of(self, node_id):
+        j = self.parent[self.pos(node_id)]
+        return self.id_at(j) if j >= 0 else None
+
+    def __len__(self):
+        return len(self.parent)
+
+    def close(self):
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._mm.close()
+
+
+def load_snapshot(path, fingerprint=None):
+    '''映射快照文件；传入当前指纹时做校验，不一致、版本不对或文件不存在都返回 None'''
+    if not os.path.exists(path):
+        return None
+    try:
+        snapshot = TreeSnapshot(path)
+    except (ValueError, TypeError, IndexError, UnicodeDecodeError, struct.error):
+        # 截断、损坏的文件都当作没有快照，由调用者重建
+        return None
+    if fingerprint is not None and snapshot.fingerprint != encode_fingerprint(fingerprint):
+        snapshot.close()
+        return None
+    return snapshot
+
+
+def warm_start(tenant_id, path=None):
+    '''工作进程启动时调用：指纹一致就直接映射快照，否则查库重建并写新快照'''
+    from pgsqlPool import fetch_classify, fetch_fingerprint
+    path = path or 'classify_{}.snap'.format(tenant_id)
+    fingerprint = fetch_fingerprint(tenant_id)
+    snapshot = load_snapshot(path, fingerprint)
+    if snapshot is None:
+        rows, description = fetch_classify(tenant_id)
+        save_snapshot(ClassifyTree(rows), path, fingerprint)
+        snapshot = load_snapshot(path)
+    return snapshot
@@ -0,0 +1,130 @@
+from classifyTree import ClassifyTree, ID_COL, DEL_COL, PARENT_COL
+
+
+def is_reachable(tree, node_id):
+    '''沿父节点链向上能否走到根，最多走 len(nodes) 步，遇到环返回 False'''
+    for i in range(len(tree.nodes) + 1):
+        if node_id == tree.root:
+            return True
+        row = tree.nodes.get(node_id)
+        if row is None:
+            return False
+        node_id = row[PARENT_COL]
+    return False
+
+
+def subtree_leaves(tree, node_id):
+    '''node_id 子树中的叶子，带 visited 集合防止环'''
+    leaves = []
+    stack = [node_id]
+    visited = set()
+    while stack:
+        x = stack.pop()
+        if x in visited:
+            continue
+        visited.add(x)
+        child_ids = tree.children.get(x)
+        if child_ids:
+            stack.extend(child_ids)
+        else:
+            leaves.append(x)
+    return leaves
+
+
+def _detach(tree, node_id, parent_id):
+    parent_reachable = is_reachable(tree, parent_id)
+    child_ids = tree.children[parent_id]
+    child_ids.remove(node_id)
+    if not child_ids:
+        del tree.children[parent_id]
+    if parent_reachable:
+        tree.leaf_set.difference_update(subtree_leaves(tree, node_id))
+        if not child_ids:
+            tree.leaf_set.add(parent_id)
+
+
+def _attach(tree, node_id, parent_id):
+    tree.children.setdefault(parent_id, []).append(node_id)
+    if is_reachable(tree, parent_id):
+        tree.leaf_set.discard(parent_id)
+        tree.leaf_set.update(subtree_leaves(tree, node_id))
+
+
+def apply_row(tree, row):
+    '''把一行的最新状态（新增、移动、修改或软删除）应用到树上，只涉及受影响的路径和子树'''
+    node_id = row[ID_COL]
+    old = tree.nodes.get(node_id)
+    old_parent = old[PARENT_COL] if old is not None else None
+    alive = row[DEL_COL] == 0
+    moved = old is None or not alive or old_parent != row[PARENT_COL]
+    if old is not None and moved:
+        _detach(tree, node_id, old_parent)
+        del tree.nodes[node_id]
+    if alive:
+        tree.nodes[node_id] = row
+        if moved:
+            _attach(tree, node_id, row[PARENT_COL])
+    if moved:
+        tree.changed()
+
+
+def apply_changes(tree, rows):
+    '''按顺序应用一批变更行，可以来自水位线查询，也可以来自变更表'''
+    for row in rows:
+        apply_row(tree, row)
+    return tree
+
+
+def check_consistency(tree, rows):
+    '''与全量重建的结果对比，返回差异描述列表，为空表示一致'''
+    rebuilt = ClassifyTree(rows, tree.root)
+    problems = []
+    if tree.nodes.keys() != rebuilt.nodes.keys():
+        problems.append('nodes differ: {}'.format(tree.nodes.keys() ^ rebuilt.nodes.keys()))
+    for parent_id in tree.children.keys() | rebuilt.children.keys():
+        if sorted(tree.children.get(parent_id, ())) != sorted(rebuilt.children.get(parent_id, ())):
+            problems.append('children of {} differ'.format(parent_id))
+    if tree.leaf_set != set(rebuilt.leaves):
+        problems.append('leaf set differs: {}'.format(tree.leaf_set ^ set(rebuilt.leaves)))
+    if set(tree.leaves) != set(rebuilt.leaves):
+        problems.append('leaves list differs')
+    return problems
+
+
+class TreeUpdater:
+    '''按 updated_at 水位线从数据库拉取变更，增量维护一个租户的分类树'''
+
+    def __init__(self, tenant_id, tree=None, since=None):
+        from pgsqlPool import fetch_classify
+        self.tenant_id = tenant_id
+        if tree is None:
+            rows, description = fetch_classify(tenant_id)
+            tree = ClassifyTree(rows)
+            since = self._max_updated(rows, description, since)
+        self.tree = tree
+        self.since = since
+
+    @staticmethod
+    def _max_updated(rows, description, since):
+        from pgsqlPool import UPDATED_COL
+        col = [d[0] for d in description].index(UPDATED_COL)
+        for row in rows:
+            if row[col] is not None and (since is None or row[col] > since):
+                since = row[col]
+        return since
+
+    def sync(self):
+        '''拉取并应用水位线之后的变更，返回应用的行数'''
+        from pgsqlPool import fetch_changes
+        if self.since is None:
+            return 0
+        rows, description = fetch_changes(self.tenant_id, self.since)
+        apply_changes(self.tree, rows)
+        self.since = self._max_updated(rows, description, self.since)
+        return len(rows)
+
+
+if __name__ == '__main__':
+    # 随机插入、移动、软删除，每一步都与全量重建对比，用例在 test_treeUpdater.py
+    import unittest
+    unittest.main(module='test_treeUpdater')